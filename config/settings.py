@@ -1,7 +1,10 @@
+import json
+import tempfile
+from importlib.util import find_spec
 from pathlib import Path
 
 import dj_database_url
-from decouple import config
+from decouple import Csv, config
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = config('SECRET_KEY', default=None)
@@ -10,6 +13,14 @@ AUTH_SECRET_WORD = config('AUTH_SECRET_WORD', default=None)
 LETTERBOXD_USERNAME = config('LETTERBOXD_USERNAME', default=None)
 DEBUG = config('DEBUG', default=True, cast=bool)
 WSGI_APPLICATION = 'config.wsgi.application'
+ASGI_APPLICATION = 'config.asgi.application'
+
+# gunicorn serves config.wsgi with gthread workers; GUNICORN_WORKER_CLASS=uvicorn_worker.UvicornWorker
+# serves config.asgi instead (gunicorn.conf.py, `pip install .[asgi]`). Under ASGI each request's sync code
+# runs in a thread of its own, so a connection kept for CONN_MAX_AGE is never reused: connections close
+# after every request and DB_POOL reuses them.
+GUNICORN_WORKER_CLASS = config('GUNICORN_WORKER_CLASS', default='gthread')
+SERVE_ASGI = 'uvicorn' in GUNICORN_WORKER_CLASS.lower()
 
 ALLOWED_HOSTS = ['*']
 
@@ -25,9 +36,12 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'movies.middleware.CompressionMiddleware',
+    'movies.middleware.QueryBudgetMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'movies.middleware.JWTAuthenticationMiddleware',
+    'movies.middleware.ProfilingMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
@@ -60,6 +74,224 @@ DATABASES = {
     )
 }
 
+# Optional read replica for MovieRepository list reads (see movies/db_router.py).
+# After a write, a profile reads from the primary for REPLICA_STICKY_SECONDS; the marker
+# lives in REPLICA_STICKY_CACHE, which must be shared by every worker (DatabaseCache or Redis).
+REPLICA_URL = config('SUPABASE_REPLICA_URL', default='')
+REPLICA_READS = config('REPLICA_READS', default=bool(REPLICA_URL), cast=bool)
+if REPLICA_URL:
+    DATABASES['replica'] = dj_database_url.parse(
+        REPLICA_URL,
+        conn_max_age=600,
+        conn_health_checks=True,
+    )
+    DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+
+DATABASE_ROUTERS = ['movies.db_router.ReplicaRouter']
+REPLICA_STICKY_SECONDS = config('REPLICA_STICKY_SECONDS', default=5, cast=int)
+REPLICA_STICKY_CACHE = 'default'
+
+# Optional local read snapshot (see movies/read_snapshot.py): a SQLite copy of the profiles and
+# movies tables per host, kept in step by one worker every READ_SNAPSHOT_INTERVAL seconds.
+# MovieRepository list reads use it, ahead of the replica, while it synced within
+# READ_SNAPSHOT_MAX_STALENESS seconds and after the profile's latest write. Writes may land on
+# any host, so that write time lives in REPLICA_STICKY_CACHE too, which must be shared.
+READ_SNAPSHOT = config('READ_SNAPSHOT', default=False, cast=bool)
+READ_SNAPSHOT_PATH = config(
+    'READ_SNAPSHOT_PATH', default=str(Path(tempfile.gettempdir()) / 'boxd-out-read-snapshot.sqlite3')
+)
+READ_SNAPSHOT_MAX_STALENESS = config('READ_SNAPSHOT_MAX_STALENESS', default=30, cast=float)
+READ_SNAPSHOT_INTERVAL = config('READ_SNAPSHOT_INTERVAL', default=2, cast=float)
+# Re-copy rows updated this long before the watermark, for transactions that committed out of order
+READ_SNAPSHOT_OVERLAP_SECONDS = 10
+if READ_SNAPSHOT:
+    DATABASES['read_snapshot'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': READ_SNAPSHOT_PATH,
+        # A local file: under WSGI keep one connection per (long-lived) worker thread rather than
+        # reopening it per request. ASGI runs every request in a new thread, so close them there.
+        'CONN_MAX_AGE': 0 if SERVE_ASGI else None,
+    }
+
+# Connection pooling with Django's built-in pool (psycopg 3 only, `pip install .[pool]`).
+# Connections go back to the pool after each request instead of being held per worker,
+# so keep gunicorn workers * DB_POOL_MAX_SIZE under the Supabase connection cap.
+# Required under ASGI (see SERVE_ASGI), where it is on by default once psycopg 3 is installed.
+DB_POOL = config('DB_POOL', default=SERVE_ASGI and find_spec('psycopg') is not None, cast=bool)
+DB_POOL_MIN_SIZE = config('DB_POOL_MIN_SIZE', default=1, cast=int)
+DB_POOL_MAX_SIZE = config('DB_POOL_MAX_SIZE', default=4, cast=int)
+DB_POOL_TIMEOUT = config('DB_POOL_TIMEOUT', default=10, cast=float)
+DB_POOL_MAX_IDLE = config('DB_POOL_MAX_IDLE', default=300, cast=float)
+# Check connections on checkout; idle and lifetime limits already retire stale ones
+DB_POOL_CHECK = config('DB_POOL_CHECK', default=False, cast=bool)
+# Connecting through pgbouncer in transaction mode (e.g. the Supabase pooler on port 6543)
+DB_PGBOUNCER = config('DB_PGBOUNCER', default=False, cast=bool)
+
+for _database in DATABASES.values():
+    if SERVE_ASGI:
+        _database['CONN_MAX_AGE'] = 0
+    if _database['ENGINE'] != 'django.db.backends.postgresql':
+        continue
+    _options = _database.setdefault('OPTIONS', {})
+    if DB_POOL:
+        _database['CONN_MAX_AGE'] = 0
+        _database['CONN_HEALTH_CHECKS'] = DB_POOL_CHECK
+        _options['pool'] = {
+            'min_size': DB_POOL_MIN_SIZE,
+            'max_size': DB_POOL_MAX_SIZE,
+            'timeout': DB_POOL_TIMEOUT,
+            'max_idle': DB_POOL_MAX_IDLE,
+        }
+    if DB_PGBOUNCER:
+        # Named cursors and prepared statements don't survive transaction pooling
+        _database['DISABLE_SERVER_SIDE_CURSORS'] = True
+        if find_spec('psycopg') is not None:
+            _options['prepare_threshold'] = None
+
+# Shared cache for cross-worker coordination (single-flight scrape locks).
+# LocMemCache is per process; use DatabaseCache or Redis to coordinate workers.
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='boxd-out'),
+    }
+}
+SINGLE_FLIGHT_CACHE = 'default'
+
+# Rendered list responses (all / favourites / saved), invalidated on every write to the
+# profile's movies. The invalidation only reaches every worker through a shared cache, so
+# `manage.py check` fails with LocMemCache and more than one WEB_CONCURRENCY worker
+# (set LIST_CACHE_TIMEOUT=0 to turn list caching off instead).
+LIST_CACHE = 'default'
+LIST_CACHE_TIMEOUT = config('LIST_CACHE_TIMEOUT', default=60, cast=int)
+# gunicorn's worker count, which it also reads from this variable
+WEB_CONCURRENCY = config('WEB_CONCURRENCY', default=1, cast=int)
+
+# Static list snapshots (movies/snapshots.py): after each write commits, the profile's favourites,
+# saved and all lists are republished as immutable JSON files under SNAPSHOT_ROOT/<username>/,
+# with a latest.json pointer, for the web server / CDN to serve without Django
+SNAPSHOT_PUBLISH = config('SNAPSHOT_PUBLISH', default=False, cast=bool)
+SNAPSHOT_ROOT = Path(config('SNAPSHOT_ROOT', default=str(BASE_DIR / 'snapshots')))
+SNAPSHOT_GRACE_SECONDS = config('SNAPSHOT_GRACE_SECONDS', default=3600, cast=int)
+# Upload every publish through this Django storage backend, e.g. storages.backends.s3.S3Storage
+# (`pip install .[s3]`) for S3 / R2 behind a CDN, with SNAPSHOT_STORAGE_OPTIONS as JSON
+# ({"bucket_name": ..., "location": "snapshots", "file_overwrite": true}). SNAPSHOT_ROOT is then
+# only a staging area, which an ephemeral dyno disk is fine for.
+SNAPSHOT_STORAGE_BACKEND = config('SNAPSHOT_STORAGE_BACKEND', default='')
+SNAPSHOT_STORAGE_OPTIONS = config('SNAPSHOT_STORAGE_OPTIONS', default='{}', cast=json.loads)
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+if SNAPSHOT_STORAGE_BACKEND:
+    STORAGES['snapshots'] = {'BACKEND': SNAPSHOT_STORAGE_BACKEND, 'OPTIONS': SNAPSHOT_STORAGE_OPTIONS}
+
+# Idempotency-Key support for the scrape-and-save POSTs (movies/idempotency.py): a retry with the
+# same key replays the stored response, waiting up to IDEMPOTENCY_WAIT_SECONDS for a request still
+# running. A request that holds a key longer than IDEMPOTENCY_LOCK_SECONDS is presumed dead.
+# Keys expire after IDEMPOTENCY_TTL_HOURS; delete them with prune_idempotency_keys.
+IDEMPOTENCY_TTL_HOURS = config('IDEMPOTENCY_TTL_HOURS', default=24, cast=int)
+IDEMPOTENCY_LOCK_SECONDS = config('IDEMPOTENCY_LOCK_SECONDS', default=300, cast=int)
+IDEMPOTENCY_WAIT_SECONDS = config('IDEMPOTENCY_WAIT_SECONDS', default=10, cast=float)
+
+# On-demand request profiling (movies/profiling.py): with PROFILING_ENABLED, an authenticated
+# request sending `X-Profile: 1` runs under cProfile (PROFILING_SAMPLE_RATE of them) and its
+# stats go to PROFILING_DIR, newest PROFILING_MAX_FILES kept. List with /api/profiling/,
+# render with the profile_report command.
+PROFILING_ENABLED = config('PROFILING_ENABLED', default=False, cast=bool)
+PROFILING_SAMPLE_RATE = config('PROFILING_SAMPLE_RATE', default=1.0, cast=float)
+PROFILING_DIR = Path(config('PROFILING_DIR', default=str(BASE_DIR / 'profiles')))
+PROFILING_MAX_FILES = config('PROFILING_MAX_FILES', default=50, cast=int)
+
+# Poster placeholders (movies/placeholders.py, optional Pillow via `pip install .[placeholders]`):
+# after a save commits, a tiny poster variant is downloaded and its blurhash and dominant colour
+# are computed in a pool of PLACEHOLDER_PROCESSES processes, off the request threads
+PLACEHOLDERS_ENABLED = config('PLACEHOLDERS_ENABLED', default=True, cast=bool)
+PLACEHOLDER_PROCESSES = config('PLACEHOLDER_PROCESSES', default=2, cast=int)
+PLACEHOLDER_FETCH_TIMEOUT = config('PLACEHOLDER_FETCH_TIMEOUT', default=10, cast=int)
+
+# Response compression: brotli (optional `brotli` package) or gzip, for bodies of at least
+# COMPRESSION_MIN_SIZE bytes. Cached list payloads are compressed once at the highest level.
+COMPRESSION_MIN_SIZE = config('COMPRESSION_MIN_SIZE', default=1024, cast=int)
+COMPRESSION_GZIP_LEVEL = config('COMPRESSION_GZIP_LEVEL', default=6, cast=int)
+COMPRESSION_BROTLI_QUALITY = config('COMPRESSION_BROTLI_QUALITY', default=5, cast=int)
+
+# Movie change feed (/api/movies/events/, see movies/events.py). On PostgreSQL each worker
+# LISTENs on one extra connection; point EVENTS_LISTEN_URL at a direct (session mode)
+# connection when DATABASES go through pgbouncer. Prune the log with prune_movie_events.
+EVENTS_LISTEN_URL = config('EVENTS_LISTEN_URL', default='')
+EVENTS_LISTEN_POLL_SECONDS = 30
+EVENTS_HEARTBEAT_SECONDS = config('EVENTS_HEARTBEAT_SECONDS', default=15, cast=float)
+EVENTS_RETRY_MS = 3000
+EVENTS_BATCH_SIZE = 100
+# Longest a write transaction may stay open after logging its events: streams re-check ids below
+# their cursor for this long, since ids are allocated before commit
+EVENTS_REORDER_SECONDS = config('EVENTS_REORDER_SECONDS', default=30, cast=float)
+EVENTS_RETENTION_HOURS = config('EVENTS_RETENTION_HOURS', default=24, cast=float)
+
+# Worker warm-up (movies/warmup.py), run by gunicorn's post_fork before a worker takes requests
+# (with preload_app), or in a background thread from MoviesConfig.ready() with WARMUP_ON_READY
+WARMUP_ENABLED = config('WARMUP_ENABLED', default=True, cast=bool)
+WARMUP_ON_READY = config('WARMUP_ON_READY', default=False, cast=bool)
+WARMUP_STEPS = config('WARMUP_STEPS', default='database,urls,chromedriver,browser,list_cache', cast=Csv())
+WARMUP_LIST_PROFILES = config('WARMUP_LIST_PROFILES', default=5, cast=int)
+
+# chromedriver binary; when empty, webdriver_manager resolves it once per deploy (gunicorn master)
+CHROMEDRIVER_PATH = config('CHROMEDRIVER_PATH', default='')
+# Idle Chrome sessions each worker keeps for request scrapes (0: launch one per scrape)
+SCRAPE_BROWSER_POOL_MAX_IDLE = config('SCRAPE_BROWSER_POOL_MAX_IDLE', default=0, cast=int)
+
+# Scrape admission control (per gunicorn worker)
+SCRAPE_MAX_CONCURRENT = config('SCRAPE_MAX_CONCURRENT', default=2, cast=int)
+SCRAPE_MAX_QUEUE = config('SCRAPE_MAX_QUEUE', default=4, cast=int)
+SCRAPE_QUEUE_TIMEOUT = config('SCRAPE_QUEUE_TIMEOUT', default=10, cast=float)
+SCRAPE_HOST_RATE = config('SCRAPE_HOST_RATE', default=0.5, cast=float)
+SCRAPE_HOST_BURST = config('SCRAPE_HOST_BURST', default=3, cast=int)
+
+# Retries for transient scrape failures (timeouts, Chrome errors), with full-jitter backoff
+SCRAPE_RETRY_ATTEMPTS = config('SCRAPE_RETRY_ATTEMPTS', default=2, cast=int)
+SCRAPE_RETRY_BASE_DELAY = config('SCRAPE_RETRY_BASE_DELAY', default=1.0, cast=float)
+SCRAPE_RETRY_MAX_DELAY = config('SCRAPE_RETRY_MAX_DELAY', default=8.0, cast=float)
+
+# Circuit breaker per host: fail fast after consecutive upstream failures
+SCRAPE_CIRCUIT_FAILURE_THRESHOLD = config('SCRAPE_CIRCUIT_FAILURE_THRESHOLD', default=3, cast=int)
+SCRAPE_CIRCUIT_RESET_TIMEOUT = config('SCRAPE_CIRCUIT_RESET_TIMEOUT', default=60, cast=float)
+
+# Page load policy per scraper: 'lean' blocks images, fonts, media and ad/analytics
+# domains with an eager load strategy; 'full' loads pages like a regular browser
+SCRAPE_PAGE_POLICIES = {
+    'LetterboxdScraper': config('FAVOURITES_PAGE_POLICY', default='lean'),
+    'SingleMovieScraper': config('MOVIE_PAGE_POLICY', default='lean'),
+}
+
+# Profiles scraped concurrently by the sync_profiles command
+SYNC_MAX_WORKERS = config('SYNC_MAX_WORKERS', default=SCRAPE_MAX_CONCURRENT, cast=int)
+
+# ?format= selects a list shape (rows / columnar), not a renderer; negotiate renderers with Accept
+REST_FRAMEWORK = {
+    'URL_FORMAT_OVERRIDE': None,
+}
+
+# Maximum queries per request, keyed by URL name in movies/urls.py
+QUERY_BUDGET_DEFAULT = None
+QUERY_BUDGET_STRICT = config('QUERY_BUDGET_STRICT', default=False, cast=bool)
+QUERY_BUDGETS = {
+    'health_check': 0,
+    'scrape_favourites': 0,
+    'save_favourites': 18,
+    'save_new_movie': 10,
+    'get_all_movies': 1,
+    'get_favourites': 1,
+    'get_saved_movies': 1,
+    'get_movie_stats': 1,
+    'movie_events': 0,
+    'list_request_profiles': 0,
+    'update_movie_status': 6,
+    'delete_movie': 5,
+    'bulk_update_movie_status': 6,
+    'bulk_delete_movies': 5,
+}
+
 SECURE_SSL_REDIRECT = True
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
 SESSION_COOKIE_SECURE = True
@@ -0,0 +1,66 @@
+"""
+Settings for the test suite: `python manage.py test --settings=config.test_settings`
+
+Runs against SQLite (in memory) with fixed secrets, so no .env or Postgres is needed.
+"""
+import tempfile
+from pathlib import Path
+
+from .settings import *  # noqa: F401,F403
+
+SECRET_KEY = 'test-secret-key'
+JWT_SECRET = 'test-jwt-secret-that-is-long-enough-for-hs256'
+AUTH_SECRET_WORD = 'test-word'
+LETTERBOXD_USERNAME = 'mike'
+
+# Files Django opens before it swaps in the (in-memory) test databases, kept out of the repo
+TEST_DATABASE_DIR = Path(tempfile.gettempdir())
+
+# A second SQLite database stands in for the read replica; only tests that opt in with
+# REPLICA_READS=True (and list 'replica' in their databases) read from it
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': TEST_DATABASE_DIR / 'boxd-out-test.sqlite3',
+    },
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': TEST_DATABASE_DIR / 'boxd-out-test-replica.sqlite3',
+    },
+}
+REPLICA_READS = False
+
+# The read snapshot's test database is a file, with its sync state next to it; only tests that opt
+# in with READ_SNAPSHOT=True (and list 'read_snapshot' in their databases) use it
+DATABASES['read_snapshot'] = {
+    'ENGINE': 'django.db.backends.sqlite3',
+    'NAME': TEST_DATABASE_DIR / 'boxd-out-read-snapshot.sqlite3',
+    'TEST': {'NAME': TEST_DATABASE_DIR / 'boxd-out-test-read-snapshot.sqlite3'},
+}
+READ_SNAPSHOT = False
+
+# Tests run in one process, so a per-process cache is shared by everything they do
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'boxd-out-tests',
+    }
+}
+# A cache every worker shares, for tests of the checks that require one:
+# @override_settings(CACHES=SHARED_CACHES)
+SHARED_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'boxd_out_cache',
+    }
+}
+
+# Over-budget requests fail the test instead of logging
+QUERY_BUDGET_STRICT = True
+
+# No background work reaching the network or the filesystem
+PLACEHOLDERS_ENABLED = False
+SNAPSHOT_PUBLISH = False
+PROFILING_ENABLED = False
+WARMUP_ENABLED = False
+SCRAPE_RETRY_ATTEMPTS = 0
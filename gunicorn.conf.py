@@ -0,0 +1,50 @@
+from decouple import config
+
+# Import the app once in the master so forked workers share its memory copy-on-write
+preload_app = config('GUNICORN_PRELOAD', default=True, cast=bool)
+
+# Serve config.wsgi with threaded workers by default. GUNICORN_WORKER_CLASS=uvicorn_worker.UvicornWorker
+# (`pip install .[asgi]`) serves config.asgi instead: /api/movies/events/ streams are async and hold
+# no thread while idle, and the sync DRF views each run in a thread of their own, so database
+# connections come from DB_POOL (see SERVE_ASGI in config/settings.py).
+worker_class = config('GUNICORN_WORKER_CLASS', default='gthread')
+threads = config('GUNICORN_THREADS', default=4, cast=int)
+wsgi_app = 'config.asgi:application' if 'uvicorn' in worker_class.lower() else 'config.wsgi:application'
+
+
+def when_ready(server):
+    """
+    Load the URLconf (views, DRF) in the master too, before workers are forked,
+    and pin the chromedriver path once so workers don't each resolve it
+    """
+    if preload_app:
+        from django.conf import settings
+
+        from movies.warmup import warm_chromedriver, warm_urls
+        server.log.info("Loaded %s in the master", warm_urls())
+
+        if settings.WARMUP_ENABLED and 'chromedriver' in settings.WARMUP_STEPS:
+            try:
+                server.log.info("Pinned chromedriver at %s", warm_chromedriver())
+            except Exception as e:
+                server.log.warning("Could not resolve chromedriver: %s", e)
+
+
+def post_fork(server, worker):
+    """Warm the new worker (DB, caches, browser) before it accepts requests"""
+    if preload_app:
+        from django.conf import settings
+        if settings.WARMUP_ENABLED:
+            from movies.warmup import run_warmup
+            state = run_warmup()
+            server.log.info("Worker %s warmed up in %.0fms", worker.pid,
+                            sum(step.duration_ms for step in state.steps))
+
+
+def worker_exit(server, worker):
+    """Quit the worker's pooled Chrome sessions and poster decoding processes"""
+    if preload_app:
+        from movies.placeholders import close_process_pool
+        from movies.services.browser import close_browser_pool
+        close_browser_pool()
+        close_process_pool()
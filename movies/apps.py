@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class MoviesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "movies"
+
+    def ready(self):
+        from django.conf import settings
+
+        from . import checks  # noqa: F401
+
+        # gunicorn warms each worker in post_fork; other servers can opt in here
+        if settings.WARMUP_ENABLED and settings.WARMUP_ON_READY:
+            from .warmup import start_warmup_thread
+
+            start_warmup_thread()
@@ -0,0 +1,100 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, Warning, register
+
+from .db_router import replica_configured
+from .read_snapshot import snapshot_enabled
+from .snapshots import STORAGE_ALIAS as SNAPSHOT_STORAGE_ALIAS
+
+# Cache backends whose entries live in one process's memory, invisible to other workers
+PER_PROCESS_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def cache_is_shared(alias: str) -> bool:
+    """Whether every worker sees the entries of the cache alias"""
+    return settings.CACHES[alias]['BACKEND'] not in PER_PROCESS_CACHE_BACKENDS
+
+
+@register(Tags.caches, Tags.database)
+def check_replica_sticky_cache(app_configs, **kwargs):
+    """
+    Replica and read snapshot reads need the recent-write marker in a shared cache
+
+    Otherwise a save handled by one worker (or on another host) doesn't keep the
+    list request another worker handles next off a copy that hasn't caught up,
+    and the client misses its own write.
+    """
+    if not (replica_configured() or snapshot_enabled()):
+        return []
+    alias = getattr(settings, 'REPLICA_STICKY_CACHE', 'default')
+    if cache_is_shared(alias):
+        return []
+    return [Error(
+        f"REPLICA_STICKY_CACHE '{alias}' uses {settings.CACHES[alias]['BACKEND']}, which each worker keeps "
+        "to itself, so reads after a write can go to a lagging replica or read snapshot",
+        hint="Set CACHE_BACKEND to django.core.cache.backends.db.DatabaseCache (then run createcachetable) "
+             "or a Redis backend, or unset SUPABASE_REPLICA_URL / set REPLICA_READS=False and "
+             "READ_SNAPSHOT=False",
+        id='movies.E001',
+    )]
+
+
+@register(Tags.caches)
+def check_list_cache(app_configs, **kwargs):
+    """
+    The list cache needs a shared cache once there is more than one worker
+
+    Invalidation moves the profile's version key in the worker that handled the
+    write; with a per-process cache every other worker keeps serving its stale
+    lists for up to LIST_CACHE_TIMEOUT.
+    """
+    alias = getattr(settings, 'LIST_CACHE', 'default')
+    if (getattr(settings, 'WEB_CONCURRENCY', 1) <= 1 or getattr(settings, 'LIST_CACHE_TIMEOUT', 60) <= 0
+            or cache_is_shared(alias)):
+        return []
+    return [Error(
+        f"LIST_CACHE '{alias}' uses {settings.CACHES[alias]['BACKEND']} with "
+        f"{settings.WEB_CONCURRENCY} workers, so a write only invalidates the lists of the worker "
+        "that handled it",
+        hint="Set CACHE_BACKEND to django.core.cache.backends.db.DatabaseCache (then run createcachetable) "
+             "or a Redis backend, or set LIST_CACHE_TIMEOUT=0",
+        id='movies.E002',
+    )]
+
+
+@register(Tags.database)
+def check_asgi_connection_pool(app_configs, **kwargs):
+    """
+    Postgres needs DB_POOL when served over ASGI
+
+    Every request's sync code runs in a new thread there, so without a pool each
+    request opens (and closes) its own connection.
+    """
+    if not getattr(settings, 'SERVE_ASGI', False):
+        return []
+    return [
+        Error(
+            f"Database '{alias}' opens a connection per request under ASGI "
+            f"({settings.GUNICORN_WORKER_CLASS})",
+            hint="Install psycopg 3 (pip install .[pool]) and set DB_POOL=True, or serve WSGI with "
+                 "GUNICORN_WORKER_CLASS=gthread",
+            id='movies.E003',
+        )
+        for alias, database in settings.DATABASES.items()
+        if database['ENGINE'] == 'django.db.backends.postgresql' and 'pool' not in database.get('OPTIONS', {})
+    ]
+
+
+@register()
+def check_snapshot_storage(app_configs, **kwargs):
+    """Published snapshots only reach readers from a persistent, served disk or an upload storage"""
+    if not getattr(settings, 'SNAPSHOT_PUBLISH', False) or SNAPSHOT_STORAGE_ALIAS in settings.STORAGES:
+        return []
+    return [Warning(
+        f"Snapshots are only written to SNAPSHOT_ROOT ({settings.SNAPSHOT_ROOT}) on this host",
+        hint="Serve SNAPSHOT_ROOT from a persistent disk (see README), or set SNAPSHOT_STORAGE_BACKEND to "
+             "upload every publish, e.g. to S3 / R2 on hosts with ephemeral disks",
+        id='movies.W001',
+    )]
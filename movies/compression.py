@@ -0,0 +1,94 @@
+import gzip
+import zlib
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from django.conf import settings
+
+try:
+    import brotli
+except ImportError:  # optional, `pip install .[compression]`
+    brotli = None
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """Encodings we can produce, most preferred first"""
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick the response encoding for an Accept-Encoding header
+
+    Returns:
+        'br' or 'gzip', or None if the client accepts neither
+    """
+    qualities: Dict[str, float] = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[coding] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in available_encodings():
+        quality = qualities.get(encoding, qualities.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str, best: bool = False) -> bytes:
+    """
+    Compress a whole body
+
+    Args:
+        body: Bytes to compress
+        encoding: 'br' or 'gzip'
+        best: Use the highest compression level, for bodies compressed once and served many times
+    """
+    if encoding == 'br':
+        quality = 11 if best else getattr(settings, 'COMPRESSION_BROTLI_QUALITY', 5)
+        return brotli.compress(body, quality=quality)
+    level = 9 if best else getattr(settings, 'COMPRESSION_GZIP_LEVEL', 6)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def compress_stream(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    """
+    Compress a streaming body chunk by chunk
+
+    Each chunk is flushed as it arrives, so clients see data as soon as the
+    view produces it rather than when the compressor's buffer fills.
+    """
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=getattr(settings, 'COMPRESSION_BROTLI_QUALITY', 5))
+        for chunk in chunks:
+            data = compressor.process(chunk) + compressor.flush()
+            if data:
+                yield data
+        yield compressor.finish()
+        return
+
+    level = getattr(settings, 'COMPRESSION_GZIP_LEVEL', 6)
+    # wbits 16 + MAX_WBITS writes a gzip header and trailer around the deflate stream
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def precompress(body: bytes) -> Dict[str, bytes]:
+    """Compress body in every available encoding, if it is big enough to be worth it"""
+    if len(body) < getattr(settings, 'COMPRESSION_MIN_SIZE', 1024):
+        return {}
+    return {encoding: compress(body, encoding, best=True) for encoding in available_encodings()}
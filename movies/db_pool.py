@@ -0,0 +1,39 @@
+from typing import Any, Dict
+
+from django.db import connections
+
+
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Utilization of this worker's database connection pools, by alias
+
+    Returns:
+        Empty when pooling is off. Otherwise, per pooled alias: configured
+        min/max, open and idle connections, requests waiting now, and the
+        cumulative checkout count and wait time since the worker started.
+    """
+    stats = {}
+    for alias in connections:
+        pool = getattr(connections[alias], 'pool', None)
+        # Pools open on the first connection; until then there is nothing to report
+        if pool is None or pool.closed:
+            continue
+        pool_stats = pool.get_stats()
+        size = pool_stats.get('pool_size', 0)
+        available = pool_stats.get('pool_available', 0)
+        stats[alias] = {
+            'min_size': pool_stats.get('pool_min', 0),
+            'max_size': pool_stats.get('pool_max', 0),
+            'size': size,
+            'in_use': size - available,
+            'available': available,
+            'waiting': pool_stats.get('requests_waiting', 0),
+            'utilization': round((size - available) / pool.max_size, 2) if pool.max_size else 0,
+            'requests': pool_stats.get('requests_num', 0),
+            'requests_queued': pool_stats.get('requests_queued', 0),
+            'requests_wait_ms': pool_stats.get('requests_wait_ms', 0),
+            'requests_errors': pool_stats.get('requests_errors', 0),
+            'connections_opened': pool_stats.get('connections_num', 0),
+            'connections_ms': pool_stats.get('connections_ms', 0),
+        }
+    return stats
@@ -0,0 +1,140 @@
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from .read_snapshot import (
+    SNAPSHOT_DB_ALIAS,
+    SNAPSHOT_MODELS,
+    max_staleness,
+    snapshot_enabled,
+    snapshot_usable,
+)
+
+REPLICA_DB_ALIAS = 'replica'
+
+# Set while a replica-eligible read (a MovieRepository read method) is running
+_replica_reads: ContextVar[bool] = ContextVar('replica_reads', default=False)
+# Set instead when this host's read snapshot is fresh enough for it (see movies/read_snapshot.py)
+_snapshot_reads: ContextVar[bool] = ContextVar('snapshot_reads', default=False)
+
+
+def replica_configured() -> bool:
+    return getattr(settings, 'REPLICA_READS', True) and REPLICA_DB_ALIAS in settings.DATABASES
+
+
+def _sticky_cache():
+    return caches[getattr(settings, 'REPLICA_STICKY_CACHE', 'default')]
+
+
+def _sticky_key(profile_id: int) -> str:
+    return f'replica-sticky:{profile_id}'
+
+
+def _sticky_seconds() -> int:
+    return getattr(settings, 'REPLICA_STICKY_SECONDS', 5)
+
+
+def mark_recent_write(profile) -> None:
+    """
+    Remember when the profile last wrote
+
+    Pins its reads to the primary for REPLICA_STICKY_SECONDS, and off the
+    read snapshot until a sync started after the write (kept for as long as
+    the snapshot may lag, READ_SNAPSHOT_MAX_STALENESS).
+    """
+    timeout = max(
+        _sticky_seconds() if replica_configured() else 0,
+        max_staleness() if snapshot_enabled() else 0,
+    )
+    if profile is None or timeout <= 0:
+        return
+    _sticky_cache().set(_sticky_key(profile.id), time.time(), timeout=timeout)
+
+
+def last_write_at(profile) -> Optional[float]:
+    """time.time() of the profile's latest write, while it is still remembered"""
+    return _sticky_cache().get(_sticky_key(profile.id))
+
+
+def wrote_recently(profile) -> bool:
+    """Check whether the profile wrote within the stickiness window"""
+    written = last_write_at(profile)
+    return written is not None and time.time() - written < _sticky_seconds()
+
+
+@contextmanager
+def replica_reads(profile=None):
+    """
+    Route ORM reads inside the block to the read snapshot or the replica
+
+    Reads of snapshot models go to this host's read snapshot while it is
+    fresh; otherwise to the replica. Either falls back to the primary when
+    not configured or when profile wrote more recently than it can have
+    caught up with, so a client always reads its own writes.
+
+    Yields:
+        True if reads go to the snapshot or the replica
+    """
+    last_write = last_write_at(profile) if profile is not None else None
+    use_snapshot = snapshot_usable(last_write)
+    use_replica = replica_configured() and (
+        last_write is None or time.time() - last_write >= _sticky_seconds()
+    )
+    snapshot_token = _snapshot_reads.set(use_snapshot)
+    replica_token = _replica_reads.set(use_replica)
+    try:
+        yield use_snapshot or use_replica
+    finally:
+        _replica_reads.reset(replica_token)
+        _snapshot_reads.reset(snapshot_token)
+
+
+def _profile_argument(signature: inspect.Signature, args, kwargs) -> Optional[Any]:
+    return signature.bind_partial(*args, **kwargs).arguments.get('profile')
+
+
+def reads_from_replica(method: Callable) -> Callable:
+    """Decorator for repository reads that tolerate replica lag outside the stickiness window"""
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with replica_reads(_profile_argument(signature, args, kwargs)):
+            return method(*args, **kwargs)
+    return wrapper
+
+
+class ReplicaRouter:
+    """
+    Send replica-eligible reads to the 'read_snapshot' or 'replica' alias, everything else to 'default'
+
+    Reads only leave the primary inside replica_reads() (MovieRepository read
+    methods), and never while the primary has a transaction open, since that
+    transaction may hold writes the copies haven't seen. Only profiles and
+    movies are in the snapshot; other models' reads skip it.
+    """
+
+    def db_for_read(self, model, **hints):
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        if _snapshot_reads.get() and model._meta.label_lower in SNAPSHOT_MODELS:
+            return SNAPSHOT_DB_ALIAS
+        if _replica_reads.get():
+            return REPLICA_DB_ALIAS
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, REPLICA_DB_ALIAS, SNAPSHOT_DB_ALIAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
@@ -0,0 +1,363 @@
+import asyncio
+import json
+import select
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection, connections, transaction
+from django.db.models import Max, Min
+from django.utils import timezone
+
+from .models import MovieEvent
+
+# Postgres NOTIFY channel; the payload is the profile id whose events changed
+EVENT_CHANNEL = 'movie_events'
+
+
+class Subscription:
+    """One event stream waiting for its profile's events, woken from any thread"""
+
+    def __init__(self, profile_id: int):
+        self.profile_id = profile_id
+        self._loop = asyncio.get_running_loop()
+        self._pending = asyncio.Event()
+
+    def wake(self) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._pending.set)
+        except RuntimeError:
+            pass  # the stream's loop has closed
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait until woken; False if the timeout passed first"""
+        try:
+            await asyncio.wait_for(self._pending.wait(), timeout)
+        except TimeoutError:
+            return False
+        self._pending.clear()
+        return True
+
+
+class EventBroadcaster:
+    """
+    Wakes this process's event streams when a profile has new events
+
+    Streams only learn that something changed and read the event log
+    themselves, so a missed or repeated wake-up costs at most one query.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions: Dict[int, Set[Subscription]] = defaultdict(set)
+
+    @contextmanager
+    def subscribe(self, profile_id: int):
+        subscription = Subscription(profile_id)
+        with self._lock:
+            self._subscriptions[profile_id].add(subscription)
+        try:
+            yield subscription
+        finally:
+            with self._lock:
+                self._subscriptions[profile_id].discard(subscription)
+                if not self._subscriptions[profile_id]:
+                    del self._subscriptions[profile_id]
+
+    def publish(self, profile_id: Optional[int]) -> None:
+        """Wake the profile's streams, or every stream when profile_id is None"""
+        with self._lock:
+            if profile_id is None:
+                subscriptions = [sub for subs in self._subscriptions.values() for sub in subs]
+            else:
+                subscriptions = list(self._subscriptions.get(profile_id, ()))
+        for subscription in subscriptions:
+            subscription.wake()
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subs) for subs in self._subscriptions.values())
+
+
+broadcaster = EventBroadcaster()
+
+
+def record_movie_events(profile_id: int, kind: str, changes: Iterable[Tuple[int, Dict[str, Any]]]) -> None:
+    """
+    Append events for changed movies to the log and notify listening streams
+
+    Must run in the same transaction as the change. On PostgreSQL the insert
+    and a pg_notify go out in one statement and NOTIFY is delivered on commit,
+    to every process; elsewhere this process's streams are woken on commit.
+
+    Args:
+        profile_id: Profile owning the movies
+        kind: MovieEvent.Kind value
+        changes: (movie id, changed values) pairs
+    """
+    changes = list(changes)
+    if not changes:
+        return
+
+    if connection.vendor != 'postgresql':
+        MovieEvent.objects.bulk_create([
+            MovieEvent(profile_id=profile_id, kind=kind, movie_id=movie_id, data=data)
+            for movie_id, data in changes
+        ])
+        transaction.on_commit(lambda: broadcaster.publish(profile_id))
+        return
+
+    table = connection.ops.quote_name(MovieEvent._meta.db_table)
+    data_field = MovieEvent._meta.get_field('data')
+    now = timezone.now()
+    values_sql = ', '.join(['(%s, %s, %s, %s, %s)'] * len(changes))
+    params: List[Any] = []
+    for movie_id, data in changes:
+        params.extend([profile_id, kind, movie_id, data_field.get_db_prep_save(data, connection), now])
+
+    sql = (
+        f'WITH "inserted" AS ('
+        f'INSERT INTO {table} ("profile_id", "kind", "movie_id", "data", "created_at") '
+        f'VALUES {values_sql} RETURNING "id") '
+        f'SELECT pg_notify(%s, %s) FROM (SELECT 1 FROM "inserted" LIMIT 1) AS "any_inserted"'
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [*params, EVENT_CHANNEL, str(profile_id)])
+
+
+class NotificationListener(threading.Thread):
+    """
+    Forwards Postgres NOTIFYs on EVENT_CHANNEL to this process's broadcaster
+
+    Holds one dedicated autocommit connection (LISTEN needs a session, so set
+    EVENTS_LISTEN_URL to a direct connection when DATABASES goes through
+    pgbouncer in transaction mode). Reconnects with backoff; after each
+    (re)connect every stream re-reads the log, since NOTIFYs sent while
+    disconnected are lost.
+    """
+
+    def __init__(self):
+        super().__init__(name='movie-events-listener', daemon=True)
+        self.retry_delay = 1.0
+
+    def run(self):
+        while True:
+            try:
+                self._listen()
+            except Exception as e:
+                print(f"Movie event listener error: {e}")
+            time.sleep(self.retry_delay)
+            self.retry_delay = min(self.retry_delay * 2, 30.0)
+
+    def _connect(self):
+        from django.db.backends.postgresql.base import Database
+
+        listen_url = getattr(settings, 'EVENTS_LISTEN_URL', '')
+        if listen_url:
+            listen_connection = Database.connect(listen_url)
+        else:
+            listen_connection = Database.connect(**connections['default'].get_connection_params())
+        listen_connection.autocommit = True
+        return listen_connection
+
+    def _notifications(self, listen_connection, timeout: float):
+        """Notifications as they arrive, until timeout seconds pass without one"""
+        from django.db.backends.postgresql.base import is_psycopg3
+
+        if is_psycopg3:
+            yield from listen_connection.notifies(timeout=timeout)
+            return
+        while select.select([listen_connection], [], [], timeout)[0]:
+            listen_connection.poll()
+            while listen_connection.notifies:
+                yield listen_connection.notifies.pop(0)
+
+    def _listen(self):
+        poll_timeout = getattr(settings, 'EVENTS_LISTEN_POLL_SECONDS', 30)
+        listen_connection = self._connect()
+        try:
+            cursor = listen_connection.cursor()
+            cursor.execute(f'LISTEN {EVENT_CHANNEL}')
+            self.retry_delay = 1.0
+            broadcaster.publish(None)
+            while True:
+                for notification in self._notifications(listen_connection, poll_timeout):
+                    payload = notification.payload
+                    broadcaster.publish(int(payload) if payload.isdigit() else None)
+                # Quiet channel: make sure the connection is still alive
+                cursor.execute('SELECT 1')
+        finally:
+            listen_connection.close()
+
+_listener: Optional[NotificationListener] = None
+_listener_lock = threading.Lock()
+
+
+def ensure_listener() -> None:
+    """Start this process's NOTIFY listener the first time a stream opens (PostgreSQL only)"""
+    global _listener
+    if connections['default'].vendor != 'postgresql':
+        return
+    with _listener_lock:
+        if _listener is None:
+            _listener = NotificationListener()
+            _listener.start()
+
+
+def _run_read(query, *args):
+    try:
+        return query(*args)
+    finally:
+        connection.close()
+
+
+async def _read(query, *args):
+    """
+    Run a log query for a stream in a worker thread, then give its connection back
+
+    Streams stay open for hours; holding a thread and a connection (or a pool
+    slot) per client between reads would exhaust the database.
+    """
+    return await sync_to_async(_run_read, thread_sensitive=False)(query, *args)
+
+
+def latest_event_id() -> int:
+    return MovieEvent.objects.aggregate(latest=Max('id'))['latest'] or 0
+
+
+def events_pruned_after(event_id: int) -> bool:
+    """Whether events following event_id may have been pruned from the log"""
+    oldest = MovieEvent.objects.aggregate(oldest=Min('id'))['oldest']
+    return oldest is not None and event_id < oldest - 1
+
+
+def reorder_seconds() -> float:
+    return getattr(settings, 'EVENTS_REORDER_SECONDS', 30)
+
+
+def fetch_events(profile_id: int, after: int, limit: int) -> List[MovieEvent]:
+    return list(MovieEvent.objects.filter(profile_id=profile_id, id__gt=after).order_by('id')[:limit])
+
+
+def fetch_late_events(profile_id: int, after: int, until: int, sent: Set[int]) -> List[MovieEvent]:
+    """
+    Events in (after, until] not sent yet
+
+    Ids come from a sequence allocated before commit, so a transaction can
+    commit after one holding a higher id was already streamed.
+    """
+    late_ids = [
+        event_id for event_id in MovieEvent.objects.filter(
+            profile_id=profile_id, id__gt=after, id__lte=until
+        ).values_list('id', flat=True)
+        if event_id not in sent
+    ]
+    if not late_ids:
+        return []
+    return list(MovieEvent.objects.filter(id__in=late_ids).order_by('id'))
+
+
+def resume_floor(event_id: int) -> int:
+    """
+    Id a stream resuming after event_id re-reads from
+
+    Events created more than EVENTS_REORDER_SECONDS before event_id had
+    committed by the time it was sent; later ones may have committed after.
+    """
+    resumed_at = MovieEvent.objects.filter(id=event_id).values_list('created_at', flat=True).first()
+    if resumed_at is None:
+        return event_id
+    before_window = MovieEvent.objects.filter(
+        created_at__lt=resumed_at - timedelta(seconds=reorder_seconds())
+    ).order_by('-created_at').values_list('id', flat=True).first()
+    return min(before_window or 0, event_id)
+
+
+def format_event(event_id: Optional[int], kind: str, data: Dict[str, Any]) -> str:
+    """One server-sent event"""
+    lines = [] if event_id is None else [f'id: {event_id}']
+    lines.append(f'event: {kind}')
+    lines.append(f'data: {json.dumps(data, separators=(",", ":"), default=str)}')
+    return '\n'.join(lines) + '\n\n'
+
+
+def _event_data(event: MovieEvent) -> Dict[str, Any]:
+    return {'movie_id': event.movie_id, **event.data, 'at': event.created_at.isoformat()}
+
+
+async def event_stream(profile_id: int, last_event_id: Optional[int]) -> AsyncIterator[str]:
+    """
+    Server-sent events for a profile's movie changes
+
+    Starts after last_event_id (a reconnecting client's Last-Event-ID), or at
+    the newest event for a new client. If events after last_event_id have
+    been pruned, sends a `reset` event first: the client should refetch its
+    lists. Idle streams get a comment every EVENTS_HEARTBEAT_SECONDS so
+    proxies keep them open.
+
+    Each read also re-checks ids below the cursor allocated within the last
+    EVENTS_REORDER_SECONDS, for transactions that committed after a higher
+    id was sent. A resumed stream doesn't know which of those its client
+    got, so it sends them again, in id order; a movie's later event always
+    has the higher id, so clients applying them end up in the same state.
+    """
+    heartbeat = getattr(settings, 'EVENTS_HEARTBEAT_SECONDS', 15)
+    batch_size = getattr(settings, 'EVENTS_BATCH_SIZE', 100)
+    reorder = reorder_seconds()
+
+    ensure_listener()
+    # Subscribe before the first read, so nothing committed in between is missed
+    with broadcaster.subscribe(profile_id) as subscription:
+        # Fix the starting point before the client sees the stream open
+        reset = last_event_id is not None and await _read(events_pruned_after, last_event_id)
+        if last_event_id is None or reset:
+            last_event_id = floor = await _read(latest_event_id)
+        else:
+            floor = await _read(resume_floor, last_event_id)
+
+        yield f'retry: {getattr(settings, "EVENTS_RETRY_MS", 3000)}\n\n'
+        if reset:
+            yield format_event(None, 'reset', {'reason': 'Events after Last-Event-ID were pruned'})
+
+        # Ids in (floor, last_event_id] sent so far, and the cursor after each read of the window
+        sent: Set[int] = set()
+        reads: Deque[Tuple[float, int]] = deque()
+        while True:
+            read_at = time.monotonic()
+            late = []
+            if floor < last_event_id:
+                late = await _read(fetch_late_events, profile_id, floor, last_event_id, sent)
+            events = await _read(fetch_events, profile_id, last_event_id, batch_size)
+            for event in late + events:
+                yield format_event(event.id, event.kind, _event_data(event))
+                sent.add(event.id)
+            if events:
+                last_event_id = events[-1].id
+
+            # Ids allocated before a read that long ago have committed (or rolled back) by now
+            reads.append((read_at, last_event_id))
+            while reads and reads[0][0] <= read_at - reorder:
+                floor = max(floor, reads.popleft()[1])
+            sent = {event_id for event_id in sent if event_id > floor}
+
+            if len(events) == batch_size:
+                continue
+            if not await subscription.wait(heartbeat):
+                yield ': keep-alive\n\n'
+
+
+def prune_events(before) -> int:
+    """
+    Delete events created before a datetime; returns how many were deleted
+
+    The newest event is always kept, so a client that is up to date can
+    still tell it has missed nothing (see events_pruned_after).
+    """
+    latest = latest_event_id()
+    deleted, _ = MovieEvent.objects.filter(created_at__lt=before).exclude(id=latest).delete()
+    return deleted
@@ -0,0 +1,204 @@
+import functools
+import hashlib
+import json
+import threading
+import time
+from datetime import timedelta
+from typing import Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+from .models import IdempotencyKey, Profile
+
+IDEMPOTENCY_HEADER = 'HTTP_IDEMPOTENCY_KEY'
+# Set on responses replayed from a stored result
+REPLAYED_HEADER = 'Idempotent-Replayed'
+MAX_KEY_LENGTH = 255
+
+# Transient failures aren't stored, so a retry runs the request again (as do 5xx)
+RETRYABLE_STATUSES = {
+    status.HTTP_408_REQUEST_TIMEOUT,
+    status.HTTP_409_CONFLICT,
+    status.HTTP_429_TOO_MANY_REQUESTS,
+}
+
+# Keys being run by this process; duplicates arriving here wait on the event instead of polling
+_running: Dict[Tuple[int, str], threading.Event] = {}
+_running_lock = threading.Lock()
+
+
+def request_fingerprint(request) -> str:
+    """SHA-256 of the method, path, query string and JSON body"""
+    body = json.dumps(request.data, sort_keys=True, cls=JSONEncoder)
+    fingerprint = '\n'.join([request.method, request.path, request.META.get('QUERY_STRING', ''), body])
+    return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+
+def _takeover_condition(now) -> Q:
+    """Keys a new request may take over: expired ones, and in-progress ones whose request died"""
+    return Q(expires_at__lt=now) | Q(state=IdempotencyKey.State.IN_PROGRESS, locked_until__lt=now)
+
+
+def claim_key(profile: Profile, key: str, fingerprint: str) -> Tuple[IdempotencyKey, bool]:
+    """
+    Claim a key for this request, or get the row of the request holding it
+
+    Returns:
+        (the key's row, True if this request now owns it)
+    """
+    now = timezone.now()
+    values = {
+        'state': IdempotencyKey.State.IN_PROGRESS,
+        'request_fingerprint': fingerprint,
+        'response_status': None,
+        'response_data': None,
+        'locked_until': now + timedelta(seconds=getattr(settings, 'IDEMPOTENCY_LOCK_SECONDS', 300)),
+        'expires_at': now + timedelta(hours=getattr(settings, 'IDEMPOTENCY_TTL_HOURS', 24)),
+    }
+    keys = IdempotencyKey.objects.filter(profile=profile, key=key)
+    while True:
+        try:
+            with transaction.atomic():
+                return IdempotencyKey.objects.create(profile=profile, key=key, **values), True
+        except IntegrityError:
+            pass
+
+        # Taking over is a conditional update, so only one retry can win it
+        taken_over = keys.filter(_takeover_condition(now)).update(**values)
+        record = keys.first()
+        if record is not None:
+            return record, bool(taken_over)
+        # Freed by its holder in between: try the insert again
+
+
+def complete_key(record: IdempotencyKey, response: Response) -> None:
+    """Store the response to replay, or free the key if the failure is worth retrying"""
+    retryable = response.status_code >= 500 or response.status_code in RETRYABLE_STATUSES
+    if retryable or not hasattr(response, 'data'):
+        release_key(record)
+        return
+    # Stored as rendered, so replays match the original byte for byte
+    data = json.loads(json.dumps(response.data, cls=JSONEncoder))
+    IdempotencyKey.objects.filter(pk=record.pk).update(
+        state=IdempotencyKey.State.COMPLETED,
+        response_status=response.status_code,
+        response_data=data,
+    )
+
+
+def release_key(record: IdempotencyKey) -> None:
+    IdempotencyKey.objects.filter(pk=record.pk, state=IdempotencyKey.State.IN_PROGRESS).delete()
+
+
+def _wait_for_key(record: IdempotencyKey, running: Optional[threading.Event]) -> Optional[IdempotencyKey]:
+    """
+    Wait up to IDEMPOTENCY_WAIT_SECONDS for the holder of a key to finish
+
+    Returns:
+        The key's row as last read, or None if the holder released it
+    """
+    timeout = getattr(settings, 'IDEMPOTENCY_WAIT_SECONDS', 10)
+    if running is not None:
+        running.wait(timeout)
+        return IdempotencyKey.objects.filter(pk=record.pk).first()
+
+    # Held by another worker: poll with backoff, to keep the queries of a long wait down
+    deadline = time.monotonic() + timeout
+    delay = 0.25
+    while True:
+        time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+        current = IdempotencyKey.objects.filter(pk=record.pk).first()
+        if current is None or current.state == IdempotencyKey.State.COMPLETED:
+            return current
+        if time.monotonic() >= deadline:
+            return current
+        delay = min(delay * 2, 2.0)
+
+
+def _replay(record: IdempotencyKey) -> Response:
+    return Response(record.response_data, status=record.response_status, headers={REPLAYED_HEADER: 'true'})
+
+
+def _run(view: Callable, record: IdempotencyKey, request, *args, **kwargs) -> Response:
+    running_key = (record.profile_id, record.key)
+    event = threading.Event()
+    with _running_lock:
+        _running[running_key] = event
+    try:
+        try:
+            response = view(request, *args, **kwargs)
+        except BaseException:
+            release_key(record)
+            raise
+        complete_key(record, response)
+        return response
+    finally:
+        # Only once the key is completed or released, so waiting duplicates read the outcome
+        with _running_lock:
+            _running.pop(running_key, None)
+        event.set()
+
+
+def idempotent(view: Callable) -> Callable:
+    """
+    Decorator for POST views: honour an Idempotency-Key header
+
+    The first request with a key runs the view and stores its response.
+    Retries with the same key replay it (with Idempotent-Replayed: true)
+    without running the view, waiting up to IDEMPOTENCY_WAIT_SECONDS if it
+    is still running, then 409. Server errors and retryable statuses free
+    the key instead. Reusing a key for a different request is a 422.
+    Requests without the header run as usual.
+    """
+    @functools.wraps(view)
+    def wrapper(request, *args, **kwargs):
+        key = request.META.get(IDEMPOTENCY_HEADER, '').strip()
+        if not key:
+            return view(request, *args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return Response(
+                {'error': f'Idempotency-Key must be at most {MAX_KEY_LENGTH} characters'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        fingerprint = request_fingerprint(request)
+        # Twice: if the holder frees the key while we wait, this request runs instead
+        for _ in range(2):
+            record, claimed = claim_key(request.profile, key, fingerprint)
+            if claimed:
+                return _run(view, record, request, *args, **kwargs)
+
+            if record.request_fingerprint != fingerprint:
+                return Response(
+                    {'error': 'Idempotency-Key was already used for a different request'},
+                    status=status.HTTP_422_UNPROCESSABLE_ENTITY
+                )
+            if record.state == IdempotencyKey.State.COMPLETED:
+                return _replay(record)
+
+            with _running_lock:
+                running = _running.get((record.profile_id, key))
+            record = _wait_for_key(record, running)
+            if record is not None and record.state == IdempotencyKey.State.COMPLETED:
+                return _replay(record)
+            if record is not None:
+                break
+
+        return Response(
+            {'error': 'A request with this Idempotency-Key is still in progress'},
+            status=status.HTTP_409_CONFLICT,
+            headers={'Retry-After': '1'}
+        )
+    return wrapper
+
+
+def prune_idempotency_keys() -> int:
+    """Delete expired keys; returns how many were deleted"""
+    deleted, _ = IdempotencyKey.objects.filter(expires_at__lt=timezone.now()).delete()
+    return deleted
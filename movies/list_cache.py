@@ -0,0 +1,78 @@
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+
+from .compression import precompress
+
+
+@dataclass
+class CachedList:
+    """A rendered list payload and its precompressed variants"""
+
+    body: bytes
+    precompressed: Dict[str, bytes] = field(default_factory=dict)
+    content_type: str = 'application/json'
+
+    def response(self) -> HttpResponse:
+        response = HttpResponse(self.body, content_type=self.content_type)
+        # Picked up by CompressionMiddleware instead of compressing again
+        response.precompressed = self.precompressed
+        return response
+
+
+def _cache():
+    return caches[getattr(settings, 'LIST_CACHE', 'default')]
+
+
+def _version_key(profile_id: int) -> str:
+    return f'movie-list-version:{profile_id}'
+
+
+def _list_version(profile_id: int) -> int:
+    cache = _cache()
+    version = cache.get(_version_key(profile_id))
+    if version is None:
+        cache.add(_version_key(profile_id), time.time_ns(), timeout=None)
+        version = cache.get(_version_key(profile_id), 0)
+    return version
+
+
+def invalidate_movie_lists(profile) -> None:
+    """Drop every cached list of profile's movies by moving it to a new version"""
+    _cache().set(_version_key(profile.id), time.time_ns(), timeout=None)
+
+
+def cached_list(profile, name: str, build: Callable[[], Tuple[bytes, bool]],
+                content_type: str = 'application/json') -> CachedList:
+    """
+    Get one of profile's movie lists from the cache, building it on a miss
+
+    Args:
+        profile: Profile owning the list
+        name: List variant, e.g. 'all' or 'favourites' plus fields, shape and format
+        build: Returns the rendered body and whether it may be cached
+        content_type: Media type of the rendered body
+
+    Returns:
+        The cached or freshly built payload
+    """
+    cache = _cache()
+    # Read the version before building, so a write landing meanwhile can't be cached under the new version
+    key = f'movie-list:{profile.id}:{name}:{_list_version(profile.id)}'
+
+    entry = cache.get(key)
+    if entry is not None:
+        return entry
+
+    body, cacheable = build()
+    if not cacheable:
+        return CachedList(body, content_type=content_type)
+
+    entry = CachedList(body, precompress(body), content_type)
+    cache.set(key, entry, timeout=getattr(settings, 'LIST_CACHE_TIMEOUT', 60))
+    return entry
+
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from ...models import Profile
+
+
+class Command(BaseCommand):
+    help = 'Register a Letterboxd profile so it can be issued tokens and synced'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--username',
+            type=str,
+            help='Letterboxd username',
+            required=True
+        )
+    
+    def handle(self, *args, **options):
+        username = options['username']
+        
+        profile, created = Profile.objects.get_or_create(username=username)
+        
+        if created:
+            self.stdout.write(self.style.SUCCESS(f'Created profile {profile.username}'))
+        else:
+            self.stdout.write(f'Profile {profile.username} already exists')
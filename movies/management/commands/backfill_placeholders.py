@@ -0,0 +1,56 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models import Profile
+from ...placeholders import close_process_pool, refresh_placeholders
+from ...services.placeholder_service import placeholders_available
+
+
+class Command(BaseCommand):
+    help = 'Compute poster blurhashes and dominant colours for movies missing them'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--username',
+            type=str,
+            action='append',
+            help='Only backfill this profile (repeatable); defaults to every profile'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Recompute placeholders that are already up to date'
+        )
+        parser.add_argument(
+            '--images-dir',
+            type=str,
+            help='Read posters from <dir>/<slug>.jpg instead of downloading them (offline runs)'
+        )
+    
+    def handle(self, *args, **options):
+        if not placeholders_available():
+            raise CommandError('Pillow is required: pip install .[placeholders]')
+        
+        profiles = Profile.objects.all()
+        if options['username']:
+            profiles = profiles.filter(username__in=options['username'])
+            missing = set(options['username']) - set(profiles.values_list('username', flat=True))
+            if missing:
+                raise CommandError(f'Unknown profiles: {", ".join(sorted(missing))}')
+        
+        fetch_options = {}
+        if options['images_dir']:
+            images_dir = Path(options['images_dir'])
+            fetch_options['fetch'] = lambda movie: (images_dir / f'{movie.slug}.jpg').read_bytes()
+        
+        total_updated = 0
+        try:
+            for profile in profiles:
+                updated = refresh_placeholders(profile, force=options['force'], **fetch_options)
+                total_updated += updated
+                self.stdout.write(f'{profile.username}: {updated} placeholders computed')
+        finally:
+            close_process_pool()
+        
+        self.stdout.write(self.style.SUCCESS(f'Backfilled {total_updated} placeholders'))
@@ -0,0 +1,88 @@
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Imports a fresh worker runs: the served app plus the URLconf loaded on the first request
+BOOT_SNIPPET = (
+    "import resource\n"
+    "import {module}\n"
+    "from django.urls import get_resolver\n"
+    "_ = get_resolver().url_patterns\n"
+    "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)\n"
+)
+
+# App module each kind of gunicorn worker serves (see gunicorn.conf.py)
+APP_MODULES = {'wsgi': 'config.wsgi', 'asgi': 'config.asgi'}
+
+# Modules only the scraping code path should load
+HEAVY_MODULES = ['selenium', 'webdriver_manager', 'bs4', 'PIL']
+
+
+class Command(BaseCommand):
+    help = 'Measure worker boot import time and RSS using python -X importtime'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=15,
+            help='Number of slowest imports to list'
+        )
+        parser.add_argument(
+            '--runs',
+            type=int,
+            default=3,
+            help='Boots to measure; the fastest is reported'
+        )
+        parser.add_argument(
+            '--app',
+            choices=sorted(APP_MODULES),
+            help='App to boot; defaults to the one GUNICORN_WORKER_CLASS serves'
+        )
+    
+    def handle(self, *args, **options):
+        app = options['app'] or ('asgi' if getattr(settings, 'SERVE_ASGI', False) else 'wsgi')
+        runs = [self._boot(APP_MODULES[app]) for _ in range(max(1, options['runs']))]
+        imports, rss_kb = min(runs, key=lambda run: sum(self_us for _, self_us, _ in run[0]))
+        
+        total_ms = sum(self_us for _, self_us, _ in imports) / 1000
+        self.stdout.write(self.style.SUCCESS(
+            f'Boot ({APP_MODULES[app]}): {total_ms:.1f}ms importing {len(imports)} modules, '
+            f'max RSS {rss_kb / 1024:.1f}MB'
+        ))
+        
+        loaded = {module for module, _, _ in imports}
+        for module in HEAVY_MODULES:
+            state = self.style.ERROR('loaded at boot') if module in loaded else 'deferred'
+            self.stdout.write(f'  {module}: {state}')
+        
+        self.stdout.write("\nSlowest imports (cumulative):")
+        top_level = [entry for entry in imports if '.' not in entry[0]]
+        for module, _, cumulative_us in sorted(top_level, key=lambda entry: -entry[2])[:options['top']]:
+            self.stdout.write(f'  {cumulative_us / 1000:8.1f}ms  {module}')
+    
+    def _boot(self, module: str):
+        """Import the app module in a fresh interpreter; returns ([(name, self_us, cumulative_us)], rss_kb)"""
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get(
+            'DJANGO_SETTINGS_MODULE', 'config.settings'
+        ))
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', BOOT_SNIPPET.format(module=module)],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        
+        imports = []
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+            self_us, cumulative_us, module = line[len('import time:'):].split('|')
+            imports.append((module.strip(), int(self_us), int(cumulative_us)))
+        
+        return imports, int(result.stdout.strip().splitlines()[-1])
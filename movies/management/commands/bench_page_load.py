@@ -0,0 +1,62 @@
+import statistics
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...services import LetterboxdScraper, SingleMovieScraper
+from ...services.page_policy import PAGE_POLICIES
+
+
+class Command(BaseCommand):
+    help = 'Compare Letterboxd page load times under each scraper page policy'
+    
+    def add_arguments(self, parser):
+        target = parser.add_mutually_exclusive_group(required=True)
+        target.add_argument(
+            '--username',
+            type=str,
+            help='Profile whose favourites page to load'
+        )
+        target.add_argument(
+            '--film',
+            type=str,
+            help='Film slug whose page to load (e.g. bring-her-back)'
+        )
+        parser.add_argument(
+            '--runs',
+            type=int,
+            default=3,
+            help='Loads per policy; the median is reported'
+        )
+        parser.add_argument(
+            '--policy',
+            action='append',
+            choices=sorted(PAGE_POLICIES),
+            help='Policies to compare (default: all)'
+        )
+    
+    def handle(self, *args, **options):
+        if options['username']:
+            scraper_class = LetterboxdScraper
+            url = f"https://letterboxd.com/{options['username']}/"
+        else:
+            scraper_class = SingleMovieScraper
+            url = f"https://letterboxd.com/film/{options['film']}/"
+        
+        self.stdout.write(f'Loading {url} with {scraper_class.__name__}')
+        
+        for name in options['policy'] or sorted(PAGE_POLICIES):
+            scraper = scraper_class(page_policy=PAGE_POLICIES[name])
+            timings = []
+            size = 0
+            for _ in range(max(1, options['runs'])):
+                try:
+                    html_content = scraper._load_page_source(url)
+                except Exception as e:
+                    raise CommandError(f'{name}: {e}')
+                timings.append(scraper.last_load_seconds)
+                size = len(html_content)
+            
+            self.stdout.write(
+                f'  {name:>5}: median {statistics.median(timings):.2f}s '
+                f'(min {min(timings):.2f}s, max {max(timings):.2f}s), {size / 1024:.0f}KB HTML'
+            )
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...profiling import list_profiles, render_report
+
+
+class Command(BaseCommand):
+    help = 'Show the hottest functions of a stored request profile'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'profile_id',
+            nargs='?',
+            default='latest',
+            help='Stored profile id (from /api/profiling/ or X-Profile-Id); defaults to the newest'
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=20,
+            help='Number of functions to show'
+        )
+        parser.add_argument(
+            '--sort',
+            type=str,
+            default='cumulative',
+            choices=['cumulative', 'tottime', 'ncalls'],
+            help='Order functions by cumulative time, own time or call count'
+        )
+        parser.add_argument(
+            '--list',
+            action='store_true',
+            help='List stored profiles instead'
+        )
+    
+    def handle(self, *args, **options):
+        if options['list']:
+            for profile in list_profiles():
+                self.stdout.write(
+                    f"{profile['id']}  {profile['method']} {profile['path']}  "
+                    f"{profile['status']}  {profile['duration_ms']}ms  {profile['username']}"
+                )
+            return
+        
+        try:
+            report = render_report(options['profile_id'], top=options['top'], sort=options['sort'])
+        except FileNotFoundError as e:
+            raise CommandError(str(e))
+        
+        self.stdout.write(report)
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from ...idempotency import prune_idempotency_keys
+
+
+class Command(BaseCommand):
+    help = 'Delete Idempotency-Key records past IDEMPOTENCY_TTL_HOURS'
+    
+    def handle(self, *args, **options):
+        deleted = prune_idempotency_keys()
+        self.stdout.write(self.style.SUCCESS(f'Pruned {deleted} expired idempotency keys'))
@@ -0,0 +1,24 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from ...events import prune_events
+
+
+class Command(BaseCommand):
+    help = 'Delete movie change events older than the retention window, keeping the event log compact'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--hours',
+            type=float,
+            default=getattr(settings, 'EVENTS_RETENTION_HOURS', 24),
+            help='Keep events from the last HOURS hours (default: EVENTS_RETENTION_HOURS)'
+        )
+    
+    def handle(self, *args, **options):
+        before = timezone.now() - timedelta(hours=options['hours'])
+        deleted = prune_events(before)
+        self.stdout.write(self.style.SUCCESS(f'Pruned {deleted} events older than {options["hours"]:g}h'))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models import Profile
+from ...snapshots import publish_snapshots
+
+
+class Command(BaseCommand):
+    help = 'Publish static JSON snapshots of movie lists (favourites, saved, all) under SNAPSHOT_ROOT'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--username',
+            type=str,
+            action='append',
+            help='Only publish this profile (repeatable); defaults to every profile'
+        )
+    
+    def handle(self, *args, **options):
+        profiles = Profile.objects.all()
+        if options['username']:
+            profiles = profiles.filter(username__in=options['username'])
+            missing = set(options['username']) - set(profiles.values_list('username', flat=True))
+            if missing:
+                raise CommandError(f'Unknown profiles: {", ".join(sorted(missing))}')
+        
+        for profile in profiles:
+            pointer = publish_snapshots(profile, force=True)
+            files = ', '.join(pointer['files'].values())
+            self.stdout.write(f'{profile.username}: version {pointer["version"]} -> {files}')
+        
+        self.stdout.write(self.style.SUCCESS('Published snapshots'))
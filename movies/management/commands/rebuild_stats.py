@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models import Profile
+from ...repository import MovieRepository
+
+
+class Command(BaseCommand):
+    help = 'Recompute the movie stats summary table from the movies table, repairing any drift'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--username',
+            type=str,
+            action='append',
+            help='Only rebuild this profile (repeatable); defaults to every profile'
+        )
+    
+    def handle(self, *args, **options):
+        profiles = Profile.objects.all()
+        if options['username']:
+            profiles = profiles.filter(username__in=options['username'])
+            missing = set(options['username']) - set(profiles.values_list('username', flat=True))
+            if missing:
+                raise CommandError(f'Unknown profiles: {", ".join(sorted(missing))}')
+        
+        total_drifted = 0
+        for profile in profiles:
+            drifted = MovieRepository.rebuild_stats(profile)
+            total_drifted += drifted
+            if drifted:
+                self.stdout.write(self.style.WARNING(
+                    f'{profile.username}: repaired {drifted} drifted counts'
+                ))
+            else:
+                self.stdout.write(f'{profile.username}: stats up to date')
+        
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt stats, {total_drifted} counts repaired'))
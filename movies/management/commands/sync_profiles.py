@@ -0,0 +1,105 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from ...models import Profile
+from ...services import LetterboxdScraper, ScrapeRejected
+from ...services.browser import BrowserPool, PageCache
+from ...sync import sync_favourites
+
+
+class Command(BaseCommand):
+    help = 'Sync Letterboxd favourites for every profile concurrently'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=getattr(settings, 'SYNC_MAX_WORKERS', 2),
+            help='Profiles scraped at the same time'
+        )
+        parser.add_argument(
+            '--username',
+            action='append',
+            help='Only sync this profile (repeatable)'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Save favourites even when unchanged since the last sync'
+        )
+        parser.add_argument(
+            '--retries',
+            type=int,
+            default=3,
+            help='Attempts per profile when the scraper is busy'
+        )
+    
+    def handle(self, *args, **options):
+        profiles = Profile.objects.all()
+        if options['username']:
+            profiles = profiles.filter(username__in=options['username'])
+        profiles = list(profiles)
+        
+        if not profiles:
+            self.stdout.write('No profiles to sync')
+            return
+        
+        workers = max(1, options['workers'])
+        browser_pool = BrowserPool(max_idle=workers)
+        scraper = LetterboxdScraper(browser_pool=browser_pool, page_cache=PageCache())
+        started = time.monotonic()
+        failures = 0
+        
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._sync_profile, profile, scraper, options): profile
+                    for profile in profiles
+                }
+                for future in as_completed(futures):
+                    profile = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        failures += 1
+                        self.stdout.write(self.style.ERROR(f'{profile.username}: {e}'))
+                        continue
+                    
+                    if result is None:
+                        failures += 1
+                        self.stdout.write(self.style.ERROR(f'{profile.username}: no movies found'))
+                    elif not result['saved']:
+                        failures += 1
+                        self.stdout.write(self.style.ERROR(f'{profile.username}: failed to save'))
+                    elif result['changed']:
+                        self.stdout.write(self.style.SUCCESS(
+                            f"{profile.username}: saved {result['scraped_count']} favourites"
+                        ))
+                    else:
+                        self.stdout.write(f'{profile.username}: unchanged')
+        finally:
+            browser_pool.close()
+        
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            f'Synced {len(profiles) - failures}/{len(profiles)} profiles '
+            f'with {workers} workers in {elapsed:.1f}s'
+        )
+    
+    def _sync_profile(self, profile, scraper, options):
+        """Sync one profile, waiting out admission rejections; runs in a pool thread"""
+        attempts = max(1, options['retries'])
+        try:
+            for attempt in range(attempts):
+                try:
+                    return sync_favourites(profile, scraper=scraper, force=options['force'])
+                except ScrapeRejected as e:
+                    if attempt == attempts - 1:
+                        raise
+                    time.sleep(e.retry_after)
+        finally:
+            connections.close_all()
@@ -1,8 +1,12 @@
 from django.conf import settings
 from django.http import JsonResponse
+from django.utils.cache import patch_vary_headers
 from django.utils.deprecation import MiddlewareMixin
 
-from .utils import validate_token
+from .compression import compress, compress_stream, negotiate_encoding
+from .profiling import profile_request, should_profile
+from .query_budget import check_query_budget, count_queries
+from .utils import decode_token, get_token_profile
 
 
 class JWTAuthenticationMiddleware(MiddlewareMixin):
@@ -47,21 +51,120 @@ class JWTAuthenticationMiddleware(MiddlewareMixin):
         
         token = token_parts[1]
         
-        # Get expected username
-        username = getattr(settings, 'LETTERBOXD_USERNAME', None)
+        # Validate token
+        payload = decode_token(token)
         
-        if not username:
+        if not payload:
             return JsonResponse(
-                {'error': 'Username not configured'}, 
-                status=500
+                {'error': 'Invalid token'}, 
+                status=401
             )
         
-        # Validate token
-        if not validate_token(token, username):
+        # Scope the request to the token's profile
+        profile = get_token_profile(payload)
+        
+        if not profile:
             return JsonResponse(
-                {'error': 'Invalid token'}, 
+                {'error': 'Unknown profile'}, 
                 status=401
             )
         
+        request.profile = profile
+        
         # Authentication successful, continue with request
-        return None
\ No newline at end of file
+        return None
+
+
+class ProfilingMiddleware:
+    """
+    Profiling Middleware
+    Runs the view under cProfile when PROFILING_ENABLED, the request sends
+    X-Profile with a valid token and it is sampled (PROFILING_SAMPLE_RATE).
+    Must come after JWTAuthenticationMiddleware.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if should_profile(request):
+            return profile_request(self.get_response, request)
+        return self.get_response(request)
+
+
+class QueryBudgetMiddleware:
+    """
+    Query Budget Middleware
+    Counts queries and DB time per request, reports them in a Server-Timing
+    header and checks them against the view's budget in settings.QUERY_BUDGETS
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with count_queries() as counter:
+            response = self.get_response(request)
+
+        response['Server-Timing'] = counter.server_timing()
+
+        resolver_match = getattr(request, 'resolver_match', None)
+        url_name = resolver_match.url_name if resolver_match else None
+        check_query_budget(url_name, counter)
+
+        return response
+
+
+class CompressionMiddleware:
+    """
+    Compression Middleware
+    Negotiates brotli/gzip from Accept-Encoding and compresses bodies of at
+    least settings.COMPRESSION_MIN_SIZE bytes. Bodies compressed ahead of time
+    (response.precompressed, set for cached list payloads) are served as is,
+    streaming bodies are compressed chunk by chunk, and server-sent event
+    streams are left alone.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if response.has_header('Content-Encoding'):
+            return response
+        if response.get('Content-Type', '').startswith('text/event-stream'):
+            return response
+        if response.streaming and getattr(response, 'is_async', False):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        encoding = negotiate_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            response.streaming_content = compress_stream(response.streaming_content, encoding)
+            if response.has_header('Content-Length'):
+                del response['Content-Length']
+        else:
+            precompressed = getattr(response, 'precompressed', {}).get(encoding)
+            if precompressed is not None:
+                response.content = precompressed
+            else:
+                if len(response.content) < getattr(settings, 'COMPRESSION_MIN_SIZE', 1024):
+                    return response
+                compressed = compress(response.content, encoding)
+                if len(compressed) >= len(response.content):
+                    return response
+                response.content = compressed
+            response['Content-Length'] = str(len(response.content))
+
+        # The compressed representation is no longer byte-identical to the strong ETag
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+
+        response['Content-Encoding'] = encoding
+        return response
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.4 on 2026-10-19 05:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0005_alter_movie_options_alter_movie_image_url_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FavouritesSync',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('username', models.CharField(help_text='Letterboxd username the favourites were synced from', max_length=100, unique=True)),
+                ('fingerprint', models.CharField(help_text='SHA-256 of the ordered (title, year, link_url) favourites', max_length=64)),
+                ('synced_at', models.DateTimeField(help_text='Last sync that wrote changes')),
+            ],
+            options={
+                'verbose_name': 'Favourites sync',
+                'verbose_name_plural': 'Favourites syncs',
+            },
+        ),
+    ]
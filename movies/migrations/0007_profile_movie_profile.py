@@ -0,0 +1,51 @@
+# Generated by Django 5.2.4 on 2026-10-19 09:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0006_favouritessync"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Profile",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "username",
+                    models.CharField(
+                        help_text="Letterboxd username", max_length=100, unique=True
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "verbose_name": "Profile",
+                "verbose_name_plural": "Profiles",
+                "ordering": ["username"],
+            },
+        ),
+        migrations.AddField(
+            model_name="movie",
+            name="profile",
+            field=models.ForeignKey(
+                help_text="Profile the movie was saved by",
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="movies",
+                to="movies.profile",
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-10-19 09:14
+
+from django.conf import settings
+from django.db import migrations
+
+
+def assign_default_profile(apps, schema_editor):
+    """Attach existing movies to the profile of the configured LETTERBOXD_USERNAME"""
+    Movie = apps.get_model("movies", "Movie")
+    Profile = apps.get_model("movies", "Profile")
+    db_alias = schema_editor.connection.alias
+
+    if not Movie.objects.using(db_alias).filter(profile__isnull=True).exists():
+        return
+
+    username = getattr(settings, "LETTERBOXD_USERNAME", None) or "default"
+    profile, _ = Profile.objects.using(db_alias).get_or_create(username=username)
+    Movie.objects.using(db_alias).filter(profile__isnull=True).update(profile=profile)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0007_profile_movie_profile"),
+    ]
+
+    operations = [
+        migrations.RunPython(assign_default_profile, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.4 on 2026-10-19 09:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0008_backfill_movie_profile"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="movie",
+            name="profile",
+            field=models.ForeignKey(
+                help_text="Profile the movie was saved by",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="movies",
+                to="movies.profile",
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="movie",
+            unique_together={("profile", "title", "year")},
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["profile", "status", "-created_at"],
+                name="movie_profile_status_created",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["profile", "-created_at"], name="movie_profile_created"
+            ),
+        ),
+    ]
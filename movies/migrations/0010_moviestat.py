@@ -0,0 +1,63 @@
+# Generated by Django 5.2.4 on 2026-10-19 05:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0009_movie_profile_constraints"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MovieStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "dimension",
+                    models.CharField(
+                        choices=[
+                            ("status", "Status"),
+                            ("year", "Release year"),
+                            ("decade", "Decade"),
+                        ],
+                        help_text="What the movies are grouped by",
+                        max_length=8,
+                    ),
+                ),
+                (
+                    "value",
+                    models.CharField(
+                        blank=True,
+                        help_text="Group value, e.g. FAVORITE, 1999 or 1990s (blank when unknown)",
+                        max_length=8,
+                    ),
+                ),
+                ("count", models.IntegerField(default=0)),
+                (
+                    "profile",
+                    models.ForeignKey(
+                        help_text="Profile the counts belong to",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stats",
+                        to="movies.profile",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Movie stat",
+                "verbose_name_plural": "Movie stats",
+                "unique_together": {("profile", "dimension", "value")},
+            },
+        ),
+    ]
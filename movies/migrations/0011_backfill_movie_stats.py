@@ -0,0 +1,53 @@
+# Generated by Django 5.2.4 on 2026-10-19 05:36
+
+from collections import Counter
+
+from django.db import migrations
+from django.db.models import Count
+
+
+def year_and_decade(year):
+    if len(year or "") == 4 and year.isdigit():
+        return year, f"{year[:3]}0s"
+    return "", ""
+
+
+def backfill_movie_stats(apps, schema_editor):
+    """Count existing movies per profile into the new summary table"""
+    Movie = apps.get_model("movies", "Movie")
+    MovieStat = apps.get_model("movies", "MovieStat")
+    db_alias = schema_editor.connection.alias
+
+    counts = Counter()
+    rows = (
+        Movie.objects.using(db_alias)
+        .order_by()
+        .values_list("profile_id", "status", "year")
+        .annotate(movies=Count("id"))
+    )
+    for profile_id, status, year, movies in rows:
+        year, decade = year_and_decade(year)
+        counts[(profile_id, "status", status)] += movies
+        counts[(profile_id, "year", year)] += movies
+        counts[(profile_id, "decade", decade)] += movies
+
+    MovieStat.objects.using(db_alias).delete()
+    MovieStat.objects.using(db_alias).bulk_create(
+        [
+            MovieStat(
+                profile_id=profile_id, dimension=dimension, value=value, count=count
+            )
+            for (profile_id, dimension, value), count in counts.items()
+        ]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0010_moviestat"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_movie_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.4 on 2026-10-19 05:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0011_backfill_movie_stats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="movie",
+            name="director",
+            field=models.CharField(
+                blank=True,
+                help_text="Director name(s), comma separated",
+                max_length=255,
+            ),
+        ),
+        migrations.AddField(
+            model_name="movie",
+            name="genres",
+            field=models.JSONField(
+                blank=True, default=list, help_text="Genre names from the film page"
+            ),
+        ),
+        migrations.AddField(
+            model_name="movie",
+            name="rating",
+            field=models.FloatField(
+                blank=True, help_text="Letterboxd average rating (0-5)", null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="movie",
+            name="runtime",
+            field=models.PositiveSmallIntegerField(
+                blank=True, help_text="Runtime in minutes", null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["profile", "director"], name="movie_profile_director"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["profile", "runtime"], name="movie_profile_runtime"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["profile", "-rating"], name="movie_profile_rating"
+            ),
+        ),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 5.2.4 on 2026-10-19 05:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0012_movie_film_metadata"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MovieEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("created", "Created"),
+                            ("updated", "Updated"),
+                            ("deleted", "Deleted"),
+                        ],
+                        help_text="created, updated or deleted",
+                        max_length=7,
+                    ),
+                ),
+                (
+                    "movie_id",
+                    models.BigIntegerField(
+                        help_text="Id of the changed movie (kept after it is deleted)"
+                    ),
+                ),
+                (
+                    "data",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        help_text="Changed values, e.g. the new status",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "profile",
+                    models.ForeignKey(
+                        help_text="Profile whose movie changed",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="events",
+                        to="movies.profile",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Movie event",
+                "verbose_name_plural": "Movie events",
+                "indexes": [
+                    models.Index(
+                        fields=["profile", "id"], name="movie_event_profile_id"
+                    ),
+                    models.Index(fields=["created_at"], name="movie_event_created"),
+                ],
+            },
+        ),
+    ]
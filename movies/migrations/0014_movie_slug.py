@@ -0,0 +1,31 @@
+# Generated by Django 5.2.4 on 2026-10-19 05:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0013_movieevent"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="movie",
+            name="slug",
+            field=models.SlugField(
+                blank=True,
+                db_index=False,
+                help_text="Letterboxd film slug from link_url, unique per profile (blank without a link)",
+                max_length=255,
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="movie",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("slug", ""), _negated=True),
+                fields=("profile", "slug"),
+                name="movie_profile_slug_unique",
+            ),
+        ),
+    ]
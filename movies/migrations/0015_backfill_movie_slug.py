@@ -0,0 +1,46 @@
+# Generated by Django 5.2.4 on 2026-10-19 05:53
+
+import re
+
+from django.db import migrations
+
+FILM_SLUG_PATTERN = re.compile(r"/film/([a-z0-9-]+)/?", re.IGNORECASE)
+BATCH_SIZE = 1000
+
+
+def backfill_movie_slugs(apps, schema_editor):
+    """Derive slugs from link_url; when a profile has two rows for one film, only the oldest gets it"""
+    Movie = apps.get_model("movies", "Movie")
+    db_alias = schema_editor.connection.alias
+
+    seen = set()
+    batch = []
+    movies = (
+        Movie.objects.using(db_alias)
+        .filter(slug="")
+        .exclude(link_url="")
+        .order_by("profile_id", "created_at", "id")
+        .only("id", "profile_id", "link_url")
+    )
+    for movie in movies.iterator(chunk_size=BATCH_SIZE):
+        match = FILM_SLUG_PATTERN.search(movie.link_url)
+        if not match or (movie.profile_id, match.group(1).lower()) in seen:
+            continue
+        movie.slug = match.group(1).lower()
+        seen.add((movie.profile_id, movie.slug))
+        batch.append(movie)
+        if len(batch) >= BATCH_SIZE:
+            Movie.objects.using(db_alias).bulk_update(batch, ["slug"])
+            batch = []
+    Movie.objects.using(db_alias).bulk_update(batch, ["slug"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0014_movie_slug"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_movie_slugs, migrations.RunPython.noop),
+    ]
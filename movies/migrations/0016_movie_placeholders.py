@@ -0,0 +1,38 @@
+# Generated by Django 5.2.4 on 2026-10-19 05:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0015_backfill_movie_slug"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="movie",
+            name="blurhash",
+            field=models.CharField(
+                blank=True,
+                help_text="Blurhash of the poster, shown while it loads",
+                max_length=64,
+            ),
+        ),
+        migrations.AddField(
+            model_name="movie",
+            name="dominant_color",
+            field=models.CharField(
+                blank=True, help_text="Dominant poster colour as #rrggbb", max_length=7
+            ),
+        ),
+        migrations.AddField(
+            model_name="movie",
+            name="placeholder_image_url",
+            field=models.URLField(
+                blank=True,
+                help_text="image_url the blurhash and dominant colour were computed from",
+                max_length=512,
+            ),
+        ),
+    ]
@@ -0,0 +1,92 @@
+# Generated by Django 5.2.4 on 2026-10-19 06:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0016_movie_placeholders"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IdempotencyKey",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(
+                        help_text="Idempotency-Key header value", max_length=255
+                    ),
+                ),
+                (
+                    "request_fingerprint",
+                    models.CharField(
+                        help_text="SHA-256 of method, path and body; a key only replays for the same request",
+                        max_length=64,
+                    ),
+                ),
+                (
+                    "state",
+                    models.CharField(
+                        choices=[
+                            ("in_progress", "In progress"),
+                            ("completed", "Completed"),
+                        ],
+                        default="in_progress",
+                        max_length=11,
+                    ),
+                ),
+                (
+                    "response_status",
+                    models.PositiveSmallIntegerField(blank=True, null=True),
+                ),
+                (
+                    "response_data",
+                    models.JSONField(
+                        blank=True, help_text="Response body to replay", null=True
+                    ),
+                ),
+                (
+                    "locked_until",
+                    models.DateTimeField(
+                        help_text="An in-progress key not completed by then is taken over by the next retry"
+                    ),
+                ),
+                (
+                    "expires_at",
+                    models.DateTimeField(
+                        help_text="When the key can be pruned and reused"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "profile",
+                    models.ForeignKey(
+                        help_text="Profile that sent the request",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="idempotency_keys",
+                        to="movies.profile",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Idempotency key",
+                "verbose_name_plural": "Idempotency keys",
+                "indexes": [
+                    models.Index(fields=["expires_at"], name="idempotency_key_expires")
+                ],
+                "unique_together": {("profile", "key")},
+            },
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.4 on 2026-10-19 06:02
+
+import re
+
+from django.db import migrations, models
+
+YEAR_PATTERN = re.compile(r"^\d{4}$")
+BATCH_SIZE = 1000
+
+
+def backfill_release_years(apps, schema_editor):
+    """Copy four-digit years into release_year; anything else stays null"""
+    Movie = apps.get_model("movies", "Movie")
+    db_alias = schema_editor.connection.alias
+
+    batch = []
+    movies = (
+        Movie.objects.using(db_alias)
+        .filter(release_year__isnull=True)
+        .order_by("id")
+        .only("id", "year")
+    )
+    for movie in movies.iterator(chunk_size=BATCH_SIZE):
+        if not YEAR_PATTERN.match(movie.year):
+            continue
+        movie.release_year = int(movie.year)
+        batch.append(movie)
+        if len(batch) >= BATCH_SIZE:
+            Movie.objects.using(db_alias).bulk_update(batch, ["release_year"])
+            batch = []
+    Movie.objects.using(db_alias).bulk_update(batch, ["release_year"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0017_idempotencykey"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="movie",
+            name="release_year",
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                editable=False,
+                help_text="year as an integer, for range filters and sorting (null if year isn't YYYY)",
+                null=True,
+            ),
+        ),
+        # Before the indexes, so they are built once over the filled column
+        migrations.RunPython(backfill_release_years, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["profile", "release_year", "-created_at"],
+                name="movie_profile_year",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["profile", "status", "release_year", "-created_at"],
+                name="movie_profile_status_year",
+            ),
+        ),
+    ]
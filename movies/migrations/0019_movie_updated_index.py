@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-19 06:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0018_movie_release_year"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(fields=["updated_at"], name="movie_updated"),
+        ),
+    ]
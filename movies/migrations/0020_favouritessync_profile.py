@@ -0,0 +1,71 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def link_syncs_to_profiles(apps, schema_editor):
+    """Point each sync at its username's profile; syncs without one are dropped (the next sync redoes them)"""
+    FavouritesSync = apps.get_model("movies", "FavouritesSync")
+    Profile = apps.get_model("movies", "Profile")
+    db_alias = schema_editor.connection.alias
+
+    profiles = dict(Profile.objects.using(db_alias).values_list("username", "id"))
+    for sync in FavouritesSync.objects.using(db_alias):
+        if sync.username in profiles:
+            sync.profile_id = profiles[sync.username]
+            sync.save(using=db_alias, update_fields=["profile"])
+        else:
+            sync.delete(using=db_alias)
+
+
+def restore_usernames(apps, schema_editor):
+    FavouritesSync = apps.get_model("movies", "FavouritesSync")
+    db_alias = schema_editor.connection.alias
+    for sync in FavouritesSync.objects.using(db_alias).select_related("profile"):
+        sync.username = sync.profile.username
+        sync.save(using=db_alias, update_fields=["username"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0019_movie_updated_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="favouritessync",
+            name="profile",
+            field=models.OneToOneField(
+                help_text="Profile the favourites were synced for",
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="favourites_sync",
+                to="movies.profile",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="favouritessync",
+            name="username",
+            field=models.CharField(
+                help_text="Letterboxd username the favourites were synced from",
+                max_length=100,
+                null=True,
+                unique=True,
+            ),
+        ),
+        migrations.RunPython(link_syncs_to_profiles, restore_usernames),
+        migrations.AlterField(
+            model_name="favouritessync",
+            name="profile",
+            field=models.OneToOneField(
+                help_text="Profile the favourites were synced for",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="favourites_sync",
+                to="movies.profile",
+            ),
+        ),
+        migrations.RemoveField(
+            model_name="favouritessync",
+            name="username",
+        ),
+    ]
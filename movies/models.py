@@ -1,12 +1,44 @@
+import re
+from typing import Optional
+
 from django.core.validators import MinLengthValidator
 from django.db import models
 
+# Letterboxd film URLs: https://letterboxd.com/film/<slug>/ (favourites links may be /<user>/film/<slug>/)
+FILM_SLUG_PATTERN = re.compile(r'/film/([a-z0-9-]+)/?', re.IGNORECASE)
+YEAR_PATTERN = re.compile(r'^\d{4}$')
+
+
+class Profile(models.Model):
+    username = models.CharField(
+        max_length=100,
+        unique=True,
+        help_text="Letterboxd username"
+    )
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['username']
+        verbose_name = "Profile"
+        verbose_name_plural = "Profiles"
+
+    def __str__(self):
+        return self.username
+
 
 class Movie(models.Model):
     class Status(models.TextChoices):
         SAVED = 'SAVED', 'Saved'
         FAVORITE = 'FAVORITE', 'Favorite'
 
+    profile = models.ForeignKey(
+        Profile,
+        on_delete=models.CASCADE,
+        related_name='movies',
+        help_text="Profile the movie was saved by"
+    )
+    
     title = models.TextField(
         validators=[MinLengthValidator(1)],
         help_text="Full movie title"
@@ -18,6 +50,13 @@ class Movie(models.Model):
         help_text="Release year (YYYY)"
     )
     
+    release_year = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="year as an integer, for range filters and sorting (null if year isn't YYYY)"
+    )
+    
     status = models.CharField(
         max_length=8,
         choices=Status.choices,
@@ -37,14 +76,268 @@ class Movie(models.Model):
         help_text="URL to movie page on Letterboxd"
     )
     
+    blurhash = models.CharField(
+        max_length=64,
+        blank=True,
+        help_text="Blurhash of the poster, shown while it loads"
+    )
+    
+    dominant_color = models.CharField(
+        max_length=7,
+        blank=True,
+        help_text="Dominant poster colour as #rrggbb"
+    )
+    
+    placeholder_image_url = models.URLField(
+        max_length=512,
+        blank=True,
+        help_text="image_url the blurhash and dominant colour were computed from"
+    )
+    
+    slug = models.SlugField(
+        max_length=255,
+        blank=True,
+        db_index=False,
+        help_text="Letterboxd film slug from link_url, unique per profile (blank without a link)"
+    )
+    
+    director = models.CharField(
+        max_length=255,
+        blank=True,
+        help_text="Director name(s), comma separated"
+    )
+    
+    genres = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Genre names from the film page"
+    )
+    
+    runtime = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        help_text="Runtime in minutes"
+    )
+    
+    rating = models.FloatField(
+        null=True,
+        blank=True,
+        help_text="Letterboxd average rating (0-5)"
+    )
+    
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        unique_together = ['title', 'year']
+        unique_together = ['profile', 'title', 'year']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['profile', 'slug'],
+                condition=~models.Q(slug=''),
+                name='movie_profile_slug_unique'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['profile', 'status', '-created_at'], name='movie_profile_status_created'),
+            models.Index(fields=['profile', '-created_at'], name='movie_profile_created'),
+            models.Index(fields=['profile', 'director'], name='movie_profile_director'),
+            models.Index(fields=['profile', 'runtime'], name='movie_profile_runtime'),
+            models.Index(fields=['profile', '-rating'], name='movie_profile_rating'),
+            models.Index(fields=['profile', 'release_year', '-created_at'], name='movie_profile_year'),
+            models.Index(
+                fields=['profile', 'status', 'release_year', '-created_at'],
+                name='movie_profile_status_year'
+            ),
+            # Incremental read snapshot syncs (movies/read_snapshot.py)
+            models.Index(fields=['updated_at'], name='movie_updated'),
+        ]
         ordering = ['-created_at']  # Default ordering for DRF
         verbose_name = "Movie"
         verbose_name_plural = "Movies"
 
     def __str__(self):
-        return f"{self.title} ({self.year})"
\ No newline at end of file
+        return f"{self.title} ({self.year})"
+
+    @staticmethod
+    def slug_from_link_url(link_url: str) -> str:
+        """'https://letterboxd.com/film/bring-her-back/' -> 'bring-her-back'; blank if not a film URL"""
+        match = FILM_SLUG_PATTERN.search(link_url or '')
+        return match.group(1).lower() if match else ''
+
+    @staticmethod
+    def release_year_from(year: str) -> Optional[int]:
+        """'1979' -> 1979; None if year isn't four digits"""
+        return int(year) if isinstance(year, str) and YEAR_PATTERN.match(year) else None
+
+
+class FavouritesSync(models.Model):
+    profile = models.OneToOneField(
+        Profile,
+        on_delete=models.CASCADE,
+        related_name='favourites_sync',
+        help_text="Profile the favourites were synced for"
+    )
+    
+    fingerprint = models.CharField(
+        max_length=64,
+        help_text="SHA-256 of the ordered (title, year, link_url) favourites"
+    )
+    
+    synced_at = models.DateTimeField(help_text="Last sync that wrote changes")
+
+    class Meta:
+        verbose_name = "Favourites sync"
+        verbose_name_plural = "Favourites syncs"
+
+    def __str__(self):
+        return f"{self.profile} @ {self.synced_at:%Y-%m-%d %H:%M}"
+
+
+class MovieStat(models.Model):
+    """
+    Running count of a profile's movies per status, release year and decade
+
+    Kept up to date by every MovieRepository write in the same transaction;
+    `manage.py rebuild_stats` recomputes it from the movies table.
+    """
+
+    class Dimension(models.TextChoices):
+        STATUS = 'status', 'Status'
+        YEAR = 'year', 'Release year'
+        DECADE = 'decade', 'Decade'
+
+    profile = models.ForeignKey(
+        Profile,
+        on_delete=models.CASCADE,
+        related_name='stats',
+        help_text="Profile the counts belong to"
+    )
+    
+    dimension = models.CharField(
+        max_length=8,
+        choices=Dimension.choices,
+        help_text="What the movies are grouped by"
+    )
+    
+    value = models.CharField(
+        max_length=8,
+        blank=True,
+        help_text="Group value, e.g. FAVORITE, 1999 or 1990s (blank when unknown)"
+    )
+    
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ['profile', 'dimension', 'value']
+        verbose_name = "Movie stat"
+        verbose_name_plural = "Movie stats"
+
+    def __str__(self):
+        return f"{self.profile_id} {self.dimension}={self.value}: {self.count}"
+
+
+class MovieEvent(models.Model):
+    """
+    Change log of a profile's movies, streamed by /api/movies/events/
+
+    Written by MovieRepository in the same transaction as the change; the id
+    is the SSE event id clients resume from with Last-Event-ID.
+    `manage.py prune_movie_events` drops entries past EVENTS_RETENTION_HOURS.
+    """
+
+    class Kind(models.TextChoices):
+        CREATED = 'created', 'Created'
+        UPDATED = 'updated', 'Updated'
+        DELETED = 'deleted', 'Deleted'
+
+    profile = models.ForeignKey(
+        Profile,
+        on_delete=models.CASCADE,
+        related_name='events',
+        help_text="Profile whose movie changed"
+    )
+    
+    kind = models.CharField(
+        max_length=7,
+        choices=Kind.choices,
+        help_text="created, updated or deleted"
+    )
+    
+    movie_id = models.BigIntegerField(help_text="Id of the changed movie (kept after it is deleted)")
+    
+    data = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Changed values, e.g. the new status"
+    )
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['profile', 'id'], name='movie_event_profile_id'),
+            models.Index(fields=['created_at'], name='movie_event_created'),
+        ]
+        verbose_name = "Movie event"
+        verbose_name_plural = "Movie events"
+
+    def __str__(self):
+        return f"{self.id} {self.kind} movie {self.movie_id}"
+
+
+class IdempotencyKey(models.Model):
+    """
+    Outcome of a POST sent with an Idempotency-Key header (see movies/idempotency.py)
+
+    The first request claims the key and runs; retries with the same key wait
+    for it and replay its stored response instead of scraping again. Rows
+    expire after IDEMPOTENCY_TTL_HOURS; `manage.py prune_idempotency_keys`
+    deletes them.
+    """
+
+    class State(models.TextChoices):
+        IN_PROGRESS = 'in_progress', 'In progress'
+        COMPLETED = 'completed', 'Completed'
+
+    profile = models.ForeignKey(
+        Profile,
+        on_delete=models.CASCADE,
+        related_name='idempotency_keys',
+        help_text="Profile that sent the request"
+    )
+    
+    key = models.CharField(max_length=255, help_text="Idempotency-Key header value")
+    
+    request_fingerprint = models.CharField(
+        max_length=64,
+        help_text="SHA-256 of method, path and body; a key only replays for the same request"
+    )
+    
+    state = models.CharField(
+        max_length=11,
+        choices=State.choices,
+        default=State.IN_PROGRESS
+    )
+    
+    response_status = models.PositiveSmallIntegerField(null=True, blank=True)
+    
+    response_data = models.JSONField(null=True, blank=True, help_text="Response body to replay")
+    
+    locked_until = models.DateTimeField(
+        help_text="An in-progress key not completed by then is taken over by the next retry"
+    )
+    
+    expires_at = models.DateTimeField(help_text="When the key can be pruned and reused")
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ['profile', 'key']
+        indexes = [
+            models.Index(fields=['expires_at'], name='idempotency_key_expires'),
+        ]
+        verbose_name = "Idempotency key"
+        verbose_name_plural = "Idempotency keys"
+
+    def __str__(self):
+        return f"{self.profile_id}:{self.key} ({self.state})"
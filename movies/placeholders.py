@@ -0,0 +1,167 @@
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Callable, Optional
+
+import requests
+from django.conf import settings
+from django.db import connection
+from django.db.models import F
+from django.utils import timezone
+
+from .list_cache import invalidate_movie_lists
+from .models import Movie, Profile
+from .services import ImageOptimizer
+from .services.placeholder_service import compute_placeholder, placeholders_available
+from .snapshots import schedule_publish
+
+# Smallest poster crop Letterboxd serves; a few KB, plenty for a blurhash
+PLACEHOLDER_IMAGE_WIDTH = 70
+PLACEHOLDER_IMAGE_HEIGHT = 105
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    This process's pool for decoding posters, started on first use
+
+    Uses forkserver children, which import only the placeholder service,
+    rather than forking a worker that has threads and open connections.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=getattr(settings, 'PLACEHOLDER_PROCESSES', 2),
+                mp_context=multiprocessing.get_context('forkserver'),
+            )
+        return _process_pool
+
+
+def close_process_pool() -> None:
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = None
+
+
+def placeholder_image_url(image_url: str) -> str:
+    """The tiny poster variant placeholders are computed from"""
+    return ImageOptimizer().get_optimized_url(image_url, PLACEHOLDER_IMAGE_WIDTH, PLACEHOLDER_IMAGE_HEIGHT)
+
+
+def fetch_poster(movie: Movie) -> bytes:
+    response = requests.get(
+        placeholder_image_url(movie.image_url),
+        timeout=getattr(settings, 'PLACEHOLDER_FETCH_TIMEOUT', 10),
+    )
+    response.raise_for_status()
+    return response.content
+
+
+def refresh_placeholders(profile: Profile, force: bool = False,
+                         fetch: Callable[[Movie], bytes] = fetch_poster,
+                         executor: Optional[Executor] = None) -> int:
+    """
+    Compute blurhash and dominant colour for the profile's posters that need them
+
+    A movie needs them when its image_url has changed since they were last
+    computed (placeholder_image_url). Posters are downloaded here and decoded
+    in the process pool, each submitted as soon as it arrives. A movie whose
+    image_url changed meanwhile isn't overwritten. A poster that fails to
+    download or decode is marked as tried with blank values, so later saves
+    don't fetch it again; force retries it.
+
+    Args:
+        profile: Profile whose movies to update
+        force: Recompute every movie with a poster
+        fetch: Returns a movie's image bytes (e.g. read local fixtures instead of downloading)
+        executor: Runs compute_placeholder (default: this process's process pool)
+
+    Returns:
+        Number of movies updated
+    """
+    movies = Movie.objects.filter(profile=profile).exclude(image_url='')
+    if not force:
+        movies = movies.exclude(placeholder_image_url=F('image_url'))
+    movies = list(movies.only('id', 'image_url', 'slug'))
+    if not movies:
+        return 0
+
+    executor = executor or get_process_pool()
+    futures = {}
+    failed = []
+    for movie in movies:
+        try:
+            futures[executor.submit(compute_placeholder, fetch(movie))] = movie
+        except Exception as e:
+            print(f"Error fetching poster for movie {movie.id}: {e}")
+            failed.append(movie)
+
+    results = [(movie, {}) for movie in failed]
+    for future in as_completed(futures):
+        movie = futures[future]
+        try:
+            results.append((movie, future.result()))
+        except Exception as e:
+            print(f"Error computing placeholder for movie {movie.id}: {e}")
+            results.append((movie, {}))
+
+    updated = 0
+    for movie, placeholder in results:
+        # update() skips auto_now; bump updated_at so read snapshots pick the placeholder up
+        written = Movie.objects.filter(id=movie.id, image_url=movie.image_url).update(
+            blurhash=placeholder.get('blurhash', ''),
+            dominant_color=placeholder.get('dominant_color', ''),
+            placeholder_image_url=movie.image_url,
+            updated_at=timezone.now(),
+        )
+        updated += written if placeholder else 0
+
+    if updated:
+        invalidate_movie_lists(profile)
+        schedule_publish(profile)
+    return updated
+
+
+class PlaceholderRefresher:
+    """
+    Refreshes placeholders on a background thread, off the request path
+
+    Like SnapshotPublisher, runs for a profile that is already queued are
+    coalesced, and a write committing mid-run queues one more.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='placeholders')
+
+    def schedule(self, profile: Profile) -> None:
+        with self._lock:
+            if profile.id in self._pending:
+                return
+            self._pending.add(profile.id)
+        self._executor.submit(self._refresh, profile)
+
+    def _refresh(self, profile: Profile) -> None:
+        with self._lock:
+            self._pending.discard(profile.id)
+        try:
+            refresh_placeholders(profile)
+        except Exception as e:
+            print(f"Error refreshing placeholders for {profile.username}: {e}")
+        finally:
+            connection.close()
+
+
+refresher = PlaceholderRefresher()
+
+
+def schedule_refresh(profile: Profile) -> None:
+    """Refresh the profile's placeholders in the background, if they are enabled and Pillow is installed"""
+    if getattr(settings, 'PLACEHOLDERS_ENABLED', True) and placeholders_available():
+        refresher.schedule(profile)
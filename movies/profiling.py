@@ -0,0 +1,179 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import random
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+# Request header asking for a profile of this request, e.g. `X-Profile: 1`
+PROFILE_HEADER = 'HTTP_X_PROFILE'
+# Response header naming the stored profile
+PROFILE_ID_HEADER = 'X-Profile-Id'
+
+PROFILE_SUFFIX = '.prof'
+METADATA_SUFFIX = '.json'
+
+# cProfile can only be active once per process (it registers as the sys.monitoring profiler),
+# so concurrent profiling requests are served unprofiled instead of waiting
+_profiling_lock = threading.Lock()
+
+
+def _profiles_dir() -> Path:
+    return Path(getattr(settings, 'PROFILING_DIR', settings.BASE_DIR / 'profiles'))
+
+
+def should_profile(request) -> bool:
+    """Profiling enabled, header sent by an authenticated profile, and the request sampled"""
+    if not getattr(settings, 'PROFILING_ENABLED', False):
+        return False
+    if not request.META.get(PROFILE_HEADER) or getattr(request, 'profile', None) is None:
+        return False
+    return random.random() < getattr(settings, 'PROFILING_SAMPLE_RATE', 1.0)
+
+
+def _dump(path: Path, write) -> None:
+    """Write a file under a temporary name and rename it, so listings never see a partial file"""
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    os.close(fd)
+    try:
+        write(temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def save_profile(profiler: cProfile.Profile, metadata: Dict[str, Any]) -> str:
+    """
+    Store a request's profile and its metadata, then prune the oldest beyond PROFILING_MAX_FILES
+
+    Returns:
+        The profile id (its file name without suffix)
+    """
+    directory = _profiles_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    # Timestamp first, so ids sort oldest to newest
+    started = timezone.now().strftime('%Y%m%dT%H%M%S%f')
+    profile_id = f'{started}-{metadata["url_name"] or "unknown"}-{uuid.uuid4().hex[:6]}'
+
+    _dump(directory / f'{profile_id}{PROFILE_SUFFIX}', profiler.dump_stats)
+
+    def write_metadata(temp_path):
+        with open(temp_path, 'w') as metadata_file:
+            json.dump({'id': profile_id, **metadata}, metadata_file)
+    # Metadata last: listings only show profiles whose stats are complete
+    _dump(directory / f'{profile_id}{METADATA_SUFFIX}', write_metadata)
+
+    prune_profiles(getattr(settings, 'PROFILING_MAX_FILES', 50))
+    return profile_id
+
+
+def _stored_metadata_paths() -> List[Path]:
+    """Metadata files of stored profiles, newest first"""
+    directory = _profiles_dir()
+    if not directory.exists():
+        return []
+    return sorted(directory.glob(f'*{METADATA_SUFFIX}'), key=lambda path: path.name, reverse=True)
+
+
+def prune_profiles(keep: int) -> int:
+    """Delete all but the newest `keep` profiles; returns how many were deleted"""
+    stored = _stored_metadata_paths()
+    for metadata_path in stored[keep:]:
+        for path in (metadata_path, metadata_path.with_suffix(PROFILE_SUFFIX)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+    return max(0, len(stored) - keep)
+
+
+def list_profiles(username: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Stored profiles' metadata, newest first, optionally only those requested by username"""
+    profiles = []
+    for metadata_path in _stored_metadata_paths():
+        try:
+            metadata = json.loads(metadata_path.read_text())
+        except (OSError, ValueError):
+            continue  # pruned meanwhile
+        if username is None or metadata.get('username') == username:
+            profiles.append(metadata)
+    return profiles
+
+
+def profile_path(profile_id: str) -> Path:
+    """Path of a stored profile; 'latest' is the newest"""
+    if profile_id == 'latest':
+        profiles = list_profiles()
+        if not profiles:
+            raise FileNotFoundError('No stored profiles')
+        profile_id = profiles[0]['id']
+    path = _profiles_dir() / f'{Path(profile_id).name}{PROFILE_SUFFIX}'
+    if not path.exists():
+        raise FileNotFoundError(f'No stored profile {profile_id}')
+    return path
+
+
+def render_report(profile_id: str, top: int = 20, sort: str = 'cumulative') -> str:
+    """
+    Render the top functions of a stored profile as pstats text
+
+    Args:
+        profile_id: Stored profile id, or 'latest'
+        top: Number of functions to show
+        sort: pstats sort key, e.g. 'cumulative', 'tottime' or 'ncalls'
+    """
+    output = io.StringIO()
+    stats = pstats.Stats(str(profile_path(profile_id)), stream=output)
+    stats.strip_dirs().sort_stats(sort).print_stats(top)
+    return output.getvalue()
+
+
+def profile_request(get_response, request):
+    """
+    Run the rest of the middleware chain and the view under cProfile
+
+    Returns the response, with the stored profile's id in X-Profile-Id; the
+    request runs unprofiled if another profile is in progress.
+    """
+    if not _profiling_lock.acquire(blocking=False):
+        return get_response(request)
+    try:
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            response = get_response(request)
+        finally:
+            profiler.disable()
+        duration_ms = round((time.perf_counter() - start) * 1000, 2)
+    finally:
+        _profiling_lock.release()
+
+    # Streams are produced after the view returns; there is nothing useful to keep
+    if response.streaming:
+        return response
+
+    resolver_match = getattr(request, 'resolver_match', None)
+    try:
+        response[PROFILE_ID_HEADER] = save_profile(profiler, {
+            'url_name': resolver_match.url_name if resolver_match else None,
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'duration_ms': duration_ms,
+            'username': request.profile.username,
+            'created_at': timezone.now().isoformat(),
+        })
+    except Exception as e:
+        print(f"Error saving request profile: {e}")
+    return response
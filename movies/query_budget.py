@@ -0,0 +1,117 @@
+import logging
+import time
+from contextlib import ExitStack, contextmanager
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised when a request runs more queries than its view's budget allows"""
+
+
+class QueryCounter:
+    """
+    Database execute wrapper that counts queries and total DB time
+
+    Installed through ``connection.execute_wrapper`` so every statement run
+    on the wrapped connections goes through ``__call__``.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: List[str] = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.statements.append(sql)
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration * 1000
+
+    def server_timing(self) -> str:
+        """Format the totals as a Server-Timing header value"""
+        return f'db;desc="{self.count} queries";dur={self.duration_ms:.2f}'
+
+
+@contextmanager
+def count_queries(using: Optional[str] = None):
+    """
+    Count queries run on one database alias, or on all of them
+
+    Args:
+        using: Database alias to watch (all configured aliases if None)
+
+    Yields:
+        QueryCounter collecting the queries run inside the block
+    """
+    counter = QueryCounter()
+    aliases = [using] if using else list(connections)
+    with ExitStack() as stack:
+        for alias in aliases:
+            stack.enter_context(connections[alias].execute_wrapper(counter))
+        yield counter
+
+
+@contextmanager
+def assert_max_queries(limit: int, using: Optional[str] = None):
+    """
+    Test helper failing when the block runs more than ``limit`` queries
+
+    Usage:
+        with assert_max_queries(3):
+            client.get('/api/movies/')
+    """
+    with count_queries(using) as counter:
+        yield counter
+    if counter.count > limit:
+        statements = '\n'.join(counter.statements)
+        raise AssertionError(
+            f"{counter.count} queries executed, budget is {limit}:\n{statements}"
+        )
+
+
+def get_query_budget(url_name: Optional[str]) -> Optional[int]:
+    """
+    Get the query budget configured for a view
+
+    Args:
+        url_name: URL pattern name from movies/urls.py
+
+    Returns:
+        Maximum number of queries, or None if the view has no budget
+    """
+    budgets = getattr(settings, 'QUERY_BUDGETS', {})
+    if url_name in budgets:
+        return budgets[url_name]
+    return getattr(settings, 'QUERY_BUDGET_DEFAULT', None)
+
+
+def check_query_budget(url_name: Optional[str], counter: QueryCounter) -> None:
+    """
+    Enforce the view's budget against the queries a request ran
+
+    Raises QueryBudgetExceeded when QUERY_BUDGET_STRICT is enabled (tests),
+    otherwise logs an error so production keeps serving.
+    """
+    budget = get_query_budget(url_name)
+    if budget is None or counter.count <= budget:
+        return
+
+    message = (
+        f"Query budget exceeded for '{url_name}': "
+        f"{counter.count} queries (budget {budget}) in {counter.duration_ms:.2f}ms"
+    )
+    if getattr(settings, 'QUERY_BUDGET_STRICT', False):
+        raise QueryBudgetExceeded(message)
+    logger.error(message)
@@ -0,0 +1,359 @@
+import fcntl
+import functools
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+
+SNAPSHOT_DB_ALIAS = 'read_snapshot'
+# Models copied into the snapshot; reads of any other model keep going to the replica or primary
+SNAPSHOT_MODELS = {'movies.profile', 'movies.movie'}
+# Sync progress, kept inside the snapshot so it commits with the rows it describes
+META_TABLE = 'read_snapshot_meta'
+UPSERT_BATCH_SIZE = 500
+
+_state_cache: Dict[str, Any] = {'mtime_ns': None, 'state': None}
+_state_cache_lock = threading.Lock()
+
+
+def snapshot_enabled() -> bool:
+    return getattr(settings, 'READ_SNAPSHOT', True) and SNAPSHOT_DB_ALIAS in settings.DATABASES
+
+
+def max_staleness() -> float:
+    return getattr(settings, 'READ_SNAPSHOT_MAX_STALENESS', 30)
+
+
+def _snapshot_path() -> Path:
+    return Path(settings.DATABASES[SNAPSHOT_DB_ALIAS]['NAME'])
+
+
+def _state_path() -> Path:
+    path = _snapshot_path()
+    return path.with_name(f'{path.name}.state')
+
+
+def _lock_path() -> Path:
+    path = _snapshot_path()
+    return path.with_name(f'{path.name}.lock')
+
+
+def _models():
+    from .models import Movie, Profile
+
+    return Profile, Movie
+
+
+@functools.lru_cache(maxsize=None)
+def schema_fingerprint() -> str:
+    """Hash of the copied tables' columns, so a deploy that changes them rebuilds the snapshot"""
+    columns = [
+        f'{model._meta.db_table}.{field.column}:{field.get_internal_type()}'
+        for model in _models() for field in model._meta.concrete_fields
+    ]
+    return hashlib.sha256('\n'.join(columns).encode()).hexdigest()[:16]
+
+
+def snapshot_state() -> Optional[Dict[str, Any]]:
+    """
+    The state file the syncing worker writes after each committed sync, or None
+
+    Re-read only when its mtime changes, so checking freshness costs a stat().
+    """
+    try:
+        mtime_ns = os.stat(_state_path()).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    with _state_cache_lock:
+        if _state_cache['mtime_ns'] != mtime_ns:
+            try:
+                state = json.loads(_state_path().read_text())
+            except (OSError, ValueError):
+                return None  # replaced meanwhile
+            _state_cache.update(mtime_ns=mtime_ns, state=state)
+        return _state_cache['state']
+
+
+def snapshot_usable(last_write: Optional[float] = None) -> bool:
+    """
+    Whether lag-tolerant reads may be served from the snapshot
+
+    It must have synced within READ_SNAPSHOT_MAX_STALENESS seconds, with
+    this code's schema, and (for a profile that wrote recently) have started
+    that sync after the write, so a client always reads its own writes.
+
+    Args:
+        last_write: time.time() of the profile's latest write, if still remembered
+    """
+    if not snapshot_enabled():
+        return False
+    ensure_syncer()
+    state = snapshot_state()
+    if state is None or state.get('schema') != schema_fingerprint():
+        return False
+    synced_from = state['synced_from']
+    if time.time() - synced_from > max_staleness():
+        return False
+    return last_write is None or synced_from > last_write
+
+
+def snapshot_status() -> Dict[str, Any]:
+    """Age and size of this host's snapshot, for the health endpoint"""
+    state = snapshot_state()
+    if state is None:
+        return {'usable': False, 'state': 'not synced'}
+    return {
+        'usable': snapshot_usable(),
+        'age_seconds': round(time.time() - state['synced_from'], 1),
+        'movies': state.get('movies'),
+        'last_full_sync': state.get('last_full_sync'),
+        'synced_by_pid': state.get('pid'),
+    }
+
+
+def _write_state(state: Dict[str, Any]) -> None:
+    """Replace the state file atomically, so readers never see a partial one"""
+    path = _state_path()
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as state_file:
+            json.dump(state, state_file)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _upsert(cursor, model, rows: Iterable[Sequence[Any]]) -> int:
+    """
+    INSERT ... ON CONFLICT (id) DO UPDATE rows of attname values into the snapshot
+
+    Raw SQL rather than bulk_create, which would stamp created_at and
+    updated_at with the time of the copy.
+    """
+    connection = connections[SNAPSHOT_DB_ALIAS]
+    fields = model._meta.concrete_fields
+    quote = connection.ops.quote_name
+    columns = ', '.join(quote(field.column) for field in fields)
+    updates = ', '.join(
+        f'{quote(field.column)} = EXCLUDED.{quote(field.column)}' for field in fields if not field.primary_key
+    )
+    sql = (
+        f'INSERT INTO {quote(model._meta.db_table)} ({columns}) VALUES ({", ".join(["%s"] * len(fields))}) '
+        f'ON CONFLICT ({quote(model._meta.pk.column)}) DO UPDATE SET {updates}'
+    )
+
+    written = 0
+    batch: List[List[Any]] = []
+    for row in rows:
+        batch.append([field.get_db_prep_save(value, connection) for field, value in zip(fields, row)])
+        if len(batch) >= UPSERT_BATCH_SIZE:
+            cursor.executemany(sql, batch)
+            written, batch = written + len(batch), []
+    if batch:
+        cursor.executemany(sql, batch)
+        written += len(batch)
+    return written
+
+
+def _delete_ids(cursor, model, ids: Sequence[int]) -> None:
+    quote = connections[SNAPSHOT_DB_ALIAS].ops.quote_name
+    for start in range(0, len(ids), UPSERT_BATCH_SIZE):
+        chunk = ids[start:start + UPSERT_BATCH_SIZE]
+        cursor.execute(
+            f'DELETE FROM {quote(model._meta.db_table)} WHERE {quote(model._meta.pk.column)} '
+            f'IN ({", ".join(["%s"] * len(chunk))})',
+            list(chunk)
+        )
+
+
+def _drop_deleted_profiles(cursor, profile_ids: Sequence[int]) -> None:
+    """Remove profiles no longer on the primary, and their movies (profile deletes leave no tombstones)"""
+    Profile, Movie = _models()
+    quote = connections[SNAPSHOT_DB_ALIAS].ops.quote_name
+    profile_column = quote(Movie._meta.get_field('profile').column)
+    # SQLite allows an empty list, so with no profiles left everything goes
+    kept = f'({", ".join(["%s"] * len(profile_ids))})'
+    cursor.execute(
+        f'DELETE FROM {quote(Movie._meta.db_table)} WHERE {profile_column} NOT IN {kept}', list(profile_ids)
+    )
+    cursor.execute(
+        f'DELETE FROM {quote(Profile._meta.db_table)} WHERE {quote(Profile._meta.pk.column)} NOT IN {kept}',
+        list(profile_ids)
+    )
+
+
+class SnapshotSyncer(threading.Thread):
+    """
+    Keeps this host's read snapshot in step with the primary
+
+    One worker per host holds an flock on the snapshot and writes it; the
+    others retry the lock every interval, taking over if the holder dies.
+    The first sync (and any after a schema change, or once the tombstones it
+    relies on may have been pruned) copies every profile and movie. After
+    that, each pass copies movies whose updated_at is at or after the
+    watermark less READ_SNAPSHOT_OVERLAP_SECONDS, which catches transactions
+    that committed after a later one, and drops movies with a DELETED event
+    in the movie event log, the tombstone table. Each pass commits in one
+    transaction; in WAL mode readers keep seeing the previous state until it
+    does.
+    """
+
+    def __init__(self):
+        super().__init__(name='read-snapshot-syncer', daemon=True)
+        self._lock_file = None
+
+    def run(self):
+        while True:
+            try:
+                if self._acquire_lock():
+                    self.sync_once()
+            except Exception as e:
+                print(f"Read snapshot sync error: {e}")
+            finally:
+                # Hand the primary connection back (or to the pool) between passes
+                connections[DEFAULT_DB_ALIAS].close()
+            time.sleep(getattr(settings, 'READ_SNAPSHOT_INTERVAL', 2))
+
+    def _acquire_lock(self) -> bool:
+        if self._lock_file is not None:
+            return True
+        lock_path = _lock_path()
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(lock_path, 'a')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            return False
+        # Held until this process exits
+        self._lock_file = lock_file
+        return True
+
+    def _read_meta(self, cursor) -> Dict[str, str]:
+        cursor.execute(f'CREATE TABLE IF NOT EXISTS {META_TABLE} (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+        cursor.execute(f'SELECT key, value FROM {META_TABLE}')
+        return dict(cursor.fetchall())
+
+    def _needs_full_sync(self, meta: Dict[str, str], now: datetime) -> bool:
+        if meta.get('schema') != schema_fingerprint() or 'tombstones_since' not in meta:
+            return True
+        # Deletes older than the event log's retention may have been pruned unseen
+        retention = timedelta(hours=getattr(settings, 'EVENTS_RETENTION_HOURS', 24))
+        return datetime.fromisoformat(meta['tombstones_since']) < now - retention
+
+    def _schema_sql(self) -> List[str]:
+        """CREATE statements for the copied tables, collected outside a transaction (SQLite requires it)"""
+        with connections[SNAPSHOT_DB_ALIAS].schema_editor(collect_sql=True, atomic=False) as editor:
+            for model in _models():
+                editor.create_model(model)
+        return editor.collected_sql
+
+    def sync_once(self) -> Dict[str, Any]:
+        """
+        Run one sync pass
+
+        Returns:
+            The state written for readers
+        """
+        from .models import MovieEvent
+
+        Profile, Movie = _models()
+        snapshot = connections[SNAPSHOT_DB_ALIAS]
+        quote = snapshot.ops.quote_name
+        with snapshot.cursor() as cursor:
+            cursor.execute('PRAGMA journal_mode=WAL')
+            meta = self._read_meta(cursor)
+
+        # Times taken before reading the primary: everything committed earlier is in this pass
+        synced_from = time.time()
+        now = timezone.now()
+        full = self._needs_full_sync(meta, now)
+        schema_sql = self._schema_sql() if full else []
+        overlap = timedelta(seconds=getattr(settings, 'READ_SNAPSHOT_OVERLAP_SECONDS', 10))
+        primary_movies = Movie.objects.using(DEFAULT_DB_ALIAS)
+        if not full:
+            primary_movies = primary_movies.filter(
+                updated_at__gte=datetime.fromisoformat(meta['movies_since']) - overlap
+            )
+        movie_attnames = [field.attname for field in Movie._meta.concrete_fields]
+        watermark = datetime.fromisoformat(meta['movies_since']) if not full else None
+
+        with transaction.atomic(using=SNAPSHOT_DB_ALIAS), snapshot.cursor() as cursor:
+            if full:
+                for model in reversed(_models()):
+                    cursor.execute(f'DROP TABLE IF EXISTS {quote(model._meta.db_table)}')
+                for statement in schema_sql:
+                    cursor.execute(statement)
+            else:
+                deleted_ids = list(MovieEvent.objects.using(DEFAULT_DB_ALIAS).filter(
+                    kind=MovieEvent.Kind.DELETED,
+                    created_at__gte=datetime.fromisoformat(meta['tombstones_since']) - overlap,
+                ).values_list('movie_id', flat=True))
+                _delete_ids(cursor, Movie, deleted_ids)
+
+            # Profiles are few: copy them all, and drop any deleted (with their movies)
+            profiles = list(Profile.objects.using(DEFAULT_DB_ALIAS).values_list(
+                *[field.attname for field in Profile._meta.concrete_fields]
+            ))
+            _upsert(cursor, Profile, profiles)
+            _drop_deleted_profiles(cursor, [row[0] for row in profiles])
+
+            def movie_rows():
+                nonlocal watermark
+                updated_at_index = movie_attnames.index('updated_at')
+                for row in primary_movies.values_list(*movie_attnames).iterator(chunk_size=2000):
+                    updated = row[updated_at_index]
+                    watermark = max(watermark, updated) if watermark else updated
+                    yield row
+            copied = _upsert(cursor, Movie, movie_rows())
+
+            cursor.execute(f'SELECT COUNT(*) FROM {quote(Movie._meta.db_table)}')
+            movie_count = cursor.fetchone()[0]
+            new_meta = {
+                'schema': schema_fingerprint(),
+                'tombstones_since': now.isoformat(),
+                'movies_since': (watermark or now).isoformat(),
+            }
+            if full:
+                new_meta['last_full_sync'] = now.isoformat()
+            cursor.executemany(
+                f'INSERT INTO {META_TABLE} (key, value) VALUES (%s, %s) '
+                f'ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value',
+                list(new_meta.items())
+            )
+
+        state = {
+            'schema': schema_fingerprint(),
+            'synced_from': synced_from,
+            'movies': movie_count,
+            'copied': copied,
+            'last_full_sync': new_meta.get('last_full_sync', meta.get('last_full_sync')),
+            'pid': os.getpid(),
+        }
+        _write_state(state)
+        return state
+
+
+_syncer: Optional[SnapshotSyncer] = None
+_syncer_lock = threading.Lock()
+
+
+def ensure_syncer() -> None:
+    """Start this process's syncer the first time a read could use the snapshot"""
+    global _syncer
+    if _syncer is not None:
+        return
+    with _syncer_lock:
+        if _syncer is None:
+            _syncer = SnapshotSyncer()
+            _syncer.start()
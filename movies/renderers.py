@@ -0,0 +1,39 @@
+import datetime
+import decimal
+from importlib.util import find_spec
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+
+def _encode_default(obj):
+    """Encode the types msgpack doesn't know the way DRF's JSON encoder does"""
+    if isinstance(obj, datetime.datetime):
+        representation = obj.isoformat()
+        return representation[:-6] + 'Z' if representation.endswith('+00:00') else representation
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    raise TypeError(f"Cannot encode {type(obj).__name__} as MessagePack")
+
+
+class MessagePackRenderer(BaseRenderer):
+    """Renders data as MessagePack; needs the optional msgpack package"""
+
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        import msgpack
+
+        if data is None:
+            return b''
+        return msgpack.packb(data, use_bin_type=True, default=_encode_default)
+
+
+# Renderers for the list endpoints: JSON, plus MessagePack when msgpack is installed
+LIST_RENDERER_CLASSES = [JSONRenderer]
+if find_spec('msgpack') is not None:
+    LIST_RENDERER_CLASSES.append(MessagePackRenderer)
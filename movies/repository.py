@@ -1,44 +1,252 @@
-from typing import Any, Dict, List, Optional
+import hashlib
+import json
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from django.db import transaction
+from django.db import connection, models, transaction
+from django.utils import timezone
 
-from .models import Movie
+from .db_router import mark_recent_write, reads_from_replica
+from .events import record_movie_events
+from .list_cache import invalidate_movie_lists
+from .models import FavouritesSync, Movie, MovieEvent, MovieStat, Profile
+from .placeholders import schedule_refresh
 from .serializers import MovieSerializer
+from .snapshots import schedule_publish
+from .stats import (
+    StatDeltas,
+    apply_stat_deltas,
+    movie_deltas,
+    rebuild_profile_stats,
+    status_change_deltas,
+    summarize_stats,
+)
+
+# Fields a list request may project to, in MovieSerializer order
+MOVIE_FIELDS = tuple(MovieSerializer.Meta.fields)
+
+# Film page metadata save_movie can write alongside the scraped basics
+METADATA_FIELDS = ('director', 'genres', 'runtime', 'rating')
+
+# Poster placeholders, written by movies/placeholders.py after a save commits
+PLACEHOLDER_FIELDS = ('blurhash', 'dominant_color', 'placeholder_image_url')
+
+# A stored movie with all of these set needs no scrape to be re-added
+COMPLETE_FIELDS = ('title', 'year', 'image_url', 'link_url', 'director', 'genres')
+
+
+def _created_event(movie_id: int, title: str, year: str, status: str) -> Tuple[int, Dict[str, Any]]:
+    """(movie id, data) of a created event"""
+    return movie_id, {'title': title, 'year': year, 'status': str(status)}
+
+
+class SaveOutcome(str, Enum):
+    """What a write did to the profile's movies (save_movie returns it for its row)"""
+    CREATED = 'created'
+    UPDATED = 'updated'
+    DELETED = 'deleted'
+    UNCHANGED = 'unchanged'
+
+
+# ?order= values of the list endpoints; created_at breaks ties so pages are stable
+LIST_ORDERS = {
+    '-created_at': ('-created_at',),
+    'created_at': ('created_at',),
+    'year': ('release_year', '-created_at'),
+    '-year': ('-release_year', '-created_at'),
+    'title': ('title', 'year'),
+    '-title': ('-title', '-year'),
+}
+YEAR_RANGE = (1870, 2100)
+
+
+@dataclass(frozen=True)
+class MovieListFilters:
+    """
+    Validated year/status filters and ordering for the list endpoints
+    
+    Year filters use the integer release_year column, so ranges are served
+    by the (profile, [status,] release_year, -created_at) indexes; movies
+    without a four-digit year never match one.
+    """
+    year_min: Optional[int] = None
+    year_max: Optional[int] = None
+    status: Optional[str] = None
+    order: str = '-created_at'
+    
+    @classmethod
+    def from_params(cls, params) -> Optional['MovieListFilters']:
+        """
+        Read year_min, year_max, decade (e.g. 1970 or 1970s), status and order
+        from query params. Returns None when none are given.
+        
+        Raises:
+            ValueError: With a message for the client, if a param is invalid
+        """
+        names = ('year_min', 'year_max', 'decade', 'status', 'order')
+        if not any(params.get(name) for name in names):
+            return None
+        
+        def year_param(name):
+            value = params.get(name, '').strip().lower()
+            if name == 'decade':
+                value = value.removesuffix('s')
+            if not value:
+                return None
+            if not value.isdigit() or not YEAR_RANGE[0] <= int(value) <= YEAR_RANGE[1]:
+                raise ValueError(f'{name} must be a year between {YEAR_RANGE[0]} and {YEAR_RANGE[1]}')
+            return int(value)
+        
+        year_min, year_max, decade = year_param('year_min'), year_param('year_max'), year_param('decade')
+        if decade is not None:
+            if decade % 10:
+                raise ValueError('decade must be a multiple of ten, e.g. 1970 or 1970s')
+            # A decade narrows any explicit bounds
+            year_min = max(decade, year_min or decade)
+            year_max = min(decade + 9, year_max if year_max is not None else decade + 9)
+        if year_min is not None and year_max is not None and year_min > year_max:
+            raise ValueError('year_min must not be after year_max')
+        
+        status = params.get('status') or None
+        if status is not None and status not in Movie.Status.values:
+            raise ValueError('Invalid status. Must be SAVED or FAVORITE')
+        
+        order = params.get('order') or '-created_at'
+        if order not in LIST_ORDERS:
+            raise ValueError(f'order must be one of: {", ".join(LIST_ORDERS)}')
+        
+        return cls(year_min, year_max, status, order)
+    
+    def apply(self, queryset):
+        """Filter and order a queryset of one profile's movies"""
+        if self.year_min is not None:
+            queryset = queryset.filter(release_year__gte=self.year_min)
+        if self.year_max is not None:
+            queryset = queryset.filter(release_year__lte=self.year_max)
+        if self.status is not None:
+            queryset = queryset.filter(status=self.status)
+        return queryset.order_by(*LIST_ORDERS[self.order])
+    
+    def cache_key(self) -> str:
+        """Part of the list cache key identifying these filters"""
+        return f'{self.year_min or ""}-{self.year_max or ""}:{self.status or ""}:{self.order}'
+
+
+def _list_queryset(queryset, filters: Optional[MovieListFilters]):
+    """A list read's queryset, filtered and ordered, newest first by default"""
+    return filters.apply(queryset) if filters is not None else queryset.order_by('-created_at')
 
 
 class MovieRepository:
     
     @staticmethod
-    def serialize_movies(movies: List[Movie]) -> List[Dict[str, Any]]:
-        """Helper method to serialize movies using DRF serializer"""
-        serializer = MovieSerializer(movies, many=True)
-        return serializer.data
+    def serialize_movies(movies, fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Helper method to serialize movies using DRF serializer.
+        With fields, a queryset only selects those columns and skips the
+        serializer, formatting values the same way it would.
+        """
+        if fields is None:
+            serializer = MovieSerializer(movies, many=True)
+            return serializer.data
+        
+        serializer_fields = MovieSerializer().fields
+        converters = [
+            serializer_fields[field].to_representation
+            if isinstance(Movie._meta.get_field(field), models.DateTimeField) else None
+            for field in fields
+        ]
+        return [
+            {
+                field: value if convert is None or value is None else convert(value)
+                for field, convert, value in zip(fields, converters, row)
+            }
+            for row in movies.values_list(*fields)
+        ]
+    
+    @staticmethod
+    def fingerprint_favourites(movies_data: List[Dict[str, Any]]) -> str:
+        """
+        Hash the ordered (title, year, link_url) tuples of scraped favourites.
+        Image URLs are left out so poster resizing never counts as a change.
+        """
+        rows = [
+            [movie.get('title', ''), movie.get('year', ''), movie.get('link_url', '')]
+            for movie in movies_data
+        ]
+        return hashlib.sha256(json.dumps(rows).encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def get_favourites_sync(profile: Profile) -> Optional[FavouritesSync]:
+        """
+        Get the last favourites sync recorded for a profile.
+        Returns None if the profile was never synced.
+        """
+        try:
+            return FavouritesSync.objects.filter(profile=profile).first()
+        except Exception as e:
+            print(f"Error getting favourites sync: {e}")
+            return None
     
     @staticmethod
-    def save_favourites(movies_data: List[Dict[str, Any]]) -> bool:
+    def save_favourites(profile: Profile, movies_data: List[Dict[str, Any]],
+                        fingerprint: Optional[str] = None) -> bool:
         """
-        Save favorite movies to the database.
+        Save a profile's favorite movies to the database.
         If a movie already exists with FAVORITE status, it will not be updated.
+        When a fingerprint is given, the sync is recorded in the same
+        transaction so the next unchanged sync can be skipped.
         """
         try:
             with transaction.atomic():
+                deltas = StatDeltas()
+                created, updated = [], []
                 for movie_data in movies_data:
                     title = movie_data.get('title')
                     year = movie_data.get('year')
+                    slug = Movie.slug_from_link_url(movie_data.get('link_url', ''))
                     
                     try:
-                        existing_movie = Movie.objects.get(title=title, year=year)
+                        # The slug is the film's stable identity; titles can change on Letterboxd
+                        lookup = {'slug': slug} if slug else {'title': title, 'year': year}
+                        existing_movie = Movie.objects.select_for_update().get(profile=profile, **lookup)
                         if existing_movie.status == Movie.Status.FAVORITE:
                             continue
+                        deltas.update(status_change_deltas([(existing_movie.status, Movie.Status.FAVORITE)]))
                         existing_movie.status = Movie.Status.FAVORITE
                         existing_movie.save()
+                        updated.append((existing_movie.id, {'status': Movie.Status.FAVORITE.value}))
                     except Movie.DoesNotExist:
-                        Movie.objects.create(
+                        movie = Movie.objects.create(
+                            profile=profile,
                             title=title,
                             year=year,
+                            release_year=Movie.release_year_from(year),
                             status=Movie.Status.FAVORITE,
                             image_url=movie_data.get('image_url', ''),
                             link_url=movie_data.get('link_url', ''),
+                            slug=slug,
+                        )
+                        deltas.update(movie_deltas([(Movie.Status.FAVORITE, year)]))
+                        created.append(_created_event(movie.id, title, year, Movie.Status.FAVORITE))
+                
+                apply_stat_deltas(profile.id, deltas)
+                record_movie_events(profile.id, MovieEvent.Kind.CREATED, created)
+                record_movie_events(profile.id, MovieEvent.Kind.UPDATED, updated)
+                outcome = SaveOutcome.UPDATED if created or updated else SaveOutcome.UNCHANGED
+                MovieRepository._after_write(profile, outcome, posters=True)
+                
+                if fingerprint:
+                    synced = FavouritesSync.objects.filter(profile=profile).update(
+                        fingerprint=fingerprint,
+                        synced_at=timezone.now(),
+                    )
+                    if not synced:
+                        FavouritesSync.objects.create(
+                            profile=profile,
+                            fingerprint=fingerprint,
+                            synced_at=timezone.now(),
                         )
                 return True
         except Exception as e:
@@ -46,101 +254,488 @@ class MovieRepository:
             return False
     
     @staticmethod
-    def get_favourites() -> List[Dict[str, Any]]:
+    @reads_from_replica
+    def get_favourites(profile: Profile, fields: Optional[Sequence[str]] = None,
+                       filters: Optional[MovieListFilters] = None) -> List[Dict[str, Any]]:
         """
-        Get favorite movies from the database.
-        Returns serialized data using DRF serializer.
+        Get a profile's favorite movies from the database.
+        Returns serialized data, limited to fields and filters if given.
         """
         try:
-            favorites = Movie.objects.filter(
+            favorites = _list_queryset(Movie.objects.filter(
+                profile=profile,
                 status=Movie.Status.FAVORITE
-            ).order_by('-created_at')
-            return MovieRepository.serialize_movies(favorites)
+            ), filters)
+            return MovieRepository.serialize_movies(favorites, fields)
         except Exception as e:
             print(f"Error getting favorites data: {e}")
             return []
     
     @staticmethod
-    def save_movie(title: str, year: str, image_url: str, link_url: str, 
-                   status: str = Movie.Status.SAVED) -> Optional[Movie]:
+    def save_movie(profile: Profile, title: str, year: str, image_url: str, link_url: str, 
+                   status: str = Movie.Status.SAVED,
+                   metadata: Optional[Dict[str, Any]] = None
+                   ) -> Tuple[Optional[Movie], Optional[SaveOutcome]]:
         """
-        Save a single movie to the database.
-        Returns the model instance (not serialized).
+        Save a single movie to a profile in the database.
+        The row is only written when status, image_url, link_url (and the slug
+        derived from it) or a given metadata field (director, genres, runtime,
+        rating) differ, so re-saving identical scraped data leaves updated_at
+        untouched.
+        Returns the model instance (not serialized) and the SaveOutcome,
+        or (None, None) on failure.
         """
+        values = {'status': status, 'image_url': image_url, 'link_url': link_url}
+        slug = Movie.slug_from_link_url(link_url)
+        if slug:
+            values['slug'] = slug
+        values.update({field: metadata[field] for field in METADATA_FIELDS if field in (metadata or {})})
+        
         try:
-            movie, created = Movie.objects.update_or_create(
-                title=title,
-                year=year,
-                defaults={
-                    'status': status,
-                    'image_url': image_url,
-                    'link_url': link_url,
-                }
-            )
-            return movie
+            if connection.vendor == 'postgresql':
+                upsert = MovieRepository._upsert_movie_postgres
+            else:
+                upsert = MovieRepository._upsert_movie_orm
+            with transaction.atomic():
+                # The slug is the film's stable identity; titles and years can change on Letterboxd
+                followed = SaveOutcome.UNCHANGED
+                if slug:
+                    followed = MovieRepository._follow_slug(profile, slug, title, year)
+                    if followed is None:
+                        del values['slug']
+                movie, outcome = upsert(profile, title, year, values)
+                if followed == SaveOutcome.UPDATED and outcome == SaveOutcome.UNCHANGED:
+                    # Only the title or year moved, but the row did change
+                    outcome = SaveOutcome.UPDATED
+                MovieRepository._after_write(profile, outcome, posters=True)
+                return movie, outcome
         except Exception as e:
             print(f"Error saving movie: {e}")
+            return None, None
+    
+    @staticmethod
+    def _follow_slug(profile: Profile, slug: str, title: str, year: str) -> Optional[SaveOutcome]:
+        """
+        Move the profile's movie with this slug to the given title and year,
+        so the upsert on (profile, title, year) finds it instead of inserting
+        a second row with the same slug.
+        Returns UPDATED when it moved the row, UNCHANGED when there was
+        nothing to move, or None when another row already has that title
+        and year; the slug then stays where it is.
+        """
+        movie = Movie.objects.select_for_update().filter(profile=profile, slug=slug).exclude(slug='').first()
+        if movie is None or (movie.title, movie.year) == (title, year):
+            return SaveOutcome.UNCHANGED
+        if Movie.objects.filter(profile=profile, title=title, year=year).exists():
             return None
+        
+        deltas = movie_deltas([(movie.status, movie.year)], sign=-1)
+        deltas.update(movie_deltas([(movie.status, year)]))
+        apply_stat_deltas(profile.id, deltas)
+        movie.title, movie.year, movie.release_year = title, year, Movie.release_year_from(year)
+        movie.save(update_fields=['title', 'year', 'release_year', 'updated_at'])
+        record_movie_events(profile.id, MovieEvent.Kind.UPDATED, [(movie.id, {'title': title, 'year': year})])
+        return SaveOutcome.UPDATED
+    
+    @staticmethod
+    def _upsert_movie_postgres(profile: Profile, title: str, year: str,
+                               values: Dict[str, Any]) -> Tuple[Movie, SaveOutcome]:
+        """
+        Compare-and-write upsert in one statement.
+        ON CONFLICT only updates when one of the given values differs;
+        RETURNING (xmax = 0) tells an insert from an update, and no row back
+        means unchanged. A CTE locks the existing row and reads the status it
+        moves from (the pre-image) for the stat counts, in the same round trip.
+        """
+        qn = connection.ops.quote_name
+        table = qn(Movie._meta.db_table)
+        concrete_fields = Movie._meta.concrete_fields
+        now = timezone.now()
+        
+        # Columns added since the table was created have no database default, so inserts always write them
+        insert_values = {
+            field: Movie._meta.get_field(field).get_default()
+            for field in ('slug', *PLACEHOLDER_FIELDS, *METADATA_FIELDS)
+        }
+        insert_values['release_year'] = Movie.release_year_from(year)
+        insert_values.update(values)
+        insert_fields = [Movie._meta.get_field(name) for name in insert_values]
+        insert_columns = ['"profile_id"', '"title"', '"year"', *(qn(field.column) for field in insert_fields),
+                          '"created_at"', '"updated_at"']
+        update_columns = [qn(Movie._meta.get_field(name).column) for name in values]
+        
+        # Always one row: the pre-image status, then the upserted row's columns and (xmax = 0),
+        # all NULL when the row was left unchanged
+        sql = f"""
+            WITH previous AS (
+                SELECT "status" FROM {table}
+                WHERE "profile_id" = %s AND "title" = %s AND "year" = %s
+                FOR UPDATE
+            ), upserted AS (
+                INSERT INTO {table} ({", ".join(insert_columns)})
+                VALUES ({", ".join(["%s"] * len(insert_columns))})
+                ON CONFLICT ("profile_id", "title", "year") DO UPDATE SET
+                    {", ".join(f'{column} = EXCLUDED.{column}' for column in update_columns)},
+                    "updated_at" = EXCLUDED."updated_at"
+                WHERE ({", ".join(f'{table}.{column}' for column in update_columns)})
+                    IS DISTINCT FROM ({", ".join(f'EXCLUDED.{column}' for column in update_columns)})
+                    AND EXISTS (SELECT 1 FROM previous)
+                RETURNING {", ".join(qn(field.column) for field in concrete_fields)}, (xmax = 0) AS "inserted"
+            )
+            SELECT (SELECT "status" FROM previous), upserted.*
+            FROM (SELECT 1) AS one LEFT JOIN upserted ON TRUE
+        """
+        params = [
+            profile.id, title, year,
+            profile.id, title, year,
+            *(field.get_db_prep_save(insert_values[field.name], connection) for field in insert_fields),
+            now, now,
+        ]
+        status = values['status']
+        
+        # Part of save_movie's transaction, so no savepoint of its own
+        with transaction.atomic(savepoint=False):
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                row = cursor.fetchone()
+                if row[0] is None and row[-1] is None:
+                    # A concurrent insert committed after this statement's snapshot: the conflict found a
+                    # row the pre-image couldn't see, so nothing was written. The next statement sees it
+                    cursor.execute(sql, params)
+                    row = cursor.fetchone()
+            
+            previous_status, row = row[0], row[1:]
+            if row[-1] is None:
+                return Movie.objects.get(profile=profile, title=title, year=year), SaveOutcome.UNCHANGED
+            
+            # RETURNING lists the concrete fields in order, so row[0] is the id
+            if row[-1]:
+                apply_stat_deltas(profile.id, movie_deltas([(status, year)]))
+                record_movie_events(profile.id, MovieEvent.Kind.CREATED, [
+                    _created_event(row[0], title, year, status)
+                ])
+            else:
+                apply_stat_deltas(profile.id, status_change_deltas([(previous_status, status)]))
+                record_movie_events(profile.id, MovieEvent.Kind.UPDATED, [(row[0], values)])
+        
+        # Raw rows skip the ORM's converters (e.g. JSON decoding), so apply them here
+        field_values = [
+            field.from_db_value(value, None, connection) if hasattr(field, 'from_db_value') else value
+            for field, value in zip(concrete_fields, row[:-1])
+        ]
+        movie = Movie.from_db(connection.alias, [field.attname for field in concrete_fields], field_values)
+        return movie, SaveOutcome.CREATED if row[-1] else SaveOutcome.UPDATED
+    
+    @staticmethod
+    def _upsert_movie_orm(profile: Profile, title: str, year: str,
+                          values: Dict[str, Any]) -> Tuple[Movie, SaveOutcome]:
+        """Compare-and-write fallback for databases without xmax (SQLite)"""
+        status = values['status']
+        
+        with transaction.atomic(savepoint=False):
+            movie = Movie.objects.select_for_update().filter(profile=profile, title=title, year=year).first()
+            if movie is None:
+                movie = Movie.objects.create(
+                    profile=profile, title=title, year=year,
+                    release_year=Movie.release_year_from(year), **values
+                )
+                apply_stat_deltas(profile.id, movie_deltas([(status, year)]))
+                record_movie_events(profile.id, MovieEvent.Kind.CREATED, [
+                    _created_event(movie.id, title, year, status)
+                ])
+                return movie, SaveOutcome.CREATED
+            
+            changed = [field for field, value in values.items() if getattr(movie, field) != value]
+            if not changed:
+                return movie, SaveOutcome.UNCHANGED
+            
+            apply_stat_deltas(profile.id, status_change_deltas([(movie.status, status)]))
+            for field in changed:
+                setattr(movie, field, values[field])
+            movie.save(update_fields=changed + ['updated_at'])
+            record_movie_events(profile.id, MovieEvent.Kind.UPDATED, [
+                (movie.id, {field: values[field] for field in changed})
+            ])
+            return movie, SaveOutcome.UPDATED
     
     @staticmethod
-    def get_all_movies() -> List[Dict[str, Any]]:
+    def get_movie_by_slug(profile: Profile, slug: str) -> Optional[Movie]:
         """
-        Get all movies regardless of status.
-        Returns serialized data using DRF serializer.
+        Get a profile's movie by its Letterboxd slug (an indexed lookup).
+        Reads the primary, so a just-saved movie is found.
+        Returns None if it isn't stored or on failure.
         """
         try:
-            movies = Movie.objects.all().order_by('-created_at')
-            return MovieRepository.serialize_movies(movies)
+            if not slug:
+                return None
+            # Repeating the condition lets the planner use the partial unique index
+            movies = Movie.objects.filter(profile=profile, slug=slug).exclude(slug='')
+            return next(iter(movies[:1]), None)
+        except Exception as e:
+            print(f"Error getting movie by slug: {e}")
+            return None
+    
+    @staticmethod
+    def has_complete_data(movie: Movie) -> bool:
+        """Whether a stored movie has everything a scrape would give it"""
+        return all(getattr(movie, field) for field in COMPLETE_FIELDS)
+    
+    @staticmethod
+    @reads_from_replica
+    def get_all_movies(profile: Profile, fields: Optional[Sequence[str]] = None,
+                       filters: Optional[MovieListFilters] = None) -> List[Dict[str, Any]]:
+        """
+        Get all of a profile's movies regardless of status.
+        Returns serialized data, limited to fields and filters if given.
+        """
+        try:
+            movies = _list_queryset(Movie.objects.filter(profile=profile), filters)
+            return MovieRepository.serialize_movies(movies, fields)
         except Exception as e:
             print(f"Error getting all movies: {e}")
             return []
     
     @staticmethod
-    def get_saved_movies() -> List[Dict[str, Any]]:
+    @reads_from_replica
+    def get_saved_movies(profile: Profile, fields: Optional[Sequence[str]] = None,
+                         filters: Optional[MovieListFilters] = None) -> List[Dict[str, Any]]:
         """
-        Get movies with SAVED status.
-        Returns serialized data using DRF serializer.
+        Get a profile's movies with SAVED status.
+        Returns serialized data, limited to fields and filters if given.
         """
         try:
-            saved_movies = Movie.objects.filter(
+            saved_movies = _list_queryset(Movie.objects.filter(
+                profile=profile,
                 status=Movie.Status.SAVED
-            ).order_by('-created_at')
-            return MovieRepository.serialize_movies(saved_movies)
+            ), filters)
+            return MovieRepository.serialize_movies(saved_movies, fields)
         except Exception as e:
             print(f"Error getting saved movies: {e}")
             return []
     
     @staticmethod
-    def update_movie_status(movie_id: int, status: str) -> bool:
+    def update_movie_status(profile: Profile, movie_id: int, status: str) -> bool:
         """
-        Update a movie's status.
-        Returns boolean success status.
+        Update the status of a profile's movie and its stat counts.
+        Returns boolean success status (False if no row matched).
         """
         try:
-            movie = Movie.objects.get(id=movie_id)
-            movie.status = status
-            movie.save()
+            updated = MovieRepository._update_status(profile, status, [movie_id], None)
+            if not updated:
+                print(f"Movie with ID {movie_id} not found")
+                return False
             return True
-        except Movie.DoesNotExist:
-            print(f"Movie with ID {movie_id} not found")
-            return False
         except Exception as e:
             print(f"Error updating movie status: {e}")
             return False
     
     @staticmethod
-    def delete_movie(movie_id: int) -> bool:
+    def delete_movie(profile: Profile, movie_id: int) -> bool:
         """
-        Delete a movie from the database.
-        Returns boolean success status.
+        Delete a profile's movie from the database and its stat counts.
+        Returns boolean success status (False if no row matched).
         """
         try:
-            movie = Movie.objects.get(id=movie_id)
-            movie.delete()
+            deleted = MovieRepository._delete(profile, [movie_id], None)
+            if not deleted:
+                print(f"Movie with ID {movie_id} not found")
+                return False
             return True
-        except Movie.DoesNotExist:
-            print(f"Movie with ID {movie_id} not found")
-            return False
         except Exception as e:
             print(f"Error deleting movie: {e}")
-            return False
\ No newline at end of file
+            return False
+    
+    @staticmethod
+    def _matching_movies(profile: Profile, movie_ids: Optional[List[int]],
+                         filters: Optional[Dict[str, Any]]):
+        """Queryset of a profile's movies matching an id list and/or field filters"""
+        queryset = Movie.objects.filter(profile=profile).order_by()
+        if movie_ids is not None:
+            queryset = queryset.filter(id__in=movie_ids)
+        if filters:
+            queryset = queryset.filter(**filters)
+        return queryset
+    
+    @staticmethod
+    def _matching_ids_sql(profile: Profile, movie_ids: Optional[List[int]],
+                          filters: Optional[Dict[str, Any]]) -> Tuple[str, tuple]:
+        """SELECT id subquery for a profile's movies matching an id list and/or field filters"""
+        queryset = MovieRepository._matching_movies(profile, movie_ids, filters)
+        return queryset.values('id').query.sql_with_params()
+    
+    @staticmethod
+    def _update_status(profile: Profile, status: str, movie_ids: Optional[List[int]],
+                       filters: Optional[Dict[str, Any]]) -> List[int]:
+        """
+        Set the status of matching movies, move their stat counts and log an event
+        per status change, in one transaction. On PostgreSQL a single
+        UPDATE ... FROM (SELECT ... FOR UPDATE) returns each row's previous
+        status; elsewhere the rows are locked and read first.
+        Returns the updated ids.
+        """
+        table = connection.ops.quote_name(Movie._meta.db_table)
+        now = timezone.now()
+        
+        with transaction.atomic():
+            matching = MovieRepository._matching_movies(profile, movie_ids, filters).select_for_update()
+            
+            if connection.vendor == 'postgresql':
+                rows_sql, rows_params = matching.values('id', 'status').query.sql_with_params()
+                sql = (
+                    f'UPDATE {table} SET "status" = %s, "updated_at" = %s '
+                    f'FROM ({rows_sql}) AS "previous" WHERE {table}."id" = "previous"."id" '
+                    f'RETURNING {table}."id", "previous"."status"'
+                )
+                with connection.cursor() as cursor:
+                    cursor.execute(sql, [status, now, *rows_params])
+                    previous = cursor.fetchall()
+            else:
+                previous = list(matching.values_list('id', 'status'))
+                if previous:
+                    Movie.objects.filter(id__in=[movie_id for movie_id, _ in previous]).update(
+                        status=status,
+                        updated_at=now,
+                    )
+            
+            apply_stat_deltas(profile.id, status_change_deltas(
+                (previous_status, status) for _, previous_status in previous
+            ))
+            record_movie_events(profile.id, MovieEvent.Kind.UPDATED, (
+                (movie_id, {'status': str(status)})
+                for movie_id, previous_status in previous if previous_status != status
+            ))
+            if any(previous_status != status and Movie.Status.FAVORITE in (previous_status, status)
+                   for _, previous_status in previous):
+                MovieRepository._forget_favourites_sync(profile)
+            changed = any(previous_status != status for _, previous_status in previous)
+            MovieRepository._after_write(profile, SaveOutcome.UPDATED if changed else SaveOutcome.UNCHANGED)
+        return [movie_id for movie_id, _ in previous]
+    
+    @staticmethod
+    def _delete(profile: Profile, movie_ids: Optional[List[int]],
+                filters: Optional[Dict[str, Any]]) -> List[int]:
+        """
+        Delete matching movies with one DELETE ... RETURNING statement, take
+        them out of the stat counts and log their events, in one transaction.
+        Returns the deleted ids.
+        """
+        table = connection.ops.quote_name(Movie._meta.db_table)
+        where_sql, where_params = MovieRepository._matching_ids_sql(profile, movie_ids, filters)
+        sql = f'DELETE FROM {table} WHERE "id" IN ({where_sql}) RETURNING "id", "status", "year"'
+        
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(sql, list(where_params))
+                deleted = cursor.fetchall()
+            apply_stat_deltas(profile.id, movie_deltas(
+                ((status, year) for _, status, year in deleted), sign=-1
+            ))
+            record_movie_events(profile.id, MovieEvent.Kind.DELETED, (
+                (movie_id, {}) for movie_id, _, _ in deleted
+            ))
+            if any(status == Movie.Status.FAVORITE for _, status, _ in deleted):
+                MovieRepository._forget_favourites_sync(profile)
+            MovieRepository._after_write(profile, SaveOutcome.DELETED if deleted else SaveOutcome.UNCHANGED)
+        return [movie_id for movie_id, _, _ in deleted]
+    
+    @staticmethod
+    def _forget_favourites_sync(profile: Profile) -> None:
+        """
+        Drop the profile's favourites fingerprint after a write that changed its favourites here,
+        so the next sync saves again and repairs them instead of matching and skipping
+        """
+        FavouritesSync.objects.filter(profile=profile).delete()
+    
+    @staticmethod
+    def _after_write(profile: Profile, outcome: SaveOutcome, posters: bool = False) -> None:
+        """
+        Post-write hook, called inside every write's transaction with what it did.
+        Once the transaction commits, pins the profile's reads to the primary,
+        drops its cached lists, republishes its snapshots and, for writes that
+        set posters, refreshes its placeholders. Nothing happens for UNCHANGED
+        writes or when the transaction rolls back.
+        """
+        if outcome == SaveOutcome.UNCHANGED:
+            return
+        
+        def written():
+            mark_recent_write(profile)
+            invalidate_movie_lists(profile)
+            schedule_publish(profile)
+            if posters:
+                schedule_refresh(profile)
+        
+        transaction.on_commit(written)
+    
+    @staticmethod
+    def _result_map(movie_ids: Optional[List[int]], affected: List[int], outcome: str) -> Dict[int, str]:
+        """Per-id result: outcome for affected rows, not_found for requested ids that matched nothing"""
+        results = {movie_id: 'not_found' for movie_id in movie_ids or []}
+        results.update({movie_id: outcome for movie_id in affected})
+        return results
+    
+    @staticmethod
+    def bulk_update_status(profile: Profile, status: str, movie_ids: Optional[List[int]] = None,
+                           filters: Optional[Dict[str, Any]] = None) -> Optional[Dict[int, str]]:
+        """
+        Update the status of many of a profile's movies in one UPDATE ... RETURNING statement.
+        Movies are selected by id list, field filters, or both.
+        Returns {movie_id: 'updated' | 'not_found'}, or None on failure.
+        """
+        try:
+            updated = MovieRepository._update_status(profile, status, movie_ids, filters)
+            return MovieRepository._result_map(movie_ids, updated, 'updated')
+        except Exception as e:
+            print(f"Error bulk updating movie status: {e}")
+            return None
+    
+    @staticmethod
+    def bulk_delete_movies(profile: Profile, movie_ids: Optional[List[int]] = None,
+                           filters: Optional[Dict[str, Any]] = None) -> Optional[Dict[int, str]]:
+        """
+        Delete many of a profile's movies in one DELETE ... RETURNING statement.
+        Movies are selected by id list, field filters, or both.
+        Returns {movie_id: 'deleted' | 'not_found'}, or None on failure.
+        """
+        try:
+            deleted = MovieRepository._delete(profile, movie_ids, filters)
+            return MovieRepository._result_map(movie_ids, deleted, 'deleted')
+        except Exception as e:
+            print(f"Error bulk deleting movies: {e}")
+            return None
+    
+    @staticmethod
+    @reads_from_replica
+    def get_stats(profile: Profile) -> Dict[str, Any]:
+        """
+        Get a profile's movie counts per status, release year and decade.
+        Reads the maintained summary rows, never the movies table.
+        """
+        try:
+            rows = MovieStat.objects.filter(profile=profile).values_list('dimension', 'value', 'count')
+            return summarize_stats(rows)
+        except Exception as e:
+            print(f"Error getting movie stats: {e}")
+            return summarize_stats([])
+    
+    @staticmethod
+    def count_movies(profile: Profile, status: str) -> int:
+        """Count a profile's movies with a status from its summary row"""
+        try:
+            count = MovieStat.objects.filter(
+                profile=profile,
+                dimension=MovieStat.Dimension.STATUS,
+                value=status
+            ).values_list('count', flat=True).first()
+            return count or 0
+        except Exception as e:
+            print(f"Error counting movies: {e}")
+            return 0
+    
+    @staticmethod
+    def rebuild_stats(profile: Profile) -> int:
+        """
+        Recompute a profile's summary rows from the movies table.
+        Returns how many counts had drifted.
+        """
+        return rebuild_profile_stats(profile)
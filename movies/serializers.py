@@ -11,8 +11,15 @@ class MovieSerializer(serializers.ModelSerializer):
             'title',
             'year',
             'image_url',
+            'blurhash',
+            'dominant_color',
             'link_url',
+            'slug',
             'status',
+            'director',
+            'genres',
+            'runtime',
+            'rating',
             'created_at',
             'updated_at'
         ]
@@ -1,5 +1,27 @@
+from .errors import (
+    CircuitOpen,
+    ScrapeBlocked,
+    ScrapeError,
+    ScrapeNotFound,
+    ScrapeParseError,
+    ScrapeRejected,
+    ScrapeTimeout,
+    ScrapeUnavailable,
+)
 from .image_service import ImageOptimizer
 from .scraper_service import LetterboxdScraper
 from .single_movie_scraper import SingleMovieScraper
 
-__all__ = ['ImageOptimizer', 'LetterboxdScraper', 'SingleMovieScraper']
\ No newline at end of file
+__all__ = [
+    'CircuitOpen',
+    'ImageOptimizer',
+    'LetterboxdScraper',
+    'ScrapeBlocked',
+    'ScrapeError',
+    'ScrapeNotFound',
+    'ScrapeParseError',
+    'ScrapeRejected',
+    'ScrapeTimeout',
+    'ScrapeUnavailable',
+    'SingleMovieScraper',
+]
@@ -0,0 +1,141 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from django.conf import settings
+
+from .errors import ScrapeRejected
+
+
+class TokenBucket:
+    """
+    Token bucket limiting outbound requests to one host
+
+    Holds up to ``capacity`` tokens, refilled at ``rate`` tokens per second.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def try_acquire(self) -> float:
+        """
+        Take a token if one is available
+
+        Returns:
+            0 if a token was taken, otherwise seconds until the next token
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self, timeout: float) -> float:
+        """
+        Wait up to timeout seconds for a token
+
+        Returns:
+            0 if a token was taken, otherwise seconds until the next token
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire()
+            if wait == 0:
+                return 0.0
+            remaining = deadline - time.monotonic()
+            if wait > remaining:
+                return wait
+            time.sleep(wait)
+
+
+class AdmissionController:
+    """
+    Admission control for Selenium scrapes
+
+    A process-wide semaphore caps concurrent Chrome sessions, and a token
+    bucket per host caps the outbound request rate. Callers queue for up to
+    ``queue_timeout`` seconds; when the queue is full or the wait runs out
+    they are rejected with a Retry-After estimate instead of piling up.
+    """
+
+    def __init__(self, max_concurrent: int, max_queue: int, queue_timeout: float,
+                 host_rate: float, host_burst: int):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.host_rate = host_rate
+        self.host_burst = host_burst
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.host_rate, self.host_burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    @contextmanager
+    def admit(self, url: str):
+        """
+        Hold a scrape slot and a request token for url's host
+
+        Raises:
+            ScrapeRejected: If no slot or token is available within queue_timeout
+        """
+        deadline = time.monotonic() + self.queue_timeout
+
+        with self._lock:
+            if self._waiting >= self.max_queue:
+                raise ScrapeRejected("Scrape queue is full", retry_after=self.queue_timeout)
+            self._waiting += 1
+        try:
+            acquired = self._slots.acquire(timeout=self.queue_timeout)
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+        if not acquired:
+            raise ScrapeRejected("Too many scrapes in progress", retry_after=self.queue_timeout)
+
+        try:
+            host = urlparse(url).hostname or ''
+            wait = self._bucket(host).acquire(max(0.0, deadline - time.monotonic()))
+            if wait:
+                raise ScrapeRejected(f"Rate limit reached for {host}", retry_after=wait)
+            yield
+        finally:
+            self._slots.release()
+
+
+_controller: Optional[AdmissionController] = None
+_controller_lock = threading.Lock()
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get the process-wide AdmissionController built from settings"""
+    global _controller
+    with _controller_lock:
+        if _controller is None:
+            _controller = AdmissionController(
+                max_concurrent=getattr(settings, 'SCRAPE_MAX_CONCURRENT', 2),
+                max_queue=getattr(settings, 'SCRAPE_MAX_QUEUE', 4),
+                queue_timeout=getattr(settings, 'SCRAPE_QUEUE_TIMEOUT', 10),
+                host_rate=getattr(settings, 'SCRAPE_HOST_RATE', 0.5),
+                host_burst=getattr(settings, 'SCRAPE_HOST_BURST', 3),
+            )
+        return _controller
@@ -0,0 +1,242 @@
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, List, Optional
+from urllib.parse import urlparse
+
+from django.conf import settings
+
+from .admission import get_admission_controller
+from .browser import BrowserPool, PageCache
+from .errors import ScrapeBlocked, ScrapeError, ScrapeNotFound, ScrapeTimeout, ScrapeUnavailable
+from .page_policy import PAGE_POLICIES, PageLoadPolicy
+from .resilience import get_circuit_breaker, retry_call
+
+if TYPE_CHECKING:
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+logger = logging.getLogger(__name__)
+
+_chromedriver_path: Optional[str] = None
+_chromedriver_lock = threading.Lock()
+
+
+def chromedriver_path() -> str:
+    """
+    Path of the chromedriver binary, resolved once per process and pinned
+
+    settings.CHROMEDRIVER_PATH wins when set. Otherwise webdriver_manager
+    resolves it (a version check and possibly a download) the first time
+    only; with preload_app the gunicorn master does this before forking,
+    so workers inherit the pinned path.
+    """
+    global _chromedriver_path
+    with _chromedriver_lock:
+        if _chromedriver_path is None:
+            configured = getattr(settings, 'CHROMEDRIVER_PATH', '')
+            if configured:
+                _chromedriver_path = configured
+            else:
+                from webdriver_manager.chrome import ChromeDriverManager
+
+                _chromedriver_path = ChromeDriverManager().install()
+        return _chromedriver_path
+
+# Whole page titles (lowercased, trailing dots dropped) of Letterboxd / Cloudflare error and
+# challenge pages. Matched exactly: a film called "Not Found" has the title "Not Found (2016) • Letterboxd"
+NOT_FOUND_TITLES = ('not found', 'page not found', 'letterboxd • not found')
+BLOCKED_TITLES = (
+    'just a moment', 'attention required! | cloudflare', 'access denied', 'too many requests',
+    'letterboxd • too many requests',
+)
+
+# Markup only error and challenge pages carry, for the ones whose title we don't know
+NOT_FOUND_PAGE_MARKERS = ('<body class="error', 'Sorry, we can’t find the page you’ve requested')
+BLOCKED_PAGE_MARKERS = (
+    'id="challenge-form"', 'id="challenge-running"', 'id="cf-error-details"', '_cf_chl_opt',
+)
+
+
+def classify_error_page(title: str, html_content: str) -> Optional[str]:
+    """
+    Tell Letterboxd's 404 page and Cloudflare's block and challenge pages from real pages
+
+    Args:
+        title: Document title of the loaded page
+        html_content: Rendered HTML of the page
+
+    Returns:
+        'not_found', 'blocked', or None for any other page
+    """
+    title = (title or '').strip().rstrip('.…').strip().lower()
+    if title in NOT_FOUND_TITLES:
+        return 'not_found'
+    if title in BLOCKED_TITLES:
+        return 'blocked'
+    if any(marker in html_content for marker in BLOCKED_PAGE_MARKERS):
+        return 'blocked'
+    if any(marker in html_content for marker in NOT_FOUND_PAGE_MARKERS):
+        return 'not_found'
+    return None
+
+
+class ChromeScraper:
+    """
+    Base class for scrapers rendering Letterboxd pages in headless Chrome
+
+    Subclasses set the CSS selectors to wait for and a label used in error
+    messages. An optional BrowserPool and PageCache let many scrapes share
+    browser sessions and already rendered pages.
+
+    Selenium and webdriver_manager are imported on first use, so workers
+    that never scrape don't pay for loading them.
+
+    Each scraper loads pages under a PageLoadPolicy, chosen per scraper class
+    through settings.SCRAPE_PAGE_POLICIES or passed in explicitly.
+
+    Loads raise typed ScrapeErrors. Retryable ones (timeouts, Chrome or
+    connection failures) are retried with jittered backoff, and a circuit
+    breaker per host fails fast while Letterboxd keeps failing.
+    """
+
+    page_label = 'page'
+    wait_selectors: List[str] = []
+    default_page_policy = 'lean'
+
+    def __init__(self, timeout: int = 30, browser_pool: Optional[BrowserPool] = None,
+                 page_cache: Optional[PageCache] = None, page_policy: Optional[PageLoadPolicy] = None):
+        self.timeout = timeout
+        self.browser_pool = browser_pool
+        self.page_cache = page_cache
+        self.page_policy = page_policy or self._configured_page_policy()
+        self.last_load_seconds: Optional[float] = None
+        self._setup_driver_options()
+
+    def _configured_page_policy(self) -> PageLoadPolicy:
+        policies = getattr(settings, 'SCRAPE_PAGE_POLICIES', {})
+        return PAGE_POLICIES[policies.get(type(self).__name__, self.default_page_policy)]
+
+    def _setup_driver_options(self) -> 'Options':
+        """Setup Chrome driver options with anti-detection measures"""
+        from selenium.webdriver.chrome.options import Options
+
+        self.chrome_options = Options()
+        self.chrome_options.add_argument('--headless')
+        self.chrome_options.add_argument('--disable-gpu')
+        self.chrome_options.add_argument('--no-sandbox')
+        self.chrome_options.add_argument('--disable-dev-shm-usage')
+        self.chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        self.chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        self.chrome_options.add_experimental_option('useAutomationExtension', False)
+        self.page_policy.apply_to_options(self.chrome_options)
+        return self.chrome_options
+
+    def _create_driver(self) -> 'WebDriver':
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+
+        service = Service(chromedriver_path())
+        return webdriver.Chrome(service=service, options=self.chrome_options)
+
+    def _pool_key(self) -> str:
+        return f'{type(self).__name__}:{self.page_policy.name}'
+
+    def prelaunch(self) -> bool:
+        """Start a Chrome session in the browser pool ahead of the first scrape; False if not pooled"""
+        if not self.browser_pool:
+            return False
+        return self.browser_pool.prelaunch(self._pool_key(), self._create_driver)
+
+    def _fetch_page_source(self, url: str) -> str:
+        """
+        Get the rendered HTML for url, from the page cache or an admitted Chrome load
+
+        Raises:
+            ScrapeError: If the page couldn't be loaded after retries
+            ScrapeRejected: If admission control or the circuit breaker refused the load
+        """
+        if self.page_cache:
+            cached = self.page_cache.get(url)
+            if cached is not None:
+                return cached
+
+        breaker = get_circuit_breaker(urlparse(url).hostname or '')
+
+        def attempt() -> str:
+            with get_admission_controller().admit(url):
+                return self._load_page_source(url)
+
+        html_content = retry_call(
+            lambda: breaker.call(attempt),
+            attempts=getattr(settings, 'SCRAPE_RETRY_ATTEMPTS', 2),
+            base_delay=getattr(settings, 'SCRAPE_RETRY_BASE_DELAY', 1.0),
+            max_delay=getattr(settings, 'SCRAPE_RETRY_MAX_DELAY', 8.0),
+        )
+
+        if self.page_cache:
+            self.page_cache.set(url, html_content)
+        return html_content
+
+    def _load_page_source(self, url: str) -> str:
+        """Load url in headless Chrome and return the rendered HTML"""
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+
+        try:
+            if self.browser_pool:
+                with self.browser_pool.session(self._pool_key(), self._create_driver) as driver:
+                    return self._render(driver, url)
+
+            driver = self._create_driver()
+            try:
+                return self._render(driver, url)
+            finally:
+                driver.quit()
+
+        except ScrapeError:
+            raise
+        except TimeoutException as e:
+            raise ScrapeTimeout(f"Failed to load {self.page_label}: timeout - {str(e)}")
+        except WebDriverException as e:
+            raise ScrapeUnavailable(f"Failed to load {self.page_label}: {str(e)}")
+        except Exception as e:
+            raise ScrapeError(f"Unexpected error during scraping: {str(e)}")
+
+    def _render(self, driver: 'WebDriver', url: str) -> str:
+        """Navigate to url and wait until the page content we parse is present"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        started = time.perf_counter()
+        self.page_policy.apply_to_driver(driver)
+        driver.get(url)
+
+        # More robust waiting strategy
+        wait = WebDriverWait(driver, self.timeout)
+
+        # Wait for the page to load as far as the policy's strategy requires
+        ready_states = self.page_policy.ready_states
+        wait.until(lambda d: d.execute_script("return document.readyState") in ready_states)
+        self._check_error_page(driver)
+
+        for selector in self.wait_selectors:
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+
+        # Additional wait for any lazy loading
+        time.sleep(self.page_policy.settle_seconds)
+
+        html_content = driver.page_source
+        self.last_load_seconds = time.perf_counter() - started
+        logger.info(
+            "Loaded %s in %.2fs with %s page policy", url, self.last_load_seconds, self.page_policy.name
+        )
+        return html_content
+
+    def _check_error_page(self, driver: 'WebDriver') -> None:
+        """Fail early on error and challenge pages instead of waiting for selectors that never appear"""
+        error_page = classify_error_page(driver.title, driver.page_source)
+        if error_page == 'not_found':
+            raise ScrapeNotFound(f"Letterboxd {self.page_label} not found")
+        if error_page == 'blocked':
+            raise ScrapeBlocked(f"Letterboxd blocked the {self.page_label} request ({driver.title})")
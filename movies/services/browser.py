@@ -0,0 +1,147 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class BrowserPool:
+    """
+    Reusable headless Chrome sessions shared by scrapers across threads
+
+    Idle drivers are kept per key (one key per scraper type, since driver
+    options differ) and handed to the next caller instead of launching a new
+    Chrome. A driver that raised during use is quit rather than reused.
+    """
+
+    def __init__(self, max_idle: int = 4):
+        """
+        Initialize BrowserPool
+
+        Args:
+            max_idle: Maximum idle drivers kept per key
+        """
+        self.max_idle = max_idle
+        self._idle: Dict[str, List['WebDriver']] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @contextmanager
+    def session(self, key: str, create: Callable[[], 'WebDriver']):
+        """
+        Borrow a driver for key, creating one if none is idle
+
+        Args:
+            key: Pool partition, e.g. the scraper class name
+            create: Factory launching a new driver
+        """
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            driver = idle.pop() if idle else None
+        if driver is None:
+            driver = create()
+
+        healthy = False
+        try:
+            yield driver
+            healthy = True
+        finally:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                keep = healthy and not self._closed and len(idle) < self.max_idle
+                if keep:
+                    idle.append(driver)
+            if not keep:
+                driver.quit()
+
+    def prelaunch(self, key: str, create: Callable[[], 'WebDriver']) -> bool:
+        """
+        Launch a driver and park it idle under key, if there is room
+
+        Returns:
+            True if a driver was added
+        """
+        with self._lock:
+            if self._closed or len(self._idle.get(key, [])) >= self.max_idle:
+                return False
+        driver = create()
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if not self._closed and len(idle) < self.max_idle:
+                idle.append(driver)
+                return True
+        driver.quit()
+        return False
+
+    def close(self) -> None:
+        """Quit every idle driver and stop pooling new ones"""
+        with self._lock:
+            self._closed = True
+            drivers = [driver for idle in self._idle.values() for driver in idle]
+            self._idle.clear()
+        for driver in drivers:
+            driver.quit()
+
+
+class PageCache:
+    """Thread-safe cache of rendered page HTML keyed by URL"""
+
+    def __init__(self, ttl: int = 300):
+        """
+        Initialize PageCache
+
+        Args:
+            ttl: Seconds a cached page stays valid
+        """
+        self.ttl = ttl
+        self._pages: Dict[str, Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[str]:
+        with self._lock:
+            entry = self._pages.get(url)
+            if entry is None:
+                return None
+            stored_at, html = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._pages[url]
+                return None
+            return html
+
+    def set(self, url: str, html: str) -> None:
+        with self._lock:
+            self._pages[url] = (time.monotonic(), html)
+
+
+_shared_pool: Optional[BrowserPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> Optional[BrowserPool]:
+    """
+    This process's pool of Chrome sessions for request scrapes
+
+    Returns:
+        None when settings.SCRAPE_BROWSER_POOL_MAX_IDLE is 0 (the default),
+        so every scrape launches and quits its own Chrome
+    """
+    global _shared_pool
+    max_idle = getattr(settings, 'SCRAPE_BROWSER_POOL_MAX_IDLE', 0)
+    if max_idle <= 0:
+        return None
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = BrowserPool(max_idle=max_idle)
+        return _shared_pool
+
+
+def close_browser_pool() -> None:
+    """Quit this process's pooled Chrome sessions, e.g. when a worker exits"""
+    with _shared_pool_lock:
+        pool = _shared_pool
+    if pool is not None:
+        pool.close()
@@ -0,0 +1,53 @@
+import math
+
+
+class ScrapeError(Exception):
+    """
+    Base class for Letterboxd fetch failures
+
+    retryable: a fresh attempt may succeed (transient upstream trouble)
+    upstream_failure: counts towards opening the host's circuit breaker
+    """
+
+    retryable = False
+    upstream_failure = False
+
+
+class ScrapeTimeout(ScrapeError):
+    """The page or the content we wait for didn't load in time"""
+
+    retryable = True
+    upstream_failure = True
+
+
+class ScrapeUnavailable(ScrapeError):
+    """Chrome or the connection to Letterboxd failed"""
+
+    retryable = True
+    upstream_failure = True
+
+
+class ScrapeBlocked(ScrapeError):
+    """Letterboxd refused the request (rate limited or bot challenge)"""
+
+    upstream_failure = True
+
+
+class ScrapeNotFound(ScrapeError):
+    """The profile or film page doesn't exist"""
+
+
+class ScrapeParseError(ScrapeError):
+    """The page loaded but the expected data couldn't be extracted"""
+
+
+class ScrapeRejected(ScrapeError):
+    """The scrape wasn't attempted; carries a Retry-After hint in seconds"""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = max(1, math.ceil(retry_after))
+
+
+class CircuitOpen(ScrapeRejected):
+    """Letterboxd is failing; scrapes fail fast until the breaker's reset timeout"""
@@ -0,0 +1,108 @@
+import json
+import re
+from typing import Any, Dict, Iterator, List, Optional
+
+# Structured data blocks, matched on the raw HTML so no DOM has to be built
+JSON_LD_PATTERN = re.compile(
+    r'<script[^>]*\btype=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL,
+)
+# Letterboxd wraps the JSON in /* <![CDATA[ */ ... /* ]]> */
+CDATA_PATTERN = re.compile(r'/\*\s*<!\[CDATA\[\s*\*/|/\*\s*\]\]>\s*\*/')
+# Runtime isn't part of the structured data; it sits in the footer as "104&nbsp;mins"
+RUNTIME_PATTERN = re.compile(r'(\d{1,4})(?:&nbsp;|\s)+mins?\b')
+# ISO 8601 durations such as PT1H44M, for pages that do publish one
+DURATION_PATTERN = re.compile(r'^PT(?:(\d+)H)?(?:(\d+)M)?')
+
+
+def iter_json_ld(html_content: str) -> Iterator[Dict[str, Any]]:
+    """Yield every JSON-LD object in the page, skipping blocks that don't parse"""
+    for match in JSON_LD_PATTERN.finditer(html_content):
+        try:
+            data = json.loads(CDATA_PATTERN.sub('', match.group(1)))
+        except ValueError:
+            continue
+        if isinstance(data, dict):
+            data = data.get('@graph', [data])
+        items = data if isinstance(data, list) else []
+        for item in items:
+            if isinstance(item, dict):
+                yield item
+
+
+def _names(value: Any) -> List[str]:
+    """Names from a schema.org value that may be a string, an object or a list of either"""
+    values = value if isinstance(value, list) else [value]
+    names = []
+    for item in values:
+        name = item.get('name') if isinstance(item, dict) else item
+        if isinstance(name, str) and name.strip():
+            names.append(name.strip())
+    return names
+
+
+def _release_year(movie: Dict[str, Any]) -> str:
+    events = movie.get('releasedEvent') or []
+    events = events if isinstance(events, list) else [events]
+    for event in events:
+        start_date = str(event.get('startDate', '')) if isinstance(event, dict) else ''
+        if re.match(r'^\d{4}', start_date):
+            return start_date[:4]
+    date_published = str(movie.get('datePublished', ''))
+    return date_published[:4] if re.match(r'^\d{4}', date_published) else ''
+
+
+def _runtime(movie: Dict[str, Any], html_content: str) -> Optional[int]:
+    duration = DURATION_PATTERN.match(str(movie.get('duration', '')))
+    if duration and any(duration.groups()):
+        hours, minutes = (int(part or 0) for part in duration.groups())
+        return hours * 60 + minutes
+    footer_runtime = RUNTIME_PATTERN.search(html_content)
+    return int(footer_runtime.group(1)) if footer_runtime else None
+
+
+def _rating(movie: Dict[str, Any]) -> Optional[float]:
+    rating = movie.get('aggregateRating')
+    if not isinstance(rating, dict):
+        return None
+    try:
+        return round(float(rating['ratingValue']), 2)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def extract_film_metadata(html_content: str, original_url: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract film data from the page's JSON-LD Movie block
+
+    Args:
+        html_content: Film page HTML
+        original_url: URL the page was loaded from, used as link_url
+
+    Returns:
+        Movie fields (title, year, image_url, link_url, director, genres,
+        runtime, rating), or None if there is no usable Movie block
+    """
+    for item in iter_json_ld(html_content):
+        if item.get('@type') != 'Movie':
+            continue
+
+        title = (item.get('name') or '').strip()
+        year = _release_year(item)
+        if not title or not year:
+            return None
+
+        image = item.get('image')
+        image_url = image.get('url', '') if isinstance(image, dict) else image or ''
+
+        return {
+            'title': title,
+            'year': year,
+            'image_url': image_url.strip(),
+            'link_url': original_url,
+            'director': ', '.join(_names(item.get('director')))[:255],
+            'genres': _names(item.get('genre')),
+            'runtime': _runtime(item, html_content),
+            'rating': _rating(item),
+        }
+    return None
@@ -139,4 +139,41 @@ def optimize_single_url(url: str, width: int = 2000, height: int = 3000) -> str:
         Optimized image URL
     """
     service = ImageOptimizer(width, height)
-    return service.update_image_url(url)
\ No newline at end of file
+    return service.update_image_url(url)
+
+
+# Letterboxd's grey stand-in poster, left in src until the lazy loader swaps the real one in
+PLACEHOLDER_POSTER_MARKERS = ('empty-poster', 'data:image')
+
+
+def poster_image_url(img_tag) -> str:
+    """
+    Poster URL of an <img> tag, whether or not the lazy loader has run
+    
+    With images disabled (the lean page policy) the poster src can still be
+    the placeholder; the real URL is then in data-src or the srcset candidates.
+    
+    Args:
+        img_tag: BeautifulSoup tag of the poster image, or None
+        
+    Returns:
+        Poster URL, or '' if the tag carries none
+    """
+    if img_tag is None:
+        return ''
+    
+    src = img_tag.get('src', '').strip()
+    if src and not any(marker in src for marker in PLACEHOLDER_POSTER_MARKERS):
+        return src
+    
+    data_src = img_tag.get('data-src', '').strip()
+    if data_src:
+        return data_src
+    
+    for attribute in ('srcset', 'data-srcset'):
+        srcset = img_tag.get(attribute, '').strip()
+        if srcset:
+            # "url 1x, url 2x": the first candidate is enough, update_image_url resizes it
+            return srcset.split(',')[0].split()[0]
+    
+    return ''
@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Tuple
+
+if TYPE_CHECKING:
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+# URL patterns for Network.setBlockedURLs, by resource type
+RESOURCE_TYPE_PATTERNS = {
+    'image': ('*.jpg*', '*.jpeg*', '*.png*', '*.gif*', '*.webp*', '*.svg*', '*.ico*'),
+    'font': ('*.woff*', '*.ttf*', '*.otf*', '*.eot*'),
+    'media': ('*.mp4*', '*.webm*', '*.m3u8*', '*.mp3*'),
+}
+
+# Ads, analytics and social widgets Letterboxd pages pull in
+THIRD_PARTY_DOMAINS = (
+    'googletagmanager.com',
+    'google-analytics.com',
+    'googlesyndication.com',
+    'doubleclick.net',
+    'adservice.google.com',
+    'amazon-adsystem.com',
+    'adnxs.com',
+    'criteo.com',
+    'pub.network',
+    'scorecardresearch.com',
+    'quantserve.com',
+    'facebook.net',
+    'connect.facebook.com',
+    'platform.twitter.com',
+)
+
+
+@dataclass(frozen=True)
+class PageLoadPolicy:
+    """
+    How much of a page headless Chrome should load
+
+    Applied in two places: Chrome options before launch (page load strategy,
+    image loading) and the driver session after launch (CDP URL blocking).
+    """
+
+    name: str
+    page_load_strategy: str = 'normal'
+    disable_images: bool = False
+    blocked_resource_types: Tuple[str, ...] = ()
+    blocked_domains: Tuple[str, ...] = ()
+    settle_seconds: float = 2.0
+
+    @property
+    def blocked_url_patterns(self) -> List[str]:
+        patterns = [
+            pattern
+            for resource_type in self.blocked_resource_types
+            for pattern in RESOURCE_TYPE_PATTERNS[resource_type]
+        ]
+        patterns.extend(f'*{domain}*' for domain in self.blocked_domains)
+        return patterns
+
+    @property
+    def ready_states(self) -> Tuple[str, ...]:
+        """document.readyState values that count as loaded under this strategy"""
+        if self.page_load_strategy == 'normal':
+            return ('complete',)
+        return ('interactive', 'complete')
+
+    def apply_to_options(self, options: 'Options') -> 'Options':
+        options.page_load_strategy = self.page_load_strategy
+        if self.disable_images:
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+        return options
+
+    def apply_to_driver(self, driver: 'WebDriver') -> None:
+        patterns = self.blocked_url_patterns
+        if patterns:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+
+
+# Everything loads, as a regular browser would
+FULL_PAGE_POLICY = PageLoadPolicy(name='full')
+
+# Only the document and first-party scripts; enough to read the data-* attributes we parse
+LEAN_PAGE_POLICY = PageLoadPolicy(
+    name='lean',
+    page_load_strategy='eager',
+    disable_images=True,
+    blocked_resource_types=('image', 'font', 'media'),
+    blocked_domains=THIRD_PARTY_DOMAINS,
+)
+
+PAGE_POLICIES = {policy.name: policy for policy in (FULL_PAGE_POLICY, LEAN_PAGE_POLICY)}
@@ -0,0 +1,144 @@
+import io
+import math
+from importlib.util import find_spec
+from typing import Dict, List, Sequence, Tuple
+
+BASE83_CHARACTERS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~'
+
+# Blurhash components across and down; posters are portrait, so one more row than column
+BLURHASH_COMPONENTS = (3, 4)
+# Longest side the poster is reduced to before hashing; blurhash only keeps low frequencies
+HASH_SIZE = 32
+# Colours the poster is quantized to when picking its dominant colour
+DOMINANT_PALETTE_SIZE = 5
+
+
+def placeholders_available() -> bool:
+    """Whether Pillow is installed to decode posters (optional, `pip install .[placeholders]`)"""
+    return find_spec('PIL') is not None
+
+
+def _encode83(value: int, length: int) -> str:
+    return ''.join(
+        BASE83_CHARACTERS[(value // 83 ** (length - index)) % 83]
+        for index in range(1, length + 1)
+    )
+
+
+def _srgb_to_linear(value: int) -> float:
+    value = value / 255
+    return value / 12.92 if value <= 0.04045 else ((value + 0.055) / 1.055) ** 2.4
+
+
+def _linear_to_srgb(value: float) -> int:
+    value = max(0.0, min(1.0, value))
+    if value <= 0.0031308:
+        return int(value * 12.92 * 255 + 0.5)
+    return int((1.055 * value ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def _sign_pow(value: float, exponent: float) -> float:
+    return math.copysign(abs(value) ** exponent, value)
+
+
+def encode_blurhash(pixels: Sequence[Tuple[int, int, int]], width: int, height: int,
+                    components: Tuple[int, int] = BLURHASH_COMPONENTS) -> str:
+    """
+    Encode RGB pixels as a blurhash (https://blurha.sh)
+
+    Args:
+        pixels: width * height (r, g, b) tuples, row by row
+        width: Image width
+        height: Image height
+        components: Cosine components across and down (1-9 each)
+
+    Returns:
+        The blurhash string
+    """
+    components_x, components_y = components
+    linear = [tuple(_srgb_to_linear(channel) for channel in pixel) for pixel in pixels]
+    cos_x = [[math.cos(math.pi * i * x / width) for x in range(width)] for i in range(components_x)]
+    cos_y = [[math.cos(math.pi * j * y / height) for y in range(height)] for j in range(components_y)]
+
+    factors: List[Tuple[float, float, float]] = []
+    for j in range(components_y):
+        for i in range(components_x):
+            normalisation = 1 if i == 0 and j == 0 else 2
+            red = green = blue = 0.0
+            for y in range(height):
+                row = y * width
+                for x in range(width):
+                    basis = cos_x[i][x] * cos_y[j][y]
+                    pixel = linear[row + x]
+                    red += basis * pixel[0]
+                    green += basis * pixel[1]
+                    blue += basis * pixel[2]
+            scale = normalisation / (width * height)
+            factors.append((red * scale, green * scale, blue * scale))
+
+    dc, ac = factors[0], factors[1:]
+    blurhash = _encode83((components_x - 1) + (components_y - 1) * 9, 1)
+
+    if ac:
+        actual_max = max(abs(channel) for factor in ac for channel in factor)
+        quantised_max = max(0, min(82, math.floor(actual_max * 166 - 0.5)))
+        max_value = (quantised_max + 1) / 166
+    else:
+        quantised_max, max_value = 0, 1
+    blurhash += _encode83(quantised_max, 1)
+
+    red, green, blue = (_linear_to_srgb(channel) for channel in dc)
+    blurhash += _encode83((red << 16) + (green << 8) + blue, 4)
+
+    for factor in ac:
+        red, green, blue = (
+            max(0, min(18, math.floor(_sign_pow(channel / max_value, 0.5) * 9 + 9.5)))
+            for channel in factor
+        )
+        blurhash += _encode83(red * 19 * 19 + green * 19 + blue, 2)
+    return blurhash
+
+
+def dominant_color(image) -> str:
+    """Most common colour of an RGB image after quantizing, as #rrggbb"""
+    quantized = image.quantize(colors=DOMINANT_PALETTE_SIZE)
+    palette = quantized.getpalette()
+    _, index = max(quantized.getcolors())
+    red, green, blue = palette[index * 3:index * 3 + 3]
+    return f'#{red:02x}{green:02x}{blue:02x}'
+
+
+def compute_placeholder(image_data: bytes) -> Dict[str, str]:
+    """
+    Compute a poster's blurhash and dominant colour
+
+    Pure CPU work with no Django imports, so it can run in a ProcessPoolExecutor.
+
+    Args:
+        image_data: Encoded image (JPEG, PNG, ...), ideally a small poster variant
+
+    Returns:
+        {'blurhash': ..., 'dominant_color': '#rrggbb'}
+
+    Raises:
+        RuntimeError: If Pillow isn't installed
+        OSError: If the image can't be decoded
+    """
+    if not placeholders_available():
+        raise RuntimeError('Pillow is required for poster placeholders')
+    # Imported here so workers don't load Pillow at boot; only the poster decoding processes need it
+    from PIL import Image
+
+    with Image.open(io.BytesIO(image_data)) as image:
+        # Let the JPEG decoder downscale while decoding instead of decoding every pixel
+        image.draft('RGB', (HASH_SIZE * 2, HASH_SIZE * 2))
+        image = image.convert('RGB')
+    image.thumbnail((HASH_SIZE, HASH_SIZE))
+
+    width, height = image.size
+    raw = image.tobytes()
+    pixels = [tuple(raw[offset:offset + 3]) for offset in range(0, len(raw), 3)]
+    return {
+        'blurhash': encode_blurhash(pixels, width, height),
+        'dominant_color': dominant_color(image),
+    }
@@ -0,0 +1,122 @@
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+
+from .errors import CircuitOpen, ScrapeError, ScrapeRejected
+
+
+def retry_call(fn: Callable[[], Any], attempts: int, base_delay: float, max_delay: float) -> Any:
+    """
+    Call fn, retrying retryable ScrapeErrors with full-jitter exponential backoff
+
+    Args:
+        fn: Callable to run
+        attempts: Total attempts, including the first (fn always runs at least once)
+        base_delay: Backoff ceiling for the first retry, in seconds
+        max_delay: Upper bound for any backoff, in seconds
+
+    Raises:
+        The last error, or the first non-retryable one
+    """
+    attempts = max(1, attempts)
+    for attempt in range(attempts):
+        try:
+            return fn()
+        except ScrapeError as e:
+            if not e.retryable or attempt == attempts - 1:
+                raise
+            time.sleep(random.uniform(0, min(max_delay, base_delay * 2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    Fail fast while an upstream host keeps failing
+
+    After ``failure_threshold`` consecutive upstream failures the breaker
+    opens and rejects calls for ``reset_timeout`` seconds. It then lets a
+    single trial call through (half-open): success closes it, failure opens
+    it again.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 3, reset_timeout: float = 60):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at < self.reset_timeout:
+            return 'open'
+        return 'half-open'
+
+    def _before_call(self) -> None:
+        with self._lock:
+            state = self.state
+            if state == 'closed':
+                return
+            if state == 'half-open' and not self._trial_running:
+                self._trial_running = True
+                return
+            retry_after = self.reset_timeout - (time.monotonic() - self.opened_at)
+            raise CircuitOpen(f"{self.name} circuit open after repeated failures", retry_after=retry_after)
+
+    def _after_call(self, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            self._trial_running = False
+            if isinstance(error, ScrapeRejected):
+                # Never reached Letterboxd, so says nothing about its health
+                return
+            if error is None:
+                self.failures = 0
+                self.opened_at = None
+            elif isinstance(error, ScrapeError) and error.upstream_failure:
+                self.failures += 1
+                if self.opened_at is not None or self.failures >= self.failure_threshold:
+                    self.opened_at = time.monotonic()
+            elif self.opened_at is not None:
+                # Trial reached Letterboxd (e.g. not found / parse error): upstream is back
+                self.failures = 0
+                self.opened_at = None
+
+    def call(self, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn through the breaker
+
+        Raises:
+            CircuitOpen: If the breaker is open
+        """
+        self._before_call()
+        try:
+            result = fn()
+        except BaseException as e:
+            self._after_call(e)
+            raise
+        self._after_call()
+        return result
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """Get the process-wide CircuitBreaker for a host"""
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                host,
+                failure_threshold=getattr(settings, 'SCRAPE_CIRCUIT_FAILURE_THRESHOLD', 3),
+                reset_timeout=getattr(settings, 'SCRAPE_CIRCUIT_RESET_TIMEOUT', 60),
+            )
+            _breakers[host] = breaker
+        return breaker
@@ -1,34 +1,15 @@
 import re
-import time
 from typing import Any, Dict, List
 
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
+from .base_scraper import ChromeScraper
+from .errors import ScrapeParseError
+from .image_service import poster_image_url
+from .single_flight import scrape_flight
 
 
-class LetterboxdScraper:
-    def __init__(self, timeout: int = 30):
-        self.timeout = timeout
-        self._setup_driver_options()
-    
-    def _setup_driver_options(self) -> Options:
-        """Setup Chrome driver options with anti-detection measures"""
-        self.chrome_options = Options()
-        self.chrome_options.add_argument('--headless')
-        self.chrome_options.add_argument('--disable-gpu')
-        self.chrome_options.add_argument('--no-sandbox')
-        self.chrome_options.add_argument('--disable-dev-shm-usage')
-        self.chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        self.chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        self.chrome_options.add_experimental_option('useAutomationExtension', False)
-        return self.chrome_options
+class LetterboxdScraper(ChromeScraper):
+    page_label = 'page'
+    wait_selectors = ['#favourites', '#favourites .poster-container']
     
     def scrape_favourites(self, username: str) -> List[Dict[str, Any]]:
         """
@@ -41,53 +22,24 @@ class LetterboxdScraper:
             List of movie dictionaries matching Django Movie model structure
             
         Raises:
-            Exception: If scraping fails
+            ScrapeError: If the page can't be loaded or parsed
         """
         url = f"https://letterboxd.com/{username}/"
-        
-        driver = None
-        try:
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=self.chrome_options)
-            
-            # Navigate and wait
-            driver.get(url)
-            
-            # More robust waiting strategy
-            wait = WebDriverWait(driver, self.timeout)
-            
-            # Wait for the page to fully load
-            wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
-            
-            # Wait for favorites section
-            wait.until(EC.presence_of_element_located((By.ID, "favourites")))
-            
-            # Wait for poster containers to load
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "#favourites .poster-container")))
-            
-            # Additional wait for any lazy loading
-            time.sleep(2)
-            
-            html_content = driver.page_source
-            
-        except TimeoutException as e:
-            raise Exception(f"Failed to load page: timeout - {str(e)}")
-        except WebDriverException as e:
-            raise Exception(f"Failed to load page: {str(e)}")
-        except Exception as e:
-            raise Exception(f"Unexpected error during scraping: {str(e)}")
-        finally:
-            if driver:
-                driver.quit()
-        
+        return scrape_flight.do(url, lambda: self._scrape_favourites_page(url))
+    
+    def _scrape_favourites_page(self, url: str) -> List[Dict[str, Any]]:
+        """Load the profile page in Chrome and parse its favourites"""
+        html_content = self._fetch_page_source(url)
         return self._parse_movies_from_html(html_content)
     
     def _parse_movies_from_html(self, html_content: str) -> List[Dict[str, Any]]:
         """Parse movies from HTML content"""
+        from bs4 import BeautifulSoup
+        
         try:
             soup = BeautifulSoup(html_content, 'html.parser')
         except Exception as e:
-            raise Exception(f"Failed to parse HTML: {str(e)}")
+            raise ScrapeParseError(f"Failed to parse HTML: {str(e)}")
         
         movies = []
         poster_containers = soup.select("#favourites .poster-container")
@@ -103,7 +55,7 @@ class LetterboxdScraper:
                 continue
         
         if len(movies) == 0:
-            raise Exception("No movies found, possibly failed to load dynamic content")
+            raise ScrapeParseError("No movies found, possibly failed to load dynamic content")
         
         return movies
     
@@ -138,8 +90,7 @@ class LetterboxdScraper:
                 year = year_match.group(1) if year_match else ''
                 
         
-        img_tag = poster.select_one('img')
-        image_url = img_tag.get('src', '').strip() if img_tag else ''
+        image_url = poster_image_url(poster.select_one('img'))
         
         film_link = poster.get('data-film-link', '').strip()
         link_url = f"https://letterboxd.com{film_link}" if film_link else ''
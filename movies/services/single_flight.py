@@ -0,0 +1,155 @@
+import copy
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+_MISSING = object()
+
+# Redis compare-and-delete: free the lock only if it still holds the caller's token
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class _Call:
+    """In-flight call shared by every caller of the same key in this process"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into a single execution
+
+    Within a process, callers of a key that is already running wait for the
+    running call and share its result. Across gunicorn workers, a lock in the
+    shared Django cache elects one leader; the others poll the cache for the
+    result the leader publishes. With a per-process cache backend (the
+    default LocMemCache) only in-process coalescing applies.
+    """
+
+    def __init__(self, namespace: str, lock_timeout: int = 120, poll_interval: float = 0.5):
+        """
+        Initialize SingleFlight
+
+        Args:
+            namespace: Prefix for the cache keys
+            lock_timeout: Seconds before a cross-worker lock expires
+            poll_interval: Seconds between cache polls while waiting
+        """
+        self.namespace = namespace
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+
+    @property
+    def cache(self):
+        return caches[getattr(settings, 'SINGLE_FLIGHT_CACHE', 'default')]
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn once for all concurrent callers of key
+
+        Args:
+            key: Identity of the work, e.g. the target URL
+            fn: Callable producing the result
+
+        Returns:
+            A copy of the shared result, so callers can mutate it freely
+
+        Raises:
+            Whatever fn raised, re-raised in every waiting caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = self._run_shared(key, fn)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return copy.deepcopy(call.result)
+
+    def _run_shared(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run fn under the cross-worker lock, or wait for the worker holding it"""
+        lock_key = f'{self.namespace}:lock:{key}'
+        deadline = time.monotonic() + self.lock_timeout
+
+        while True:
+            token = uuid.uuid4().hex
+            if self.cache.add(lock_key, token, self.lock_timeout):
+                try:
+                    result = fn()
+                    self.cache.set(self._result_key(key, token), result, self.lock_timeout)
+                    return result
+                finally:
+                    self._release_lock(lock_key, token)
+
+            holder = self.cache.get(lock_key)
+            while holder is not None and time.monotonic() < deadline:
+                shared = self.cache.get(self._result_key(key, holder), default=_MISSING)
+                if shared is not _MISSING:
+                    return shared
+                time.sleep(self.poll_interval)
+                if self.cache.get(lock_key) != holder:
+                    # Leader finished or failed; pick up its result or retry the lock
+                    shared = self.cache.get(self._result_key(key, holder), default=_MISSING)
+                    if shared is not _MISSING:
+                        return shared
+                    break
+
+            if time.monotonic() >= deadline:
+                return fn()
+
+    def _release_lock(self, lock_key: str, token: str) -> None:
+        """
+        Delete the lock only while it still holds token
+
+        A leader that outran lock_timeout must not free the lock a later
+        leader has taken since. Django's Redis backend checks and deletes in
+        one script; other backends compare first, leaving only the instant
+        between the two calls.
+        """
+        cache = self.cache
+        client = getattr(cache, '_cache', None)
+        if hasattr(client, 'get_client') and hasattr(client, '_serializer'):
+            cache_key = cache.make_and_validate_key(lock_key)
+            client.get_client(cache_key, write=True).eval(
+                _RELEASE_SCRIPT, 1, cache_key, client._serializer.dumps(token)
+            )
+            return
+        if cache.get(lock_key) == token:
+            cache.delete(lock_key)
+
+    def _result_key(self, key: str, token: str) -> str:
+        return f'{self.namespace}:result:{key}:{token}'
+
+
+# Shared by the scrapers so identical Letterboxd page scrapes are coalesced
+scrape_flight = SingleFlight(namespace='scrape')
@@ -0,0 +1,269 @@
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage, storages
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from django.db.models import Max
+from django.utils import timezone
+
+from .compression import precompress
+from .models import Movie, MovieEvent, Profile
+
+POINTER_NAME = 'latest.json'
+# Content-addressed list files live in <username>/v/, apart from the pointer, so the two
+# can get different cache headers
+VERSIONED_DIR = 'v'
+# Suffix of the precompressed copy for each encoding, as nginx gzip_static / brotli_static expect
+ENCODING_SUFFIXES = {'gzip': '.gz', 'br': '.br'}
+# STORAGES alias publishes are uploaded to, when configured (SNAPSHOT_STORAGE_BACKEND)
+STORAGE_ALIAS = 'snapshots'
+
+# Served by the web server / CDN from SNAPSHOT_ROOT (Netlify / Cloudflare Pages read _headers)
+HEADERS_FILE = """/*/latest.json
+  Cache-Control: public, max-age=0, must-revalidate
+/*/v/*
+  Cache-Control: public, max-age=31536000, immutable
+"""
+
+
+def _snapshot_root() -> Path:
+    return Path(getattr(settings, 'SNAPSHOT_ROOT', settings.BASE_DIR / 'snapshots'))
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write a file so readers see either the old or the new contents, never a partial one"""
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as temp_file:
+            temp_file.write(data)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def snapshot_storage() -> Optional[Storage]:
+    """The storage publishes are uploaded to, or None when SNAPSHOT_ROOT is served as is"""
+    if STORAGE_ALIAS not in settings.STORAGES:
+        return None
+    return storages[STORAGE_ALIAS]
+
+
+def _render(payload: Dict[str, Any]) -> bytes:
+    return json.dumps(payload, cls=DjangoJSONEncoder, separators=(',', ':')).encode()
+
+
+def render_snapshots(profile: Profile) -> Tuple[int, Dict[str, bytes]]:
+    """
+    Render the profile's favourites, saved and all lists with one query
+
+    Returns:
+        (version, {list name: JSON body}); version is the profile's newest
+        event id, read before the movies so the lists are at least that new
+    """
+    from .repository import MovieRepository
+
+    version = MovieEvent.objects.filter(profile=profile).aggregate(latest=Max('id'))['latest'] or 0
+    movies = MovieRepository.serialize_movies(Movie.objects.filter(profile=profile).order_by('-created_at'))
+    lists = {
+        'favourites': [movie for movie in movies if movie['status'] == Movie.Status.FAVORITE],
+        'saved': [movie for movie in movies if movie['status'] == Movie.Status.SAVED],
+        'all': movies,
+    }
+    return version, {
+        name: _render({'count': len(list_movies), 'movies': list_movies})
+        for name, list_movies in lists.items()
+    }
+
+
+def publish_snapshots(profile: Profile, force: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Publish the profile's lists as static files under SNAPSHOT_ROOT/<username>/
+
+    Each list goes to a content-addressed file (v/favourites.<hash>.json, plus
+    .gz/.br copies) that never changes once written, so it can be cached
+    forever; latest.json points at the current ones. Files are written
+    atomically and the pointer last, and a pointer is never replaced by one
+    built from older data. Files no longer pointed to are removed after
+    SNAPSHOT_GRACE_SECONDS, so clients holding the previous pointer can
+    still fetch them.
+
+    With a snapshot storage configured the same files are uploaded to it,
+    in the same order, before the local pointer moves; a failed upload is
+    retried by the next publish.
+
+    Args:
+        profile: Profile to publish
+        force: Replace the pointer even if it is as new as this publish
+
+    Returns:
+        The pointer written, or None if a newer one was already published
+    """
+    version, bodies = render_snapshots(profile)
+
+    root = _snapshot_root()
+    directory = root / profile.username
+    (directory / VERSIONED_DIR).mkdir(parents=True, exist_ok=True)
+    if not (root / '_headers').exists():
+        _atomic_write(root / '_headers', HEADERS_FILE.encode())
+
+    files = {}
+    for name, body in bodies.items():
+        filename = f'{VERSIONED_DIR}/{name}.{hashlib.sha256(body).hexdigest()[:16]}.json'
+        files[name] = filename
+        if (directory / filename).exists():
+            continue
+        for encoding, compressed in precompress(body).items():
+            _atomic_write(directory / (filename + ENCODING_SUFFIXES[encoding]), compressed)
+        _atomic_write(directory / filename, body)
+
+    pointer = {
+        'version': version,
+        'published_at': timezone.now().isoformat(),
+        'files': files,
+    }
+
+    # Serialize pointer updates across workers, so an older publish can't land last
+    with open(directory / '.lock', 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            current = json.loads((directory / POINTER_NAME).read_bytes())
+        except (OSError, ValueError):
+            current = None
+        if current is not None and not force:
+            if current.get('version', 0) > version or current.get('files') == files:
+                return None
+        storage = snapshot_storage()
+        if storage is not None and not upload_snapshots(storage, profile, directory, pointer, force):
+            return None
+        _atomic_write(directory / POINTER_NAME, _render(pointer))
+        _remove_stale_files(directory, set(files.values()))
+    return pointer
+
+
+def upload_snapshots(storage: Storage, profile: Profile, directory: Path, pointer: Dict[str, Any],
+                     force: bool = False) -> bool:
+    """
+    Copy a publish from SNAPSHOT_ROOT to the snapshot storage, under <username>/
+
+    List files go first (content-addressed, so ones already there are
+    skipped), then the pointer, unless another host already uploaded a newer
+    one. Files no longer pointed to are deleted after SNAPSHOT_GRACE_SECONDS.
+
+    Returns:
+        False if the uploaded pointer was newer and was left in place
+    """
+    if not storage.exists('_headers'):
+        _replace(storage, '_headers', HEADERS_FILE.encode())
+
+    for filename in pointer['files'].values():
+        # Compressed copies before the file itself, as for the local files
+        for suffix in (*ENCODING_SUFFIXES.values(), ''):
+            path = directory / (filename + suffix)
+            name = f'{profile.username}/{filename}{suffix}'
+            if path.exists() and not storage.exists(name):
+                storage.save(name, ContentFile(path.read_bytes()))
+
+    pointer_name = f'{profile.username}/{POINTER_NAME}'
+    if not force:
+        try:
+            with storage.open(pointer_name) as pointer_file:
+                current = json.loads(pointer_file.read())
+        except (OSError, ValueError):
+            current = None
+        if current is not None and current.get('version', 0) > pointer['version']:
+            return False
+    _replace(storage, pointer_name, _render(pointer))
+    _remove_stale_uploads(storage, profile.username, set(pointer['files'].values()))
+    return True
+
+
+def _replace(storage: Storage, name: str, data: bytes) -> None:
+    """Overwrite name in place; storages that would save under another name are refused"""
+    saved = storage.save(name, ContentFile(data))
+    if saved != name:
+        storage.delete(saved)
+        raise ImproperlyConfigured(
+            f'The snapshot storage saved {name} as {saved}; enable overwriting in SNAPSHOT_STORAGE_OPTIONS '
+            '("file_overwrite": true for S3, "allow_overwrite": true for FileSystemStorage)'
+        )
+
+
+def _remove_stale_uploads(storage: Storage, username: str, current: set) -> None:
+    cutoff = time.time() - getattr(settings, 'SNAPSHOT_GRACE_SECONDS', 3600)
+    _, names = storage.listdir(f'{username}/{VERSIONED_DIR}')
+    for name in names:
+        if f'{VERSIONED_DIR}/{name.split(".json")[0]}.json' in current:
+            continue
+        path = f'{username}/{VERSIONED_DIR}/{name}'
+        if storage.get_modified_time(path).timestamp() < cutoff:
+            storage.delete(path)
+
+
+def _remove_stale_files(directory: Path, current: set) -> None:
+    cutoff = time.time() - getattr(settings, 'SNAPSHOT_GRACE_SECONDS', 3600)
+    for path in (directory / VERSIONED_DIR).iterdir():
+        # favourites.<hash>.json.gz belongs to favourites.<hash>.json
+        if f'{VERSIONED_DIR}/{path.name.split(".json")[0]}.json' in current:
+            continue
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class SnapshotPublisher:
+    """
+    Publishes snapshots on a background thread, off the request path
+
+    Requests for a profile that is already queued are coalesced. The pending
+    mark is cleared when a publish starts, so a write committing mid-publish
+    queues one more run and the files always catch up.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='snapshots')
+
+    def schedule(self, profile: Profile) -> None:
+        with self._lock:
+            if profile.id in self._pending:
+                return
+            self._pending.add(profile.id)
+        self._executor.submit(self._publish, profile)
+
+    def _publish(self, profile: Profile) -> None:
+        with self._lock:
+            self._pending.discard(profile.id)
+        try:
+            publish_snapshots(profile)
+        except Exception as e:
+            print(f"Error publishing snapshots for {profile.username}: {e}")
+        finally:
+            connection.close()
+
+
+publisher = SnapshotPublisher()
+
+
+def schedule_publish(profile: Profile) -> None:
+    """Republish the profile's snapshots in the background, if SNAPSHOT_PUBLISH is on"""
+    if getattr(settings, 'SNAPSHOT_PUBLISH', False):
+        publisher.schedule(profile)
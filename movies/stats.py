@@ -0,0 +1,131 @@
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db import connection, transaction
+from django.db.models import Count
+
+from .models import Movie, MovieStat, Profile
+
+# (dimension, value) -> change in count
+StatDeltas = Counter
+
+
+def decade_of(year: str) -> str:
+    """'1999' -> '1990s'; blank for a missing or malformed year"""
+    return f'{year[:3]}0s' if len(year) == 4 and year.isdigit() else ''
+
+
+def movie_stat_keys(status: str, year: str) -> List[Tuple[str, str]]:
+    """Every (dimension, value) a movie counts towards"""
+    year = year if len(year) == 4 and year.isdigit() else ''
+    return [
+        (MovieStat.Dimension.STATUS.value, str(status)),
+        (MovieStat.Dimension.YEAR.value, year),
+        (MovieStat.Dimension.DECADE.value, decade_of(year)),
+    ]
+
+
+def movie_deltas(movies: Iterable[Tuple[str, str]], sign: int = 1) -> StatDeltas:
+    """Deltas for adding (sign=1) or removing (sign=-1) movies given as (status, year) pairs"""
+    deltas = StatDeltas()
+    for status, year in movies:
+        for key in movie_stat_keys(status, year or ''):
+            deltas[key] += sign
+    return deltas
+
+
+def status_change_deltas(changes: Iterable[Tuple[Optional[str], str]]) -> StatDeltas:
+    """Deltas for movies moving between statuses, given as (old status, new status) pairs"""
+    deltas = StatDeltas()
+    for old_status, new_status in changes:
+        if old_status is None or str(old_status) == str(new_status):
+            continue
+        deltas[(MovieStat.Dimension.STATUS.value, str(old_status))] -= 1
+        deltas[(MovieStat.Dimension.STATUS.value, str(new_status))] += 1
+    return deltas
+
+
+def apply_stat_deltas(profile_id: int, deltas: StatDeltas) -> None:
+    """
+    Add deltas to the profile's stat rows with one INSERT ... ON CONFLICT statement
+
+    Must run in the same transaction as the write the deltas describe. Rows
+    are written in key order so concurrent writers lock them in the same order.
+    """
+    changes = sorted((key, delta) for key, delta in deltas.items() if delta)
+    if not changes:
+        return
+
+    table = connection.ops.quote_name(MovieStat._meta.db_table)
+    values_sql = ', '.join(['(%s, %s, %s, %s)'] * len(changes))
+    params: List[Any] = []
+    for (dimension, value), delta in changes:
+        params.extend([profile_id, dimension, value, delta])
+
+    sql = (
+        f'INSERT INTO {table} ("profile_id", "dimension", "value", "count") VALUES {values_sql} '
+        f'ON CONFLICT ("profile_id", "dimension", "value") '
+        f'DO UPDATE SET "count" = {table}."count" + EXCLUDED."count"'
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+
+
+def count_movie_stats(profile: Profile) -> StatDeltas:
+    """Recompute the profile's stat counts from the movies table"""
+    rows = (
+        Movie.objects.filter(profile=profile).order_by()
+        .values_list('status', 'year').annotate(movies=Count('id'))
+    )
+    counts = StatDeltas()
+    for status, year, movies in rows:
+        for key in movie_stat_keys(status, year or ''):
+            counts[key] += movies
+    return counts
+
+
+def rebuild_profile_stats(profile: Profile) -> int:
+    """
+    Replace the profile's stat rows with counts recomputed from the movies table
+
+    Returns:
+        Number of (dimension, value) counts that had drifted
+    """
+    with transaction.atomic():
+        # Make concurrent writers wait: the profile lock blocks inserts (foreign key check),
+        # the movie row locks block status updates and deletes
+        Profile.objects.select_for_update().filter(id=profile.id).first()
+        list(Movie.objects.select_for_update().filter(profile=profile).values_list('id', flat=True))
+        expected = count_movie_stats(profile)
+        current = {
+            (dimension, value): count
+            for dimension, value, count in MovieStat.objects.filter(profile=profile)
+            .values_list('dimension', 'value', 'count')
+        }
+        drifted = sum(
+            1 for key in set(current) | set(expected)
+            if current.get(key, 0) != expected.get(key, 0)
+        )
+
+        MovieStat.objects.filter(profile=profile).delete()
+        MovieStat.objects.bulk_create([
+            MovieStat(profile=profile, dimension=dimension, value=value, count=count)
+            for (dimension, value), count in expected.items() if count
+        ])
+    return drifted
+
+
+def summarize_stats(rows: Iterable[Tuple[str, str, int]]) -> Dict[str, Any]:
+    """Shape (dimension, value, count) rows into the stats payload"""
+    by_dimension: Dict[str, Dict[str, int]] = {dimension: {} for dimension in MovieStat.Dimension.values}
+    for dimension, value, count in rows:
+        if count > 0:
+            by_dimension[dimension][value or 'unknown'] = count
+
+    by_status = {status: by_dimension['status'].get(status, 0) for status in Movie.Status.values}
+    return {
+        'total': sum(by_status.values()),
+        'by_status': by_status,
+        'by_year': dict(sorted(by_dimension['year'].items())),
+        'by_decade': dict(sorted(by_dimension['decade'].items())),
+    }
@@ -0,0 +1,55 @@
+from typing import Any, Dict, Optional
+
+from .models import Profile
+from .repository import MovieRepository
+from .services import ImageOptimizer, LetterboxdScraper
+from .services.browser import get_browser_pool
+
+
+def sync_favourites(profile: Profile, scraper: Optional[LetterboxdScraper] = None,
+                    force: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Scrape a profile's favourites and save them unless they are unchanged
+
+    Args:
+        profile: Profile to sync
+        scraper: Scraper to use, e.g. one sharing a BrowserPool (if None, a new one
+            on this process's pool from get_browser_pool)
+        force: Save even when the fingerprint matches the last sync
+
+    Returns:
+        None if no movies were scraped, otherwise a summary with
+        changed, saved, scraped_count and last_synced_at
+
+    Raises:
+        ScrapeError: If scraping fails
+    """
+    scraper = scraper or LetterboxdScraper(browser_pool=get_browser_pool())
+    movies = scraper.scrape_favourites(profile.username)
+
+    if not movies:
+        return None
+
+    # Skip the write path when favourites haven't changed since the last sync
+    fingerprint = MovieRepository.fingerprint_favourites(movies)
+    last_sync = MovieRepository.get_favourites_sync(profile)
+
+    if not force and last_sync and last_sync.fingerprint == fingerprint:
+        return {
+            'changed': False,
+            'saved': True,
+            'scraped_count': len(movies),
+            'last_synced_at': last_sync.synced_at,
+        }
+
+    # Update image URLs before saving
+    movies = ImageOptimizer(width=2000, height=3000).update_movie_image_urls(movies)
+
+    saved = MovieRepository.save_favourites(profile, movies, fingerprint=fingerprint)
+
+    return {
+        'changed': True,
+        'saved': saved,
+        'scraped_count': len(movies),
+        'last_synced_at': None,
+    }
@@ -0,0 +1,41 @@
+from django.core.cache import caches
+from django.test import Client
+
+from ..models import Profile
+from ..utils import generate_token
+
+
+class APITestMixin:
+    """Gives each test an authenticated client for the LETTERBOXD_USERNAME profile"""
+
+    def setUp(self):
+        super().setUp()
+        # Caches outlive test transactions; start every test from empty ones
+        for cache in caches.all():
+            cache.clear()
+        self.profile, _ = Profile.objects.get_or_create(username='mike')
+        token = generate_token('mike', 'test-word')
+        self.client = Client(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def get(self, path, **kwargs):
+        return self.client.get(path, secure=True, **kwargs)
+
+    def post(self, path, data=None, **kwargs):
+        return self.client.post(path, data or {}, content_type='application/json', secure=True, **kwargs)
+
+    def put(self, path, data=None, **kwargs):
+        return self.client.put(path, data or {}, content_type='application/json', secure=True, **kwargs)
+
+    def delete(self, path, data=None, **kwargs):
+        return self.client.delete(path, data or {}, content_type='application/json', secure=True, **kwargs)
+
+
+def scraped_movie(title: str, year: str, slug: str = '') -> dict:
+    """A movie as the scrapers return it"""
+    slug = slug or title.lower().replace(' ', '-')
+    return {
+        'title': title,
+        'year': year,
+        'image_url': f'https://a.ltrbxd.com/resized/film-poster/{slug}-0-230-0-345-crop.jpg',
+        'link_url': f'https://letterboxd.com/film/{slug}/',
+    }
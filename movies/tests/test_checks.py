@@ -0,0 +1,28 @@
+import warnings
+
+from django.test import SimpleTestCase, override_settings
+
+from ..checks import check_asgi_connection_pool
+
+POSTGRES = {'ENGINE': 'django.db.backends.postgresql', 'NAME': 'boxd-out', 'OPTIONS': {}}
+POOLED_POSTGRES = {**POSTGRES, 'OPTIONS': {'pool': {'min_size': 1, 'max_size': 4}}}
+
+
+class AsgiConnectionPoolCheckTests(SimpleTestCase):
+    """manage.py check fails while ASGI would open a Postgres connection per request"""
+
+    def check(self, **overrides):
+        # Only the check reads these DATABASES; overriding them warns that connections won't follow
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            with override_settings(**overrides):
+                return [error.id for error in check_asgi_connection_pool(None)]
+
+    def test_asgi_without_pool(self):
+        self.assertEqual(self.check(SERVE_ASGI=True, DATABASES={'default': POSTGRES}), ['movies.E003'])
+
+    def test_asgi_with_pool(self):
+        self.assertEqual(self.check(SERVE_ASGI=True, DATABASES={'default': POOLED_POSTGRES}), [])
+
+    def test_wsgi(self):
+        self.assertEqual(self.check(SERVE_ASGI=False, DATABASES={'default': POSTGRES}), [])
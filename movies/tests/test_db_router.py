@@ -0,0 +1,69 @@
+import time
+from unittest import mock
+
+from django.core.checks import run_checks
+from django.db import transaction
+from django.test import TransactionTestCase, override_settings
+
+from config.test_settings import SHARED_CACHES
+
+from ..checks import check_replica_sticky_cache
+from ..db_router import ReplicaRouter, mark_recent_write
+from ..models import Movie, Profile
+from ..repository import MovieRepository
+
+
+@override_settings(REPLICA_READS=True, REPLICA_STICKY_SECONDS=5)
+class ReplicaRouterTests(TransactionTestCase):
+    """List reads go to the replica, except right after the profile's own writes and inside transactions"""
+
+    databases = {'default', 'replica'}
+
+    def setUp(self):
+        self.profile = Profile.objects.create(username='anna')
+        Profile.objects.using('replica').create(id=self.profile.id, username='anna')
+        Movie.objects.create(profile=self.profile, title='On the primary', year='1979')
+        Movie.objects.using('replica').create(profile_id=self.profile.id, title='On the replica', year='1979')
+
+    def titles(self):
+        return [movie['title'] for movie in MovieRepository.get_all_movies(self.profile)]
+
+    def test_reads_go_to_replica(self):
+        self.assertEqual(self.titles(), ['On the replica'])
+        # Outside the repository's read methods everything stays on the primary
+        self.assertEqual(Movie.objects.get(profile=self.profile).title, 'On the primary')
+
+    def test_writes_go_to_primary(self):
+        self.assertEqual(ReplicaRouter().db_for_write(Movie), 'default')
+        MovieRepository.save_movie(self.profile, 'Saved', '1995', '', 'https://letterboxd.com/film/saved/')
+        self.assertFalse(Movie.objects.using('replica').filter(title='Saved').exists())
+
+    def test_sticky_after_write(self):
+        mark_recent_write(self.profile)
+        self.assertEqual(self.titles(), ['On the primary'])
+        with mock.patch('movies.db_router.time.time', return_value=time.time() + 6):
+            self.assertEqual(self.titles(), ['On the replica'])
+
+    def test_primary_inside_atomic(self):
+        with transaction.atomic():
+            Movie.objects.create(profile=self.profile, title='Uncommitted', year='1995')
+            self.assertEqual(sorted(self.titles()), ['On the primary', 'Uncommitted'])
+
+    @override_settings(REPLICA_READS=False)
+    def test_replica_reads_off(self):
+        self.assertEqual(self.titles(), ['On the primary'])
+
+
+class ReplicaCacheCheckTests(TransactionTestCase):
+    """manage.py check fails while replica reads rely on a per-process cache"""
+
+    def test_per_process_cache(self):
+        self.assertEqual(check_replica_sticky_cache(None), [])
+        with override_settings(REPLICA_READS=True):
+            errors = check_replica_sticky_cache(None)
+        self.assertEqual([error.id for error in errors], ['movies.E001'])
+
+    @override_settings(REPLICA_READS=True, CACHES=SHARED_CACHES)
+    def test_shared_cache(self):
+        self.assertEqual(check_replica_sticky_cache(None), [])
+        self.assertNotIn('movies.E001', [error.id for error in run_checks()])
@@ -0,0 +1,71 @@
+import asyncio
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.test import TransactionTestCase, override_settings
+from django.utils import timezone
+
+from ..events import broadcaster, event_stream
+from ..models import MovieEvent, Profile
+
+
+@override_settings(EVENTS_HEARTBEAT_SECONDS=0.2)
+class LateCommitTests(TransactionTestCase):
+    """Events are streamed even when they commit after an event with a higher id"""
+
+    def setUp(self):
+        self.profile = Profile.objects.create(username='anna')
+        self.log(10)
+
+    def log(self, event_id, **changes):
+        return MovieEvent.objects.create(
+            id=event_id, profile=self.profile, kind=MovieEvent.Kind.UPDATED, movie_id=event_id,
+            data={'status': 'FAVORITE'}, **changes
+        )
+
+    async def commit(self, event_id):
+        """Log an event as its transaction commits, waking the profile's streams"""
+        await sync_to_async(self.log)(event_id)
+        broadcaster.publish(self.profile.id)
+
+    async def next_event_id(self, stream):
+        async with asyncio.timeout(2):
+            while True:
+                message = await anext(stream)
+                if message.startswith('id: '):
+                    return int(message.split('\n', 1)[0][len('id: '):])
+
+    async def test_live_stream(self):
+        stream = event_stream(self.profile.id, None)
+        await anext(stream)  # retry:
+        # Event 12 was allocated first but commits after 13
+        await self.commit(13)
+        self.assertEqual(await self.next_event_id(stream), 13)
+        await self.commit(12)
+        self.assertEqual(await self.next_event_id(stream), 12)
+        await self.commit(14)
+        self.assertEqual(await self.next_event_id(stream), 14)
+        await stream.aclose()
+
+    async def test_resume(self):
+        await sync_to_async(self.log)(13)
+        # Resuming after 13 once 12 committed: the window before 13 is sent again, in id order
+        await sync_to_async(self.log)(12)
+        stream = event_stream(self.profile.id, 13)
+        await anext(stream)  # retry:
+        self.assertEqual([await self.next_event_id(stream) for _ in range(3)], [10, 12, 13])
+        await stream.aclose()
+
+    async def test_resume_after_window(self):
+        await sync_to_async(self.log)(11)
+        await sync_to_async(MovieEvent.objects.filter(id=11).update)(
+            created_at=timezone.now() - timedelta(minutes=5)
+        )
+        await sync_to_async(self.log)(13)
+        stream = event_stream(self.profile.id, 13)
+        await anext(stream)  # retry:
+        # Only events created less than EVENTS_REORDER_SECONDS before 13 are sent again, not 10 or 11
+        self.assertEqual(await self.next_event_id(stream), 13)
+        await self.commit(14)
+        self.assertEqual(await self.next_event_id(stream), 14)
+        await stream.aclose()
@@ -0,0 +1,69 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from ..models import FavouritesSync, Movie, Profile
+from ..repository import MovieRepository
+from ..sync import sync_favourites
+from .helpers import scraped_movie
+
+FAVOURITES = [scraped_movie('Alien', '1979'), scraped_movie('Heat', '1995')]
+
+
+class FavouritesSyncTests(TestCase):
+    def setUp(self):
+        self.profile = Profile.objects.create(username='anna')
+        self.scraper = mock.Mock()
+        self.scraper.scrape_favourites.return_value = FAVOURITES
+
+    def sync(self, **kwargs):
+        return sync_favourites(self.profile, scraper=self.scraper, **kwargs)
+
+    def test_unchanged_favourites_skip_the_write(self):
+        self.assertTrue(self.sync()['changed'])
+        self.assertFalse(self.sync()['changed'])
+
+    def test_sync_record_follows_a_renamed_profile(self):
+        self.sync()
+        Profile.objects.filter(pk=self.profile.pk).update(username='anna-renamed')
+        self.profile.refresh_from_db()
+
+        self.assertEqual(FavouritesSync.objects.get().profile, self.profile)
+        self.assertFalse(self.sync()['changed'])
+        self.assertEqual(Movie.objects.filter(profile=self.profile).count(), 2)
+
+
+class FavouritesDriftTests(TestCase):
+    """Local writes to favourites make the next sync save again instead of matching the fingerprint"""
+
+    def setUp(self):
+        self.profile = Profile.objects.create(username='anna')
+        self.scraper = mock.Mock()
+        self.scraper.scrape_favourites.return_value = FAVOURITES
+        sync_favourites(self.profile, scraper=self.scraper)
+        self.alien = Movie.objects.get(profile=self.profile, title='Alien')
+
+    def assert_next_sync_repairs(self):
+        result = sync_favourites(self.profile, scraper=self.scraper)
+        self.assertTrue(result['changed'])
+        favourites = Movie.objects.filter(profile=self.profile, status=Movie.Status.FAVORITE)
+        self.assertEqual(set(favourites.values_list('title', flat=True)), {'Alien', 'Heat'})
+
+    def test_deleted_favourite(self):
+        MovieRepository.delete_movie(self.profile, self.alien.id)
+        self.assert_next_sync_repairs()
+
+    def test_demoted_favourite(self):
+        MovieRepository.update_movie_status(self.profile, self.alien.id, Movie.Status.SAVED)
+        self.assert_next_sync_repairs()
+
+    def test_bulk_writes(self):
+        MovieRepository.bulk_update_status(self.profile, Movie.Status.SAVED, filters={'title': 'Heat'})
+        self.assert_next_sync_repairs()
+        MovieRepository.bulk_delete_movies(self.profile, movie_ids=[self.alien.id])
+        self.assert_next_sync_repairs()
+
+    def test_writes_to_other_movies_keep_the_fingerprint(self):
+        movie, _ = MovieRepository.save_movie(self.profile, 'Ran', '1985', '', 'https://letterboxd.com/film/ran/')
+        MovieRepository.delete_movie(self.profile, movie.id)
+        self.assertFalse(sync_favourites(self.profile, scraper=self.scraper)['changed'])
@@ -0,0 +1,103 @@
+import threading
+from datetime import timedelta
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from .. import idempotency
+from ..idempotency import claim_key, idempotent
+from ..models import IdempotencyKey, Profile
+
+
+class ClaimKeyTests(TestCase):
+    """One request owns a key at a time; expired keys and dead holders can be taken over"""
+
+    def setUp(self):
+        self.profile = Profile.objects.create(username='anna')
+
+    def test_claim(self):
+        record, claimed = claim_key(self.profile, 'k1', 'fingerprint')
+        self.assertTrue(claimed)
+        self.assertEqual(record.state, IdempotencyKey.State.IN_PROGRESS)
+        duplicate, claimed = claim_key(self.profile, 'k1', 'fingerprint')
+        self.assertFalse(claimed)
+        self.assertEqual(duplicate.pk, record.pk)
+
+    def test_takeover(self):
+        past = timezone.now() - timedelta(seconds=1)
+        for label, changes in [
+            ('dead holder', {'locked_until': past}),
+            ('expired', {'state': IdempotencyKey.State.COMPLETED, 'expires_at': past}),
+        ]:
+            with self.subTest(label):
+                record, _ = claim_key(self.profile, label, 'first')
+                IdempotencyKey.objects.filter(pk=record.pk).update(**changes)
+                record, claimed = claim_key(self.profile, label, 'second')
+                self.assertTrue(claimed)
+                self.assertEqual(record.request_fingerprint, 'second')
+
+
+class IdempotentViewTests(TransactionTestCase):
+    """Retries replay the stored response; a duplicate waiting in this process never sees a 409"""
+
+    def setUp(self):
+        self.profile = Profile.objects.create(username='anna')
+        self.calls = 0
+        self.during_view = lambda: None
+
+        @api_view(['POST'])
+        @idempotent
+        def view(request):
+            self.calls += 1
+            self.during_view()
+            return Response({'saved': self.calls}, status=201)
+        self.view = view
+
+    def post(self, key='k1'):
+        request = APIRequestFactory().post('/api/movies/save-new/', {'movie_title': 'alien'}, format='json',
+                                           HTTP_IDEMPOTENCY_KEY=key)
+        request.profile = self.profile
+        return self.view(request)
+
+    def test_replay(self):
+        first, retry = self.post(), self.post()
+        self.assertEqual((first.status_code, first.data), (201, {'saved': 1}))
+        self.assertEqual((retry.status_code, retry.data), (201, {'saved': 1}))
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+        self.assertEqual(self.calls, 1)
+
+    def test_duplicate_waiting_in_process(self):
+        seen = {}
+        complete_key = idempotency.complete_key
+
+        def check_order(record, response):
+            # Duplicates are only woken once the response is stored
+            seen['woken_before_complete'] = seen['running'].is_set()
+            complete_key(record, response)
+
+        def duplicate():
+            try:
+                seen['record'] = idempotency._wait_for_key(seen['holder'], seen['running'])
+            finally:
+                connection.close()
+
+        def start_duplicate():
+            # A duplicate arriving while the view runs finds the key held by this process
+            seen['holder'] = IdempotencyKey.objects.get(profile=self.profile, key='k1')
+            seen['running'] = idempotency._running[(self.profile.id, 'k1')]
+            waiter.start()
+
+        waiter = threading.Thread(target=duplicate)
+        self.during_view = start_duplicate
+        with mock.patch.object(idempotency, 'complete_key', check_order):
+            self.assertEqual(self.post().status_code, 201)
+        waiter.join(5)
+
+        self.assertFalse(seen['woken_before_complete'])
+        self.assertEqual(seen['record'].state, IdempotencyKey.State.COMPLETED)
+        self.assertEqual(seen['record'].response_data, {'saved': 1})
@@ -0,0 +1,58 @@
+from django.db import transaction
+from django.test import TransactionTestCase, override_settings
+
+from config.test_settings import SHARED_CACHES
+
+from ..checks import check_list_cache
+from ..list_cache import _list_version
+from ..models import Movie
+from ..repository import MovieRepository
+from .helpers import APITestMixin
+
+
+class ListCacheTests(APITestMixin, TransactionTestCase):
+    """Cached lists are dropped when the profile's movies change"""
+
+    def test_write_invalidates_lists(self):
+        self.assertEqual(self.get('/api/movies/').json()['count'], 0)
+        MovieRepository.save_movie(self.profile, 'Alien', '1979', '', 'https://letterboxd.com/film/alien/')
+        self.assertEqual(self.get('/api/movies/').json()['count'], 1)
+
+    def save_alien(self, status=Movie.Status.SAVED):
+        return MovieRepository.save_movie(
+            self.profile, 'Alien', '1979', '', 'https://letterboxd.com/film/alien/', status=status
+        )
+
+    def test_unchanged_write_keeps_lists(self):
+        movie, _ = self.save_alien()
+        version = _list_version(self.profile.id)
+        self.save_alien()
+        MovieRepository.update_movie_status(self.profile, movie.id, Movie.Status.SAVED)
+        MovieRepository.bulk_delete_movies(self.profile, [movie.id + 1])
+        self.assertEqual(_list_version(self.profile.id), version)
+
+    def test_rolled_back_write_keeps_lists(self):
+        version = _list_version(self.profile.id)
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            self.save_alien()
+            raise RuntimeError
+        self.assertEqual(_list_version(self.profile.id), version)
+        self.save_alien(Movie.Status.FAVORITE)
+        self.assertNotEqual(_list_version(self.profile.id), version)
+
+
+class ListCacheCheckTests(TransactionTestCase):
+    """manage.py check fails while several workers would each keep their own list cache"""
+
+    def test_single_worker(self):
+        self.assertEqual(check_list_cache(None), [])
+
+    @override_settings(WEB_CONCURRENCY=2)
+    def test_per_process_cache(self):
+        self.assertEqual([error.id for error in check_list_cache(None)], ['movies.E002'])
+        with self.settings(LIST_CACHE_TIMEOUT=0):
+            self.assertEqual(check_list_cache(None), [])
+
+    @override_settings(WEB_CONCURRENCY=2, CACHES=SHARED_CACHES)
+    def test_shared_cache(self):
+        self.assertEqual(check_list_cache(None), [])
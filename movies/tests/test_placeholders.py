@@ -0,0 +1,123 @@
+import os
+import subprocess
+import sys
+from concurrent.futures import Executor, Future
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase
+
+from ..models import Movie, Profile
+from ..placeholders import refresh_placeholders
+from ..services.placeholder_service import compute_placeholder
+
+POSTERS = Path(__file__).parent / 'fixtures' / 'posters'
+
+
+def poster(name):
+    return (POSTERS / f'{name}.png').read_bytes()
+
+
+class InlineExecutor(Executor):
+    """Runs each submitted call straight away, in the calling thread"""
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+class ComputePlaceholderTests(SimpleTestCase):
+    """Blurhashes match the reference encoder (the blurhash package) on the fixture posters"""
+
+    def test_solid_poster(self):
+        self.assertEqual(compute_placeholder(poster('solid')), {
+            'blurhash': 'T7M2ru}EfQ=Ko1fQfQfQfQ=Ko1fQ',
+            'dominant_color': '#c0392b',
+        })
+
+    def test_two_tone_poster(self):
+        # Yellow top third, blue below: blue covers most of the poster
+        self.assertEqual(compute_placeholder(poster('two_tone')), {
+            'blurhash': 'T~HK|WoffQ~1ocfQ?7j?fQt5j@fQ',
+            'dominant_color': '#1f3a93',
+        })
+
+    def test_not_an_image(self):
+        with self.assertRaises(OSError):
+            compute_placeholder(b'not an image')
+
+
+    def test_pillow_not_loaded_at_boot(self):
+        # Only the poster decoding processes import Pillow, not every worker
+        snippet = (
+            "import sys\n"
+            "import config.wsgi\n"
+            "from django.urls import get_resolver\n"
+            "_ = get_resolver().url_patterns\n"
+            "print('PIL' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', snippet], cwd=settings.BASE_DIR, capture_output=True, text=True,
+            check=True, env=dict(os.environ, DJANGO_SETTINGS_MODULE='config.test_settings'),
+        )
+        self.assertEqual(result.stdout.strip(), 'False')
+
+
+class RefreshPlaceholdersTests(TestCase):
+    """Placeholders are computed for posters that need them, with a fake download"""
+
+    def setUp(self):
+        self.profile = Profile.objects.create(username='anna')
+        self.posters = {'alien': poster('solid'), 'heat': poster('two_tone')}
+        for slug in ['alien', 'heat', 'ran']:
+            Movie.objects.create(
+                profile=self.profile, title=slug.title(), year='1979', slug=slug,
+                image_url=f'https://a.ltrbxd.com/resized/film-poster/{slug}-0-230-0-345-crop.jpg',
+            )
+        self.fetch = mock.Mock(side_effect=self.fake_fetch)
+        # refresh_placeholders reports failed posters with print
+        self.enterContext(mock.patch('builtins.print'))
+
+    def fake_fetch(self, movie):
+        if movie.slug not in self.posters:
+            raise OSError('404 Not Found')
+        return self.posters[movie.slug]
+
+    def refresh(self, **kwargs):
+        return refresh_placeholders(self.profile, fetch=self.fetch, executor=InlineExecutor(), **kwargs)
+
+    def placeholders(self):
+        return dict(Movie.objects.filter(profile=self.profile).values_list('slug', 'dominant_color'))
+
+    def test_refresh(self):
+        self.assertEqual(self.refresh(), 2)
+        self.assertEqual(self.placeholders(), {'alien': '#c0392b', 'heat': '#1f3a93', 'ran': ''})
+        alien = Movie.objects.get(profile=self.profile, slug='alien')
+        self.assertEqual(alien.blurhash, 'T7M2ru}EfQ=Ko1fQfQfQfQ=Ko1fQ')
+        self.assertEqual(alien.placeholder_image_url, alien.image_url)
+
+    def test_failed_posters_are_not_fetched_again(self):
+        self.refresh()
+        self.fetch.reset_mock()
+        self.assertEqual(self.refresh(), 0)
+        self.fetch.assert_not_called()
+        # force retries every poster
+        self.posters['ran'] = poster('solid')
+        self.assertEqual(self.refresh(force=True), 3)
+        self.assertEqual(self.placeholders()['ran'], '#c0392b')
+
+    def test_new_poster(self):
+        self.refresh()
+        Movie.objects.filter(slug='heat').update(
+            image_url='https://a.ltrbxd.com/resized/film-poster/heat-new-0-230-0-345-crop.jpg'
+        )
+        self.posters['heat'] = poster('solid')
+        self.fetch.reset_mock()
+        self.assertEqual(self.refresh(), 1)
+        self.assertEqual(self.fetch.call_count, 1)
+        self.assertEqual(self.placeholders()['heat'], '#c0392b')
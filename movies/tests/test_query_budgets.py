@@ -0,0 +1,107 @@
+from unittest import mock
+
+from django.conf import settings
+from django.test import TransactionTestCase
+
+from ..models import Movie
+from ..query_budget import assert_max_queries
+from ..repository import MovieRepository
+from ..services import LetterboxdScraper, SingleMovieScraper
+from .helpers import APITestMixin, scraped_movie
+
+# TransactionTestCase: under TestCase's wrapping transaction every atomic block becomes
+# SAVEPOINT / RELEASE statements, which production doesn't run and the budgets don't cover
+
+
+class ListBudgetTests(APITestMixin, TransactionTestCase):
+    """The list endpoints stay within their QUERY_BUDGETS, cold and cached"""
+
+    def setUp(self):
+        super().setUp()
+        for index in range(20):
+            MovieRepository.save_movie(
+                self.profile, f'Film {index}', str(1990 + index), '', f'https://letterboxd.com/film/film-{index}/',
+                status=Movie.Status.FAVORITE if index % 4 == 0 else Movie.Status.SAVED,
+            )
+
+    def test_lists(self):
+        for url_name, path in [
+            ('get_all_movies', '/api/movies/'),
+            ('get_favourites', '/api/movies/favourites/'),
+            ('get_saved_movies', '/api/movies/saved/'),
+            ('get_movie_stats', '/api/movies/stats/'),
+        ]:
+            with self.subTest(url_name):
+                with assert_max_queries(settings.QUERY_BUDGETS[url_name]):
+                    response = self.get(path)
+                self.assertEqual(response.status_code, 200)
+                # Served from the list cache the second time
+                with assert_max_queries(settings.QUERY_BUDGETS[url_name]):
+                    self.assertEqual(self.get(path).status_code, 200)
+
+    def test_filtered_and_projected_list(self):
+        with assert_max_queries(settings.QUERY_BUDGETS['get_all_movies']):
+            response = self.get('/api/movies/?decade=1990s&order=year&fields=id,title,year')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['count'], 10)
+
+
+class SaveBudgetTests(APITestMixin, TransactionTestCase):
+    """The scrape-and-save endpoints stay within their QUERY_BUDGETS (scrapers mocked)"""
+
+    def setUp(self):
+        super().setUp()
+        scrape = mock.patch.object(SingleMovieScraper, 'scrape_movie')
+        scrape.start().return_value = scraped_movie('Alien', '1979')
+        self.addCleanup(scrape.stop)
+
+    def test_save_new_movie(self):
+        with assert_max_queries(settings.QUERY_BUDGETS['save_new_movie']):
+            response = self.post('/api/movies/save-new/', {'movie_title': 'alien'})
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(Movie.objects.filter(profile=self.profile, slug='alien').exists())
+
+    def test_save_new_movie_idempotent(self):
+        with assert_max_queries(settings.QUERY_BUDGETS['save_new_movie']):
+            response = self.post('/api/movies/save-new/', {'movie_title': 'alien'}, HTTP_IDEMPOTENCY_KEY='k1')
+        self.assertEqual(response.status_code, 201)
+
+    def test_save_favourites(self):
+        favourites = [
+            scraped_movie('Heat', '1995'), scraped_movie('Ran', '1985'), scraped_movie('Up', '2009'),
+        ]
+        with mock.patch.object(LetterboxdScraper, 'scrape_favourites', return_value=favourites):
+            with assert_max_queries(settings.QUERY_BUDGETS['save_favourites']):
+                response = self.post('/api/scrape/favourites/save/')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Movie.objects.filter(profile=self.profile, status=Movie.Status.FAVORITE).count(), 3)
+
+
+class WriteBudgetTests(APITestMixin, TransactionTestCase):
+    """Edits to favourites stay within their QUERY_BUDGETS, including dropping the favourites fingerprint"""
+
+    def setUp(self):
+        super().setUp()
+        favourite = Movie.Status.FAVORITE
+        self.heat, _ = MovieRepository.save_movie(
+            self.profile, 'Heat', '1995', '', 'https://letterboxd.com/film/heat/', status=favourite,
+        )
+        self.ran, _ = MovieRepository.save_movie(
+            self.profile, 'Ran', '1985', '', 'https://letterboxd.com/film/ran/', status=favourite,
+        )
+
+    def test_demote_favourite(self):
+        with assert_max_queries(settings.QUERY_BUDGETS['update_movie_status']):
+            response = self.put(f'/api/movies/{self.heat.id}/status/', {'status': 'SAVED'})
+        self.assertEqual(response.status_code, 200)
+        with assert_max_queries(settings.QUERY_BUDGETS['bulk_update_movie_status']):
+            response = self.put('/api/movies/bulk/status/', {'ids': [self.ran.id], 'status': 'SAVED'})
+        self.assertEqual(response.status_code, 200)
+
+    def test_delete_favourite(self):
+        with assert_max_queries(settings.QUERY_BUDGETS['delete_movie']):
+            response = self.delete(f'/api/movies/{self.heat.id}/delete/')
+        self.assertEqual(response.status_code, 200)
+        with assert_max_queries(settings.QUERY_BUDGETS['bulk_delete_movies']):
+            response = self.post('/api/movies/bulk/delete/', {'ids': [self.ran.id]})
+        self.assertEqual(response.status_code, 200)
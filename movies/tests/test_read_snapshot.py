@@ -0,0 +1,106 @@
+from unittest import mock
+
+from django.db import connections
+from django.test import TransactionTestCase, override_settings
+
+from config.test_settings import SHARED_CACHES
+
+from ..checks import check_replica_sticky_cache
+from ..models import Movie, Profile
+from ..read_snapshot import META_TABLE, SnapshotSyncer, _state_path
+from ..repository import MovieRepository
+
+
+@override_settings(READ_SNAPSHOT=True, READ_SNAPSHOT_OVERLAP_SECONDS=0, LIST_CACHE_TIMEOUT=0)
+class SnapshotSyncTests(TransactionTestCase):
+    """The syncer copies everything once, then only changed rows and tombstoned deletes"""
+
+    databases = {'default', 'read_snapshot'}
+
+    def setUp(self):
+        # Sync progress outlives the flush between tests, so start every test from an empty snapshot
+        with connections['read_snapshot'].cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {META_TABLE}')
+        self.addCleanup(_state_path().unlink, missing_ok=True)
+        self.enterContext(mock.patch('movies.read_snapshot.ensure_syncer'))
+        self.profile = Profile.objects.create(username='anna')
+        self.alien = self.save('Alien', '1979')
+        self.heat = self.save('Heat', '1995')
+        self.syncer = SnapshotSyncer()
+
+    def save(self, title, year):
+        movie, _ = MovieRepository.save_movie(
+            self.profile, title, year, '', f'https://letterboxd.com/film/{title.lower()}/'
+        )
+        return movie
+
+    def snapshot_movies(self):
+        return dict(Movie.objects.using('read_snapshot').values_list('title', 'status'))
+
+    def test_first_sync_is_full(self):
+        state = self.syncer.sync_once()
+        self.assertEqual(state['movies'], 2)
+        self.assertIsNotNone(state['last_full_sync'])
+        self.assertEqual(self.snapshot_movies(), {'Alien': 'SAVED', 'Heat': 'SAVED'})
+        self.assertTrue(Profile.objects.using('read_snapshot').filter(username='anna').exists())
+
+    def test_incremental_sync(self):
+        first = self.syncer.sync_once()
+        self.save('Ran', '1985')
+        MovieRepository.update_movie_status(self.profile, self.alien.id, Movie.Status.FAVORITE)
+
+        state = self.syncer.sync_once()
+        self.assertEqual(state['last_full_sync'], first['last_full_sync'])
+        # Only rows at or past the watermark: the last one copied before, Ran and Alien
+        self.assertLessEqual(state['copied'], 3)
+        self.assertEqual(self.snapshot_movies(), {'Alien': 'FAVORITE', 'Heat': 'SAVED', 'Ran': 'SAVED'})
+
+    def test_tombstone_delete(self):
+        first = self.syncer.sync_once()
+        MovieRepository.delete_movie(self.profile, self.heat.id)
+
+        state = self.syncer.sync_once()
+        self.assertEqual(state['last_full_sync'], first['last_full_sync'])
+        self.assertEqual(state['movies'], 1)
+        self.assertEqual(self.snapshot_movies(), {'Alien': 'SAVED'})
+
+    def test_deleted_profile(self):
+        self.syncer.sync_once()
+        Profile.objects.filter(id=self.profile.id).delete()
+
+        state = self.syncer.sync_once()
+        self.assertEqual(state['movies'], 0)
+        self.assertFalse(Profile.objects.using('read_snapshot').exists())
+
+    def test_full_sync_after_schema_change(self):
+        first = self.syncer.sync_once()
+        with mock.patch('movies.read_snapshot.schema_fingerprint', return_value='changed'):
+            state = self.syncer.sync_once()
+        self.assertNotEqual(state['last_full_sync'], first['last_full_sync'])
+        self.assertEqual(state['movies'], 2)
+
+    def test_full_sync_once_tombstones_may_be_pruned(self):
+        first = self.syncer.sync_once()
+        with override_settings(EVENTS_RETENTION_HOURS=0):
+            state = self.syncer.sync_once()
+        self.assertNotEqual(state['last_full_sync'], first['last_full_sync'])
+
+    def test_reads_own_writes(self):
+        self.syncer.sync_once()
+        MovieRepository.update_movie_status(self.profile, self.heat.id, Movie.Status.FAVORITE)
+        Movie.objects.using('read_snapshot').filter(title='Alien').update(title='Alien (snapshot)')
+
+        # The write came after the sync started: the primary answers
+        titles = {movie['title'] for movie in MovieRepository.get_all_movies(self.profile)}
+        self.assertEqual(titles, {'Alien', 'Heat'})
+
+        # Once the write is older than the last sync, reads use the snapshot
+        self.syncer.sync_once()
+        titles = {movie['title'] for movie in MovieRepository.get_all_movies(self.profile)}
+        self.assertEqual(titles, {'Alien (snapshot)', 'Heat'})
+
+    def test_per_process_cache(self):
+        errors = check_replica_sticky_cache(None)
+        self.assertEqual([error.id for error in errors], ['movies.E001'])
+        with override_settings(CACHES=SHARED_CACHES):
+            self.assertEqual(check_replica_sticky_cache(None), [])
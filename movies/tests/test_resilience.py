@@ -0,0 +1,41 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from ..services.errors import ScrapeError, ScrapeTimeout
+from ..services.resilience import retry_call
+
+
+@mock.patch('movies.services.resilience.time.sleep')
+class RetryCallTests(SimpleTestCase):
+    """retry_call always calls fn, retries retryable errors and re-raises the last one"""
+
+    def failing(self, *errors, result='page'):
+        return mock.Mock(side_effect=[*errors, result])
+
+    def test_no_attempts_still_calls(self, sleep):
+        for attempts in (0, -1):
+            with self.subTest(attempts=attempts):
+                self.assertEqual(retry_call(self.failing(), attempts, 1.0, 8.0), 'page')
+                with self.assertRaises(ScrapeTimeout):
+                    retry_call(self.failing(ScrapeTimeout()), attempts, 1.0, 8.0)
+        sleep.assert_not_called()
+
+    def test_retries_retryable(self, sleep):
+        fn = self.failing(ScrapeTimeout(), ScrapeTimeout())
+        self.assertEqual(retry_call(fn, 3, 1.0, 8.0), 'page')
+        self.assertEqual(fn.call_count, 3)
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_reraises_last_error(self, sleep):
+        last = ScrapeTimeout('third')
+        fn = self.failing(ScrapeTimeout(), ScrapeTimeout(), last)
+        with self.assertRaises(ScrapeTimeout) as raised:
+            retry_call(fn, 3, 1.0, 8.0)
+        self.assertIs(raised.exception, last)
+
+    def test_no_retry_for_other_errors(self, sleep):
+        fn = self.failing(ScrapeError())
+        with self.assertRaises(ScrapeError):
+            retry_call(fn, 3, 1.0, 8.0)
+        self.assertEqual(fn.call_count, 1)
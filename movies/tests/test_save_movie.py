@@ -0,0 +1,58 @@
+from django.test import TestCase
+
+from ..models import Movie, Profile
+from ..repository import MovieRepository, SaveOutcome
+from .helpers import APITestMixin
+
+
+def save(profile, title, year, slug, **kwargs):
+    return MovieRepository.save_movie(
+        profile, title, year, '', f'https://letterboxd.com/film/{slug}/', **kwargs
+    )
+
+
+class SaveMovieSlugTests(TestCase):
+    """A re-scrape under a new title or year updates the row with the film's slug"""
+
+    def setUp(self):
+        self.profile = Profile.objects.create(username='anna')
+        self.movie, _ = save(self.profile, 'Alien', '1978', 'alien')
+
+    def test_new_title_and_year(self):
+        movie, outcome = save(self.profile, 'Alien', '1979', 'alien')
+        self.assertEqual(outcome, SaveOutcome.UPDATED)
+        self.assertEqual(movie.id, self.movie.id)
+        self.assertEqual(
+            list(Movie.objects.filter(profile=self.profile).values_list('title', 'year', 'release_year')),
+            [('Alien', '1979', 1979)],
+        )
+        self.assertEqual(MovieRepository.get_stats(self.profile)['by_year'], {'1979': 1})
+        # Saving the same again changes nothing
+        self.assertEqual(save(self.profile, 'Alien', '1979', 'alien')[1], SaveOutcome.UNCHANGED)
+
+    def test_new_title_and_status(self):
+        movie, outcome = save(self.profile, 'Alien: Director’s Cut', '1978', 'alien',
+                              status=Movie.Status.FAVORITE)
+        self.assertEqual(outcome, SaveOutcome.UPDATED)
+        self.assertEqual((movie.id, movie.title, movie.status),
+                         (self.movie.id, 'Alien: Director’s Cut', Movie.Status.FAVORITE))
+
+    def test_title_taken_by_another_row(self):
+        other, _ = MovieRepository.save_movie(self.profile, 'Aliens', '1986', '', '')
+        movie, outcome = save(self.profile, 'Aliens', '1986', 'alien')
+        self.assertEqual(movie.id, other.id)
+        self.assertEqual(outcome, SaveOutcome.UPDATED)
+        # The slug stays on the row that had it
+        self.assertEqual(Movie.objects.get(id=self.movie.id).slug, 'alien')
+        self.assertEqual(Movie.objects.get(id=other.id).slug, '')
+
+
+class SaveNewMovieViewTests(APITestMixin, TestCase):
+    """Malformed request bodies get a 400, not a 500"""
+
+    def test_movie_title_not_a_string(self):
+        for movie_title in (123, ['alien'], {'slug': 'alien'}):
+            with self.subTest(movie_title=movie_title):
+                response = self.post('/api/movies/save-new/', {'movie_title': movie_title})
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json(), {'error': 'movie_title must be a string'})
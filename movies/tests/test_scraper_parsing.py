@@ -0,0 +1,74 @@
+from pathlib import Path
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from ..services import LetterboxdScraper, ScrapeBlocked, SingleMovieScraper
+from ..services.base_scraper import classify_error_page
+from ..services.page_policy import LEAN_PAGE_POLICY
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+def fixture(name):
+    return (FIXTURES / name).read_text()
+
+
+class LeanPagePosterTests(SimpleTestCase):
+    """Poster URLs still come through when the lean policy keeps images from loading"""
+
+    def test_lean_policy_blocks_images(self):
+        self.assertTrue(LEAN_PAGE_POLICY.disable_images)
+        self.assertIn('*.jpg*', LEAN_PAGE_POLICY.blocked_url_patterns)
+        self.assertNotIn('*.css*', LEAN_PAGE_POLICY.blocked_url_patterns)
+
+    def test_favourites(self):
+        scraper = LetterboxdScraper(page_policy=LEAN_PAGE_POLICY)
+        movies = scraper._parse_movies_from_html(fixture('favourites_lean.html'))
+        self.assertEqual([movie['title'] for movie in movies], ['Alien', 'Heat', 'Ran'])
+        self.assertEqual([movie['image_url'] for movie in movies], [
+            # Placeholder in src: the lazily loaded URL from data-src
+            'https://a.ltrbxd.com/resized/film-poster/5/1/6/8/alien-0-150-0-225-crop.jpg?v=1',
+            # Placeholder in src: the first srcset candidate
+            'https://a.ltrbxd.com/resized/film-poster/5/1/2/heat-0-150-0-225-crop.jpg?v=2',
+            # Already loaded
+            'https://a.ltrbxd.com/resized/film-poster/4/6/ran-0-150-0-225-crop.jpg?v=3',
+        ])
+        self.assertEqual(movies[1]['year'], '1995')
+
+    def test_film_page_dom(self):
+        scraper = SingleMovieScraper(page_policy=LEAN_PAGE_POLICY)
+        movie = scraper._parse_movie_from_html(fixture('film_lean.html'), 'https://letterboxd.com/film/alien/')
+        self.assertEqual(movie['title'], 'Alien')
+        self.assertEqual(
+            movie['image_url'], 'https://a.ltrbxd.com/resized/film-poster/5/1/6/8/alien-0-230-0-345-crop.jpg?v=1',
+        )
+
+
+class ErrorPageTests(SimpleTestCase):
+    """Error and challenge pages are told apart from films that happen to share their titles"""
+
+    def test_films_named_like_error_pages(self):
+        for title in ['Not Found (2016) • Letterboxd', 'Access Denied (2022) • Letterboxd',
+                      'Just a Moment… (2019) • Letterboxd']:
+            with self.subTest(title):
+                self.assertIsNone(classify_error_page(title, fixture('film_lean.html')))
+
+    def test_error_titles(self):
+        self.assertEqual(classify_error_page('Page Not Found', ''), 'not_found')
+        self.assertEqual(classify_error_page('Just a moment...', ''), 'blocked')
+        self.assertEqual(classify_error_page('Just a moment…', ''), 'blocked')
+        self.assertEqual(classify_error_page('Attention Required! | Cloudflare', ''), 'blocked')
+
+    def test_page_markers(self):
+        challenge = '<html><body><div id="challenge-running"></div></body></html>'
+        self.assertEqual(classify_error_page('letterboxd.com', challenge), 'blocked')
+        missing = '<body class="error message-dark"><h1>Sorry, we can’t find the page you’ve requested.</h1>'
+        self.assertEqual(classify_error_page('Letterboxd • Social film discovery.', missing), 'not_found')
+
+    def test_check_error_page(self):
+        scraper = SingleMovieScraper(page_policy=LEAN_PAGE_POLICY)
+        with self.assertRaises(ScrapeBlocked):
+            scraper._check_error_page(mock.Mock(title='Just a moment...', page_source=''))
+        film = mock.Mock(title='Not Found (2016) • Letterboxd', page_source=fixture('film_lean.html'))
+        scraper._check_error_page(film)
@@ -0,0 +1,49 @@
+import threading
+
+from django.core.cache import caches
+from django.test import SimpleTestCase
+
+from ..services.single_flight import SingleFlight
+
+
+class SingleFlightTests(SimpleTestCase):
+    def setUp(self):
+        caches['default'].clear()
+        self.flight = SingleFlight(namespace='test', lock_timeout=5, poll_interval=0.01)
+        self.lock_key = 'test:lock:page'
+
+    def test_concurrent_calls_share_one_run(self):
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def scrape():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {'title': 'Alien'}
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(self.flight.do('page', scrape)))
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=lambda: results.append(self.flight.do('page', scrape)))
+        follower.start()
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'title': 'Alien'}, {'title': 'Alien'}])
+        self.assertIsNone(caches['default'].get(self.lock_key))
+
+    def test_expired_leader_keeps_the_next_leaders_lock(self):
+        cache = caches['default']
+
+        def slow_scrape():
+            # Our lock expired mid-scrape and another worker took it over
+            cache.set(self.lock_key, 'next-leader-token', 5)
+            return 'result'
+
+        self.assertEqual(self.flight.do('page', slow_scrape), 'result')
+        self.assertEqual(cache.get(self.lock_key), 'next-leader-token')
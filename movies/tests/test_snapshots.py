@@ -0,0 +1,70 @@
+import json
+import tempfile
+from pathlib import Path
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.base import ContentFile
+from django.core.files.storage import storages
+from django.test import TestCase, override_settings
+
+from ..models import Profile
+from ..repository import MovieRepository
+from ..snapshots import publish_snapshots
+
+
+class SnapshotUploadTests(TestCase):
+    """Publishes reach the snapshot storage, not just the local SNAPSHOT_ROOT"""
+
+    def setUp(self):
+        self.root = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.bucket = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.enterContext(self.storage_settings(allow_overwrite=True))
+        self.profile = Profile.objects.create(username='anna')
+        MovieRepository.save_movie(self.profile, 'Alien', '1979', '', 'https://letterboxd.com/film/alien/')
+
+    def storage_settings(self, **options):
+        return override_settings(SNAPSHOT_ROOT=self.root, STORAGES={
+            'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+            'snapshots': {
+                'BACKEND': 'django.core.files.storage.FileSystemStorage',
+                'OPTIONS': {'location': str(self.bucket), **options},
+            },
+        })
+
+    def uploaded_pointer(self):
+        return json.loads((self.bucket / 'anna' / 'latest.json').read_text())
+
+    def test_upload(self):
+        pointer = publish_snapshots(self.profile)
+        self.assertEqual(self.uploaded_pointer(), pointer)
+        self.assertTrue((self.bucket / '_headers').exists())
+        for filename in pointer['files'].values():
+            uploaded = json.loads((self.bucket / 'anna' / filename).read_text())
+            self.assertEqual(uploaded, json.loads((self.root / 'anna' / filename).read_text()))
+        # Precompressed copies too
+        self.assertEqual(
+            sorted(path.name for path in (self.bucket / 'anna' / 'v').iterdir()),
+            sorted(path.name for path in (self.root / 'anna' / 'v').glob('*.json*')),
+        )
+
+    def test_republish_replaces_pointer(self):
+        publish_snapshots(self.profile)
+        MovieRepository.save_movie(self.profile, 'Heat', '1995', '', 'https://letterboxd.com/film/heat/')
+        pointer = publish_snapshots(self.profile)
+        self.assertEqual(self.uploaded_pointer(), pointer)
+        all_file = self.bucket / 'anna' / pointer['files']['all']
+        self.assertEqual(json.loads(all_file.read_text())['count'], 2)
+
+    def test_newer_uploaded_pointer_is_kept(self):
+        newer = {'version': 10 ** 9, 'files': {}}
+        storages['snapshots'].save('anna/latest.json', ContentFile(json.dumps(newer)))
+        self.assertIsNone(publish_snapshots(self.profile))
+        self.assertEqual(self.uploaded_pointer(), newer)
+        # Nor does the local pointer move, so the next publish tries again
+        self.assertFalse((self.root / 'anna' / 'latest.json').exists())
+
+    def test_storage_without_overwrite(self):
+        publish_snapshots(self.profile)
+        MovieRepository.save_movie(self.profile, 'Heat', '1995', '', 'https://letterboxd.com/film/heat/')
+        with self.storage_settings(), self.assertRaises(ImproperlyConfigured):
+            publish_snapshots(self.profile)
@@ -15,8 +15,15 @@ urlpatterns = [
     path('movies/', views.get_all_movies, name='get_all_movies'),
     path('movies/favourites/', views.get_favourites, name='get_favourites'),
     path('movies/saved/', views.get_saved_movies, name='get_saved_movies'),
+    path('movies/stats/', views.get_movie_stats, name='get_movie_stats'),
+    path('movies/events/', views.movie_events, name='movie_events'),
     
     # Movie management endpoints
     path('movies/<int:movie_id>/status/', views.update_movie_status, name='update_movie_status'),
     path('movies/<int:movie_id>/delete/', views.delete_movie, name='delete_movie'),
+    path('movies/bulk/status/', views.bulk_update_movie_status, name='bulk_update_movie_status'),
+    path('movies/bulk/delete/', views.bulk_delete_movies, name='bulk_delete_movies'),
+    
+    # Diagnostics
+    path('profiling/', views.list_request_profiles, name='list_request_profiles'),
 ]
\ No newline at end of file
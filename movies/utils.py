@@ -1,7 +1,14 @@
 from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
 
 import jwt
 from django.conf import settings
+from django.core.cache import cache
+
+from .models import Profile
+
+# Seconds a username -> profile lookup for legacy tokens stays cached
+PROFILE_CACHE_TIMEOUT = 300
 
 
 def generate_token(username: str, secret_word: str) -> str:
@@ -9,7 +16,7 @@ def generate_token(username: str, secret_word: str) -> str:
     Generate a new JWT token
     
     Args:
-        username: Letterboxd username
+        username: Letterboxd username of a registered profile
         secret_word: Secret word for verification
         
     Returns:
@@ -20,26 +27,31 @@ def generate_token(username: str, secret_word: str) -> str:
     """
     # Get expected values from environment/settings
     expected_secret_word = getattr(settings, 'AUTH_SECRET_WORD', None)
-    expected_username = getattr(settings, 'LETTERBOXD_USERNAME', None)
+    default_username = getattr(settings, 'LETTERBOXD_USERNAME', None)
     jwt_secret = getattr(settings, 'JWT_SECRET', None)
     
     if not expected_secret_word:
         raise ValueError("AUTH_SECRET_WORD not configured")
-    if not expected_username:
-        raise ValueError("LETTERBOXD_USERNAME not configured")
     if not jwt_secret:
         raise ValueError("JWT_SECRET not configured")
     
     # Verify credentials
     if secret_word != expected_secret_word:
         raise ValueError("invalid secret word")
-    if username != expected_username:
-        raise ValueError("invalid username")
+    
+    # Tokens are scoped to a registered profile; the configured
+    # LETTERBOXD_USERNAME profile is created on first use
+    profile = Profile.objects.filter(username=username).first()
+    if profile is None:
+        if username != default_username:
+            raise ValueError("invalid username")
+        profile, _ = Profile.objects.get_or_create(username=username)
     
     # Create token payload
     payload = {
         'authorized': True,
         'username': username,
+        'profile_id': profile.id,
         'exp': datetime.utcnow() + timedelta(days=365)  # Expires in 1 year
     }
     
@@ -48,39 +60,77 @@ def generate_token(username: str, secret_word: str) -> str:
     return token
 
 
-def validate_token(token_string: str, username: str) -> bool:
+def decode_token(token_string: str) -> Optional[Dict[str, Any]]:
     """
-    Validate JWT token
+    Decode and verify a JWT token
     
     Args:
-        token_string: JWT token to validate
-        username: Expected username
+        token_string: JWT token to decode
         
     Returns:
-        bool: True if token is valid, False otherwise
+        Token claims if the token is valid and authorized, None otherwise
     """
     try:
         jwt_secret = getattr(settings, 'JWT_SECRET', None)
         if not jwt_secret:
-            return False
+            return None
         
         # Decode token
         payload = jwt.decode(token_string, jwt_secret, algorithms=['HS256'])
         
         # Check if token has required claims
-        if not payload.get('authorized'):
-            return False
-        
-        # Check username
-        token_username = payload.get('username')
-        if not token_username or token_username != username:
-            return False
+        if not payload.get('authorized') or not payload.get('username'):
+            return None
         
-        return True
+        return payload
         
     except jwt.ExpiredSignatureError:
-        return False
+        return None
     except jwt.InvalidTokenError:
-        return False
+        return None
     except Exception:
-        return False
\ No newline at end of file
+        return None
+
+
+def validate_token(token_string: str, username: str) -> bool:
+    """
+    Validate JWT token
+    
+    Args:
+        token_string: JWT token to validate
+        username: Expected username
+        
+    Returns:
+        bool: True if token is valid, False otherwise
+    """
+    payload = decode_token(token_string)
+    return payload is not None and payload.get('username') == username
+
+
+def get_token_profile(payload: Dict[str, Any]) -> Optional[Profile]:
+    """
+    Resolve the profile a decoded token is scoped to
+    
+    Tokens carrying a profile_id claim resolve without a query. Tokens
+    issued before profiles existed only carry the username, which is
+    looked up once and cached.
+    
+    Args:
+        payload: Claims returned by decode_token
+        
+    Returns:
+        Profile instance, or None if the username has no profile
+    """
+    username = payload['username']
+    profile_id = payload.get('profile_id')
+    
+    if profile_id is None:
+        cache_key = f'profile-id:{username}'
+        profile_id = cache.get(cache_key)
+        if profile_id is None:
+            profile_id = Profile.objects.filter(username=username).values_list('id', flat=True).first()
+            if profile_id is None:
+                return None
+            cache.set(cache_key, profile_id, PROFILE_CACHE_TIMEOUT)
+    
+    return Profile(id=profile_id, username=username)
@@ -1,37 +1,258 @@
 from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
 from django.utils import timezone
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET
 from rest_framework import status
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, renderer_classes
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
-from .repository import MovieRepository
-from .services import ImageOptimizer, LetterboxdScraper, SingleMovieScraper
+from .db_pool import pool_stats
+from .events import event_stream
+from .idempotency import idempotent
+from .list_cache import CachedList, cached_list
+from .models import Movie
+from .profiling import list_profiles
+from .read_snapshot import snapshot_enabled, snapshot_status
+from .renderers import LIST_RENDERER_CLASSES
+from .repository import METADATA_FIELDS, MOVIE_FIELDS, MovieListFilters, MovieRepository, SaveOutcome
+from .services import (
+    CircuitOpen,
+    LetterboxdScraper,
+    ScrapeBlocked,
+    ScrapeError,
+    ScrapeNotFound,
+    ScrapeParseError,
+    ScrapeRejected,
+    ScrapeTimeout,
+    ScrapeUnavailable,
+    SingleMovieScraper,
+)
+from .services.browser import get_browser_pool
+from .sync import sync_favourites
+from .warmup import warmup_status
+
+
+def _scrape_rejected_response(error: ScrapeRejected) -> Response:
+    """503 response telling the client when to retry a rejected scrape"""
+    reason = 'Scraper unavailable' if isinstance(error, CircuitOpen) else 'Scraper busy'
+    response = Response({
+        'error': f'{reason}: {error}',
+        'retry_after': error.retry_after
+    }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+    response['Retry-After'] = str(error.retry_after)
+    return response
+
+
+# HTTP status for each kind of scrape failure, most specific first
+SCRAPE_ERROR_STATUS = (
+    (ScrapeNotFound, status.HTTP_404_NOT_FOUND),
+    (ScrapeTimeout, status.HTTP_504_GATEWAY_TIMEOUT),
+    (ScrapeBlocked, status.HTTP_503_SERVICE_UNAVAILABLE),
+    (ScrapeUnavailable, status.HTTP_503_SERVICE_UNAVAILABLE),
+    (ScrapeParseError, status.HTTP_502_BAD_GATEWAY),
+)
+
+
+def _scrape_error_response(error: ScrapeError, message: str) -> Response:
+    """Response for a failed scrape, with a status matching the kind of failure"""
+    if isinstance(error, ScrapeRejected):
+        return _scrape_rejected_response(error)
+    
+    response_status = status.HTTP_500_INTERNAL_SERVER_ERROR
+    for error_class, error_status in SCRAPE_ERROR_STATUS:
+        if isinstance(error, error_class):
+            response_status = error_status
+            break
+    
+    return Response({
+        'error': f'{message}: {error}',
+        'error_type': type(error).__name__
+    }, status=response_status)
+
+
+LIST_FORMATS = ('rows', 'columnar')
+
+
+def _parse_list_options(request):
+    """
+    Read the fields= projection, format= shape and year/status/order filters
+    of a list request.
+    Returns (fields or None, format, filters or None, error message).
+    """
+    fields = None
+    fields_param = request.query_params.get('fields')
+    if fields_param is not None:
+        fields = [field.strip() for field in fields_param.split(',') if field.strip()]
+        if not fields:
+            return None, None, None, 'fields must name at least one field'
+        unknown = [field for field in fields if field not in MOVIE_FIELDS]
+        if unknown:
+            available = ", ".join(MOVIE_FIELDS)
+            return None, None, None, f'Unknown fields: {", ".join(unknown)}. Available: {available}'
+        fields = list(dict.fromkeys(fields))
+    
+    list_format = request.query_params.get('format', 'rows')
+    if list_format not in LIST_FORMATS:
+        return None, None, None, f'format must be one of: {", ".join(LIST_FORMATS)}'
+    
+    try:
+        filters = MovieListFilters.from_params(request.query_params)
+    except ValueError as e:
+        return None, None, None, str(e)
+    
+    return fields, list_format, filters, None
+
+
+def _movie_list_response(request, list_name, fetch, empty_data=None):
+    """
+    Response for one of the profile's movie lists
+    
+    Supports ?fields=id,title,... (only those columns are selected),
+    ?format=columnar (field names once, values as parallel arrays) and
+    ?year_min=, ?year_max=, ?decade=1970s, ?status= and ?order= (-created_at,
+    created_at, year, -year, title, -title), rendered as JSON or, with
+    Accept: application/msgpack, MessagePack.
+    
+    Served from the list cache, with precompressed bodies, until the profile's
+    movies change. Empty lists aren't cached, since the repository also returns
+    an empty list when the query fails. Pass empty_data to answer an empty list
+    with a different payload.
+    """
+    fields, list_format, filters, error = _parse_list_options(request)
+    if error:
+        return Response({'error': error}, status=status.HTTP_400_BAD_REQUEST)
+    
+    return _cached_movie_list(
+        request.profile, list_name, fetch, request.accepted_renderer, fields, list_format, empty_data, filters
+    ).response()
+
+
+def _cached_movie_list(profile, list_name, fetch, renderer, fields=None, list_format='rows',
+                       empty_data=None, filters=None) -> CachedList:
+    """Rendered payload of one of the profile's movie lists, from the list cache"""
+    def build():
+        movies_data = fetch(profile, fields=fields, filters=filters)
+        if not movies_data and empty_data is not None:
+            return renderer.render(empty_data), False
+        
+        data = {'count': len(movies_data), 'retrieved_at': timezone.now().isoformat()}
+        if list_format == 'columnar':
+            columns = fields or list(MOVIE_FIELDS)
+            data['fields'] = columns
+            data['columns'] = [[movie[field] for movie in movies_data] for field in columns]
+        else:
+            data['movies'] = movies_data
+        return renderer.render(data), bool(movies_data)
+    
+    variant = f'{list_name}:{",".join(fields or [])}:{list_format}:{renderer.format}'
+    if filters is not None:
+        variant += f':{filters.cache_key()}'
+    return cached_list(profile, variant, build, content_type=renderer.media_type)
+
+
+FAVOURITES_EMPTY_DATA = {
+    'movies': [],
+    'count': 0,
+    'message': 'No favorites found'
+}
+
+# List endpoints' cache names and repository reads, for warm_list_caches
+LIST_SOURCES = (
+    ('all', MovieRepository.get_all_movies, None),
+    ('favourites', MovieRepository.get_favourites, FAVOURITES_EMPTY_DATA),
+    ('saved', MovieRepository.get_saved_movies, None),
+)
+
+
+def warm_list_caches(profile) -> None:
+    """Fill the list cache with the profile's default (all fields, rows, JSON) list responses"""
+    renderer = JSONRenderer()
+    for list_name, fetch, empty_data in LIST_SOURCES:
+        _cached_movie_list(profile, list_name, fetch, renderer, empty_data=empty_data)
+
+
+# Fields a bulk request may filter on, besides an explicit id list
+BULK_FILTER_FIELDS = {'status'}
+BULK_MAX_IDS = 500
+
+
+def _parse_bulk_selection(data):
+    """
+    Read the movies a bulk request targets: an "ids" list, a "filter" object, or both.
+    Returns (movie_ids, filters, error message).
+    """
+    movie_ids = data.get('ids')
+    filters = data.get('filter')
+    
+    if movie_ids is None and not filters:
+        return None, None, 'ids or filter is required'
+    
+    if movie_ids is not None:
+        if not isinstance(movie_ids, list) or not all(
+            isinstance(movie_id, int) and not isinstance(movie_id, bool) for movie_id in movie_ids
+        ):
+            return None, None, 'ids must be a list of integers'
+        if len(movie_ids) > BULK_MAX_IDS:
+            return None, None, f'At most {BULK_MAX_IDS} ids per request'
+    
+    if filters is not None:
+        if not isinstance(filters, dict) or not filters:
+            return None, None, 'filter must be a non-empty object'
+        unknown = set(filters) - BULK_FILTER_FIELDS
+        if unknown:
+            return None, None, f'Unsupported filter fields: {", ".join(sorted(unknown))}'
+        if 'status' in filters and filters['status'] not in Movie.Status.values:
+            return None, None, 'Invalid status filter. Must be SAVED or FAVORITE'
+    
+    return movie_ids, filters, None
 
 
 @api_view(["GET"])
 def health_check(request):
-    """Simple health check endpoint"""
-    return Response({
+    """
+    Simple health check endpoint, with this worker's warm-up readiness,
+    connection pool utilization when pooling is on and the read snapshot's
+    age when it is enabled
+    """
+    response_data = {
         'status': 'healthy',
         'timestamp': timezone.now().isoformat(),
-        'database': 'postgresql'
+        'database': 'postgresql',
+        'warmup': warmup_status()
+    }
+    
+    db_pool = pool_stats()
+    if db_pool:
+        response_data['db_pool'] = db_pool
+    
+    if snapshot_enabled():
+        response_data['read_snapshot'] = snapshot_status()
+    
+    return Response(response_data)
+
+
+@api_view(["GET"])
+def list_request_profiles(request):
+    """
+    List the profile's stored request profiles, newest first
+    (render one with `manage.py profile_report <id>`)
+    """
+    profiles = list_profiles(username=request.profile.username)
+    return Response({
+        'enabled': getattr(settings, 'PROFILING_ENABLED', False),
+        'profiles': profiles,
+        'count': len(profiles)
     })
 
 
 @api_view(["GET"])
 def scrape_favourites(request):
-    """Scrape favorites from Letterboxd without saving to database"""
+    """Scrape the profile's favorites from Letterboxd without saving to database"""
     try:
-        username = getattr(settings, 'LETTERBOXD_USERNAME', None)
-        if not username:
-            return Response(
-                {'error': 'Letterboxd username not configured'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
-        
-        scraping_service = LetterboxdScraper()
-        movies = scraping_service.scrape_favourites(username)
+        scraping_service = LetterboxdScraper(browser_pool=get_browser_pool())
+        movies = scraping_service.scrape_favourites(request.profile.username)
         
         return Response({
             'movies': movies,
@@ -39,6 +260,8 @@ def scrape_favourites(request):
             'scraped_at': timezone.now().isoformat()
         })
         
+    except ScrapeError as e:
+        return _scrape_error_response(e, 'Failed to scrape favorites')
     except Exception as e:
         return Response(
             {'error': str(e)},
@@ -47,23 +270,13 @@ def scrape_favourites(request):
 
 
 @api_view(["GET"])
+@renderer_classes(LIST_RENDERER_CLASSES)
 def get_favourites(request):
     """Get saved favorites from PostgreSQL database"""
     try:
-        movies_data = MovieRepository.get_favourites()
-        
-        if not movies_data:
-            return Response({
-                'movies': [],
-                'count': 0,
-                'message': 'No favorites found'
-            })
-        
-        return Response({
-            'movies': movies_data,
-            'count': len(movies_data),
-            'retrieved_at': timezone.now().isoformat()
-        })
+        return _movie_list_response(
+            request, 'favourites', MovieRepository.get_favourites, empty_data=FAVOURITES_EMPTY_DATA
+        )
         
     except Exception as e:
         return Response({
@@ -73,10 +286,15 @@ def get_favourites(request):
 
 
 @api_view(["POST"])
+@idempotent
 def save_new_movie(request):
     """
     Save a movie to favourites by scraping from Letterboxd
     
+    A film already stored with complete data is found by its slug and
+    saved without scraping. Retries sending the same Idempotency-Key
+    replay the first response.
+    
     Expected POST body:
     {
         "movie_title": "bring-her-back",
@@ -84,14 +302,6 @@ def save_new_movie(request):
     }
     """
     try:
-        # Check if username is configured
-        username = getattr(settings, 'LETTERBOXD_USERNAME', None)
-        if not username:
-            return Response(
-                {'error': 'Letterboxd username not configured'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
-        
         # Validate request data
         movie_title = request.data.get('movie_title')
         movie_status = request.data.get('status')
@@ -102,17 +312,30 @@ def save_new_movie(request):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        if not isinstance(movie_title, str):
+            return Response(
+                {"error": "movie_title must be a string"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
         if not movie_status:
             movie_status = "SAVED"
         
-        scraper = SingleMovieScraper()
-        try:
-            movie_data = scraper.scrape_movie(movie_title)
-        except Exception as e:
-            return Response(
-                {"error": f"Failed to scrape movie: {str(e)}"}, 
-                status=status.HTTP_404_NOT_FOUND
-            )
+        slug = movie_title.strip().strip('/').lower()
+        stored_movie = MovieRepository.get_movie_by_slug(request.profile, slug)
+        scraped = stored_movie is None or not MovieRepository.has_complete_data(stored_movie)
+        
+        if scraped:
+            scraper = SingleMovieScraper(browser_pool=get_browser_pool())
+            try:
+                movie_data = scraper.scrape_movie(movie_title)
+            except ScrapeError as e:
+                return _scrape_error_response(e, 'Failed to scrape movie')
+        else:
+            movie_data = {
+                field: getattr(stored_movie, field)
+                for field in ('title', 'year', 'image_url', 'link_url', *METADATA_FIELDS)
+            }
         
         # Validate that we have the minimum required data
         if not movie_data.get('title') or not movie_data.get('year'):
@@ -122,12 +345,14 @@ def save_new_movie(request):
             )
         
         # Save using repository
-        movie = MovieRepository.save_movie(
+        movie, outcome = MovieRepository.save_movie(
+            profile=request.profile,
             title=movie_data['title'],
             year=movie_data['year'],
             image_url=movie_data['image_url'],
             link_url=movie_data['link_url'],
-            status=movie_status
+            status=movie_status,
+            metadata=movie_data
         )
         
         if not movie:
@@ -136,13 +361,7 @@ def save_new_movie(request):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
         
-        # Determine if this was a creation or update
-        # Since save_movie uses update_or_create, we can check if it was just created
-        # by comparing timestamps (within a few seconds)
-        import datetime
-
-        from django.utils import timezone
-        created = (timezone.now() - movie.created_at) < datetime.timedelta(seconds=5)
+        created = outcome == SaveOutcome.CREATED
         
         # Prepare response data
         response_data = {
@@ -152,9 +371,16 @@ def save_new_movie(request):
             'status': movie.status,
             'image_url': movie.image_url,
             'link_url': movie.link_url,
+            'slug': movie.slug,
+            'director': movie.director,
+            'genres': movie.genres,
+            'runtime': movie.runtime,
+            'rating': movie.rating,
             'created_at': movie.created_at,
             'updated_at': movie.updated_at,
             'created': created,  # True if new record, False if updated
+            'outcome': outcome.value,  # created, updated or unchanged
+            'scraped': scraped,  # False if the stored film was reused
         }
         
         return Response(
@@ -170,78 +396,63 @@ def save_new_movie(request):
 
 @api_view(["POST"])
 @csrf_exempt
+@idempotent
 def save_favourites(request):
-    """Scrape favorites and save them to PostgreSQL database with updated image URLs"""
+    """
+    Scrape favorites and save them to PostgreSQL database with updated image URLs
+    
+    Returns 200 with changed=false when the favourites match the last sync;
+    pass ?force=true to rewrite them anyway. Retries sending the same
+    Idempotency-Key replay the first response instead of scraping again.
+    """
     try:
-        username = getattr(settings, 'LETTERBOXD_USERNAME', None)
-        if not username:
-            return Response(
-                {'error': 'Letterboxd username not configured'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
-        
-        # Initialize services
-        image_service = ImageOptimizer(width=2000, height=3000)
-        scraping_service = LetterboxdScraper()
+        force = request.query_params.get('force', '').lower() in ('1', 'true')
         
-        # Scrape favorites
-        movies = scraping_service.scrape_favourites(username)
+        # Scrape favorites and save them unless unchanged since the last sync
+        result = sync_favourites(request.profile, force=force)
         
-        if not movies:
+        if result is None:
             return Response({
                 'error': 'No movies found during scraping'
             }, status=status.HTTP_404_NOT_FOUND)
         
-        # Update image URLs before saving
-        movies = image_service.update_movie_image_urls(movies)
-        
-        # Save to PostgreSQL database using repository
-        success = MovieRepository.save_favourites(movies)
+        if not result['changed']:
+            return Response({
+                'message': 'Favorites unchanged since last sync',
+                'changed': False,
+                'scraped_count': result['scraped_count'],
+                'last_synced_at': result['last_synced_at'].isoformat()
+            }, status=status.HTTP_200_OK)
         
-        if not success:
+        if not result['saved']:
             return Response({
                 'error': 'Failed to save favorites to database'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         
-        # Get updated count of favorites
-        saved_favorites = MovieRepository.get_favourites()
-        
         response_data = {
             'message': 'Successfully saved favorites to database',
-            'scraped_count': len(movies),
-            'total_favorites': len(saved_favorites),
+            'changed': True,
+            'scraped_count': result['scraped_count'],
+            'total_favorites': MovieRepository.count_movies(request.profile, Movie.Status.FAVORITE),
             'saved_at': timezone.now().isoformat()
         }
         
         return Response(response_data, status=status.HTTP_201_CREATED)
         
+    except ScrapeError as e:
+        return _scrape_error_response(e, 'Failed to scrape favorites')
     except Exception as e:
-        error_message = str(e)
-        if "failed to scrape" in error_message.lower():
-            return Response({
-                'error': f'Failed to scrape favorites: {error_message}'
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        elif "timeout" in error_message.lower():
-            return Response({
-                'error': f'Scraping timeout: {error_message}'
-            }, status=status.HTTP_408_REQUEST_TIMEOUT)
-        else:
-            return Response({
-                'error': f'Unexpected error: {error_message}'
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        return Response({
+            'error': f'Unexpected error: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 @api_view(["GET"])
+@renderer_classes(LIST_RENDERER_CLASSES)
 def get_all_movies(request):
     """Get all movies (both saved and favorites) from database"""
     try:
-        movies_data = MovieRepository.get_all_movies()
-        
-        return Response({
-            'movies': movies_data,
-            'count': len(movies_data),
-            'retrieved_at': timezone.now().isoformat()
-        })
+        return _movie_list_response(request, 'all', MovieRepository.get_all_movies)
         
     except Exception as e:
         return Response({
@@ -251,23 +462,60 @@ def get_all_movies(request):
 
 
 @api_view(["GET"])
+@renderer_classes(LIST_RENDERER_CLASSES)
 def get_saved_movies(request):
     """Get only movies with SAVED status from database"""
     try:
-        movies_data = MovieRepository.get_saved_movies()
+        return _movie_list_response(request, 'saved', MovieRepository.get_saved_movies)
         
+    except Exception as e:
         return Response({
-            'movies': movies_data,
-            'count': len(movies_data),
-            'retrieved_at': timezone.now().isoformat()
-        })
+            'error': 'Failed to get saved movies',
+            'details': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@api_view(["GET"])
+def get_movie_stats(request):
+    """Get the profile's movie counts per status, release year and decade"""
+    try:
+        stats = MovieRepository.get_stats(request.profile)
+        stats['retrieved_at'] = timezone.now().isoformat()
+        return Response(stats)
         
     except Exception as e:
         return Response({
-            'error': 'Failed to get saved movies',
+            'error': 'Failed to get movie stats',
             'details': str(e)
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+@require_GET
+async def movie_events(request):
+    """
+    Stream the profile's movie changes as server-sent events
+    
+    Each event is named created, updated or deleted, with the event id and
+    JSON data ({"movie_id": ..., changed values, "at": ...}). A reconnecting
+    client resumes after its Last-Event-ID header (or ?last_event_id=).
+    Async, so it needs the ASGI app: an open stream costs no worker thread
+    or database connection while idle.
+    """
+    last_event_id = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+    if last_event_id is not None:
+        if not last_event_id.isdigit():
+            return JsonResponse({'error': 'Last-Event-ID must be a non-negative integer'}, status=400)
+        last_event_id = int(last_event_id)
+    
+    response = StreamingHttpResponse(
+        event_stream(request.profile.id, last_event_id),
+        content_type='text/event-stream'
+    )
+    response['Cache-Control'] = 'no-cache'
+    # Stop nginx-style proxies from buffering the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
 @api_view(["PUT"])
 @csrf_exempt
 def update_movie_status(request, movie_id):
@@ -280,7 +528,7 @@ def update_movie_status(request, movie_id):
                 'error': 'Invalid status. Must be SAVED or FAVORITE'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        success = MovieRepository.update_movie_status(movie_id, new_status)
+        success = MovieRepository.update_movie_status(request.profile, movie_id, new_status)
         
         if not success:
             return Response({
@@ -305,7 +553,7 @@ def update_movie_status(request, movie_id):
 def delete_movie(request, movie_id):
     """Delete a movie from the database"""
     try:
-        success = MovieRepository.delete_movie(movie_id)
+        success = MovieRepository.delete_movie(request.profile, movie_id)
         
         if not success:
             return Response({
@@ -321,4 +569,87 @@ def delete_movie(request, movie_id):
     except Exception as e:
         return Response({
             'error': f'Failed to delete movie: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@api_view(["PUT"])
+@csrf_exempt
+def bulk_update_movie_status(request):
+    """
+    Update the status of many movies in one statement
+    
+    Expected PUT body:
+    {
+        "ids": [1, 2, 3],              # and/or
+        "filter": {"status": "SAVED"},
+        "status": "FAVORITE"
+    }
+    """
+    try:
+        new_status = request.data.get('status')
+        
+        if new_status not in ['SAVED', 'FAVORITE']:
+            return Response({
+                'error': 'Invalid status. Must be SAVED or FAVORITE'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        movie_ids, filters, error = _parse_bulk_selection(request.data)
+        if error:
+            return Response({'error': error}, status=status.HTTP_400_BAD_REQUEST)
+        
+        results = MovieRepository.bulk_update_status(
+            request.profile, new_status, movie_ids=movie_ids, filters=filters
+        )
+        
+        if results is None:
+            return Response({
+                'error': 'Failed to update movie statuses'
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        
+        return Response({
+            'results': results,
+            'updated_count': sum(1 for outcome in results.values() if outcome == 'updated'),
+            'new_status': new_status,
+            'updated_at': timezone.now().isoformat()
+        })
+        
+    except Exception as e:
+        return Response({
+            'error': f'Failed to update movie statuses: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@api_view(["POST"])
+@csrf_exempt
+def bulk_delete_movies(request):
+    """
+    Delete many movies in one statement
+    
+    Expected POST body:
+    {
+        "ids": [1, 2, 3],              # and/or
+        "filter": {"status": "SAVED"}
+    }
+    """
+    try:
+        movie_ids, filters, error = _parse_bulk_selection(request.data)
+        if error:
+            return Response({'error': error}, status=status.HTTP_400_BAD_REQUEST)
+        
+        results = MovieRepository.bulk_delete_movies(request.profile, movie_ids=movie_ids, filters=filters)
+        
+        if results is None:
+            return Response({
+                'error': 'Failed to delete movies'
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        
+        return Response({
+            'results': results,
+            'deleted_count': sum(1 for outcome in results.values() if outcome == 'deleted'),
+            'deleted_at': timezone.now().isoformat()
+        })
+        
+    except Exception as e:
+        return Response({
+            'error': f'Failed to delete movies: {str(e)}'
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
@@ -0,0 +1,165 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+
+@dataclass
+class StepResult:
+    """Outcome of one warm-up step"""
+
+    name: str
+    ok: bool
+    duration_ms: float
+    detail: str = ''
+
+
+@dataclass
+class WarmupState:
+    """This process's warm-up progress, reported by the health endpoint"""
+
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    steps: List[StepResult] = field(default_factory=list)
+
+    @property
+    def ready(self) -> bool:
+        return self.finished_at is not None
+
+
+_state = WarmupState()
+_state_lock = threading.Lock()
+
+
+def warm_database() -> str:
+    """Connect every database alias, filling the connection pool when pooling is on"""
+    for alias in connections:
+        connection = connections[alias]
+        connection.ensure_connection()
+        # Pooled connections go back to the pool, ready for request threads
+        connection.close()
+    return ', '.join(connections)
+
+
+def warm_urls() -> str:
+    """Load the URLconf and DRF's renderer and parser machinery"""
+    from django.urls import get_resolver
+    from rest_framework.renderers import JSONRenderer
+    from rest_framework.settings import api_settings
+
+    patterns = get_resolver().url_patterns
+    for component in (*api_settings.DEFAULT_RENDERER_CLASSES, *api_settings.DEFAULT_PARSER_CLASSES):
+        component()
+    JSONRenderer().render({'warm': [timezone.now()]})
+    return f'{len(patterns)} URL patterns'
+
+
+def warm_chromedriver() -> str:
+    """Resolve and pin the chromedriver path (a no-op when the master already did)"""
+    from .services.base_scraper import chromedriver_path
+
+    return chromedriver_path()
+
+
+def warm_browser() -> str:
+    """Pre-launch one Chrome per request scraper into this worker's browser pool"""
+    from .services import LetterboxdScraper, SingleMovieScraper
+    from .services.browser import get_browser_pool
+
+    pool = get_browser_pool()
+    if pool is None:
+        return 'skipped, SCRAPE_BROWSER_POOL_MAX_IDLE is 0'
+    launched = [
+        scraper_class.__name__ for scraper_class in (LetterboxdScraper, SingleMovieScraper)
+        if scraper_class(browser_pool=pool).prelaunch()
+    ]
+    return f'launched {", ".join(launched) or "nothing"}'
+
+
+def warm_list_caches() -> str:
+    """Render the default list responses of up to WARMUP_LIST_PROFILES profiles into the list cache"""
+    from .models import Profile
+    from .views import warm_list_caches as warm_profile_lists
+
+    limit = getattr(settings, 'WARMUP_LIST_PROFILES', 5)
+    profiles = list(Profile.objects.order_by('created_at')[:limit])
+    try:
+        for profile in profiles:
+            warm_profile_lists(profile)
+    finally:
+        connections.close_all()
+    return f'{len(profiles)} profiles'
+
+
+WARMUP_STEPS: Dict[str, Callable[[], Any]] = {
+    'database': warm_database,
+    'urls': warm_urls,
+    'chromedriver': warm_chromedriver,
+    'browser': warm_browser,
+    'list_cache': warm_list_caches,
+}
+
+
+def run_warmup(steps: Optional[Sequence[str]] = None) -> WarmupState:
+    """
+    Run warm-up steps in order, timing each; a failing step doesn't stop the rest
+
+    Args:
+        steps: Step names from WARMUP_STEPS (default: settings.WARMUP_STEPS)
+
+    Returns:
+        This process's warm-up state, ready once every step has run
+    """
+    names = steps if steps is not None else getattr(settings, 'WARMUP_STEPS', list(WARMUP_STEPS))
+    with _state_lock:
+        _state.started_at = timezone.now().isoformat()
+        _state.finished_at = None
+        _state.steps = []
+
+    for name in names:
+        start = time.perf_counter()
+        try:
+            detail = str(WARMUP_STEPS[name]() or '')
+            ok = True
+        except Exception as e:
+            detail = f'{type(e).__name__}: {e}'
+            ok = False
+        result = StepResult(name, ok, round((time.perf_counter() - start) * 1000, 1), detail)
+        with _state_lock:
+            _state.steps.append(result)
+        print(f"Warm-up {name}: {'ok' if ok else 'failed'} in {result.duration_ms}ms ({detail})")
+
+    with _state_lock:
+        _state.finished_at = timezone.now().isoformat()
+    return _state
+
+
+def start_warmup_thread() -> threading.Thread:
+    """Run the warm-up in the background, for servers without a gunicorn post_fork hook"""
+    thread = threading.Thread(target=run_warmup, name='warmup', daemon=True)
+    thread.start()
+    return thread
+
+
+def warmup_status() -> Dict[str, Any]:
+    """Readiness and per-step timings of this process's warm-up"""
+    with _state_lock:
+        if _state.started_at is None:
+            if not getattr(settings, 'WARMUP_ENABLED', True):
+                return {'ready': True, 'state': 'disabled'}
+            return {'ready': False, 'state': 'not started'}
+        return {
+            'ready': _state.ready,
+            'state': 'ready' if _state.ready else 'warming',
+            'started_at': _state.started_at,
+            'finished_at': _state.finished_at,
+            'total_ms': round(sum(step.duration_ms for step in _state.steps), 1),
+            'steps': [
+                {'name': step.name, 'ok': step.ok, 'ms': step.duration_ms, 'detail': step.detail}
+                for step in _state.steps
+            ],
+        }